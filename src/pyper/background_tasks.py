@@ -5,20 +5,148 @@ Contains thread classes for asynchronous operations
 
 import os
 import re
-import json
 import logging
-import urllib.request
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
-from PyQt6.QtGui import QPixmap, QFont, QPainter
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from PyQt6.QtCore import QThread, QObject, QRunnable, pyqtSignal, Qt, QTimer, QUrl, QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage, QImageReader, QFont, QPainter
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest, QNetworkReply
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import re2  # Optional linear-time regex engine (google-re2)
+except ImportError:
+    re2 = None
+
+try:
+    from .cache_utils import CACHE_DIR, DiskCache, TTLCache
+    from . import json_utils
+except ImportError:
+    from cache_utils import CACHE_DIR, DiskCache, TTLCache
+    import json_utils
 
 # Get logger
 logger = logging.getLogger('Pyper')
 
+# Number of albums requested per getAlbumList2 page during library refresh
+ALBUM_PAGE_SIZE = 500
+
+# Identifies us to MusicBrainz, which requires a descriptive User-Agent
+ART_USER_AGENT = 'Pyper/1.0 (Music Player; kevin@example.com)'
+
+
+def create_art_session():
+    """Create the shared session used for radio album art lookups"""
+    session = requests.Session()
+    session.headers.update({'User-Agent': ART_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                          max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Provider APIs answer in JSON, which compresses well with the session's Accept-Encoding
+JSON_HEADERS = {'Accept': 'application/json'}
+
+# The ICY stream is read from response.raw, which bypasses decompression, so it must arrive unencoded
+ICY_HEADERS = {'Icy-MetaData': '1', 'Accept-Encoding': 'identity'}
+
+# Keep-alive connections to MusicBrainz, Cover Art Archive and iTunes, reused across lookups
+ART_SESSION = create_art_session()
+
+# Album art providers run side by side; cover checks get their own pool so a provider never waits on itself
+ART_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='pyper-art')
+# Runs each track's lookup, which waits on ART_EXECUTOR searches, so it must not share that pool
+ART_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyper-art-lookup')
+COVER_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix='pyper-cover-check')
+
+# Radio album art lookups (track -> artwork URL), kept across restarts
+RADIO_ART_CACHE = DiskCache(os.path.join(CACHE_DIR, 'radio_art'), max_bytes=100 * 1024 * 1024,
+                            ttl=30 * 24 * 3600, negative_ttl=24 * 3600)
+
+# HTTP cache for downloaded radio artwork, honouring the servers' Cache-Control and ETag headers
+RADIO_ART_HTTP_CACHE_DIR = os.path.join(CACHE_DIR, 'http')
+RADIO_ART_HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Recent lookups that found nothing, checked before touching the disk cache
+ART_LOOKUP_MISSES = TTLCache(maxsize=512, ttl=3600)
+
+# Backoff between ICY stream reconnects, in ms
+ICY_RECONNECT_DELAY_MIN = 1000
+ICY_RECONNECT_DELAY_MAX = 60000
+
+# Matched against untrusted stream data, so prefer RE2's linear-time matching when it is installed
+STREAM_TITLE_RE = (re2 or re).compile(r"StreamTitle='([^']*)'")
+
+
+def read_exact(fp, n):
+    """Read exactly n bytes from fp, or fewer only if the stream ends"""
+    data = fp.read(n)
+    if len(data) == n or not data:
+        return data
+    buf = bytearray(data)
+    while len(buf) < n:
+        chunk = fp.read(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return bytes(buf)
+
+
+def readinto_exact(fp, view):
+    """Fill a memoryview from fp, returning the byte count (short only if the stream ends)"""
+    filled = 0
+    while filled < len(view):
+        n = fp.readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    return filled
+
+
+# iTunes artwork is resized server-side; twice the 200px display size leaves room for HiDPI
+ITUNES_ARTWORK_SIZE = '300x300'
+
+# Release groups per MusicBrainz query whose Cover Art Archive listing is fetched
+MAX_RELEASE_GROUPS = 3
+
+# Images this close to the target size are shown as-is rather than smooth-scaled again
+SCALE_TOLERANCE = 4
+
+
+def fit_image(image, size):
+    """Scale a QImage or QPixmap to fit size x size, skipping the pass when it already nearly fits"""
+    if abs(max(image.width(), image.height()) - size) < SCALE_TOLERANCE:
+        return image
+    return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+def decode_image(data, size):
+    """Decode image bytes into a QImage no larger than size x size (null on failure)"""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    return read_image(QImageReader(buffer), size)
+
+
+def read_image(reader, size):
+    """Read a QImageReader's image no larger than size x size, letting the decoder downscale (null on failure)"""
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid() and max(source_size.width(), source_size.height()) > size:
+        # JPEGs are decoded straight at a reduced IDCT scale instead of full size and then shrunk
+        reader.setScaledSize(source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
 
 class LibraryRefreshThread(QThread):
     """Thread for refreshing library data from Navidrome server"""
     progress = pyqtSignal(str)
+    partial = pyqtSignal(str, list)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
     
@@ -30,119 +158,392 @@ class LibraryRefreshThread(QThread):
         try:
             self.progress.emit("Connecting to Navidrome server...")
             
-            # Fetch all library data
+            # Fetch all library categories concurrently, streaming each to the UI as it arrives
             library_data = {}
+            fetchers = {
+                'artists': self.fetch_artists,
+                'albums': self.fetch_albums,
+                'playlists': self.fetch_playlists,
+                'radio stations': self.fetch_radio_stations,
+            }
             
-            self.progress.emit("Fetching artists...")
-            artists = self.sonic_client.getArtists()
-            library_data['artists'] = artists.get('subsonic-response', {}).get('artists', {}).get('index', [])
-            
-            self.progress.emit("Fetching albums...")
-            albums = self.sonic_client.getAlbumList2()
-            library_data['albums'] = albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-            
-            self.progress.emit("Fetching playlists...")
-            playlists = self.sonic_client.getPlaylists()
-            library_data['playlists'] = playlists.get('subsonic-response', {}).get('playlists', {}).get('playlist', [])
-            
-            self.progress.emit("Fetching radio stations...")
-            radio_stations = self.sonic_client.getInternetRadioStations()
-            if radio_stations:
-                library_data['radio_stations'] = radio_stations.get('subsonic-response', {}).get('internetRadioStations', {}).get('internetRadioStation', [])
-            else:
-                library_data['radio_stations'] = []
+            self.progress.emit("Fetching artists, albums, playlists and radio stations...")
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {executor.submit(fetch, library_data): name for name, fetch in fetchers.items()}
+                for future in as_completed(futures):
+                    future.result()  # Re-raise any fetch error
+                    self.progress.emit(f"Fetched {futures[future]}")
             
             self.progress.emit("Library refresh complete!")
             self.finished.emit(library_data)
             
         except Exception as e:
             self.error.emit(f"Error refreshing library: {str(e)}")
+    
+    def fetch_artists(self, library_data):
+        """Fetch the artist index"""
+        artists = self.sonic_client.getArtists()
+        artists_data = artists.get('subsonic-response', {}).get('artists', {})
+        library_data['artists'] = artists_data.get('index', [])
+        library_data['lastModified'] = artists_data.get('lastModified')
+        # Flatten the index groups once so the UI can iterate a single-level list
+        library_data['artists_flat'] = [artist for artist_group in library_data['artists'] for artist in artist_group.get('artist', [])]
+        self.partial.emit('artists', library_data['artists'])
+        self.partial.emit('artists_flat', library_data['artists_flat'])
+    
+    def fetch_albums(self, library_data):
+        """Fetch all albums page by page"""
+        library_data['albums'] = []
+        offset = 0
+        while True:
+            albums = self.sonic_client.getAlbumList2(size=ALBUM_PAGE_SIZE, offset=offset)
+            album_page = albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+            if album_page:
+                library_data['albums'].extend(album_page)
+                self.partial.emit('albums', album_page)
+            if len(album_page) < ALBUM_PAGE_SIZE:
+                break
+            offset += ALBUM_PAGE_SIZE
+            self.progress.emit(f"Fetching albums... ({len(library_data['albums'])} loaded)")
+        
+        # Years category rows, counted here once rather than on every click
+        library_data['decades'] = album_decades(library_data['albums'])
+    
+    def fetch_playlists(self, library_data):
+        """Fetch playlists"""
+        playlists = self.sonic_client.getPlaylists()
+        library_data['playlists'] = playlists.get('subsonic-response', {}).get('playlists', {}).get('playlist', [])
+        self.partial.emit('playlists', library_data['playlists'])
+    
+    def fetch_radio_stations(self, library_data):
+        """Fetch internet radio stations"""
+        radio_stations = self.sonic_client.getInternetRadioStations()
+        if radio_stations:
+            library_data['radio_stations'] = radio_stations.get('subsonic-response', {}).get('internetRadioStations', {}).get('internetRadioStation', [])
+        else:
+            library_data['radio_stations'] = []
+        self.partial.emit('radio_stations', library_data['radio_stations'])
+
+
+def album_decades(albums):
+    """Count albums per decade, newest decade first, as Years category rows"""
+    counts = Counter((album['year'] // 10) * 10 for album in albums if (album.get('year') or 0) > 0)
+    return [{'name': f"{decade}s", 'type': 'decade', 'start': decade, 'end': decade + 9, 'count': count}
+            for decade, count in sorted(counts.items(), reverse=True)]
+
+
+def load_api_play_data(sonic_client):
+    """Load most/recently played albums using the Navidrome API as fallback"""
+    most_played_albums = []
+    recently_played_albums = []
+    try:
+        # Try to get frequently played albums
+        frequent_response = sonic_client.getAlbumList2_byFrequent(50)
+        if frequent_response:
+            albums = frequent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+            for i, album in enumerate(albums):
+                album_data = album.copy()
+                album_data['playCount'] = 50 - i  # Estimate based on order
+                most_played_albums.append(album_data)
+
+        # Try to get recently played albums
+        recent_response = sonic_client.getAlbumList2_byRecent(50)
+        if recent_response:
+            albums = recent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+            for album in albums:
+                album_data = album.copy()
+                album_data['playCount'] = 1  # Default count
+                recently_played_albums.append(album_data)
+
+    except Exception as e:
+        logger.error(f"API fallback failed: {e}")
+
+    return most_played_albums, recently_played_albums
+
+
+def album_list_title(album, play_counts):
+    """Format an album row as 'Album - Artist (N plays)'"""
+    album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
+    # Add play count if available
+    if album['id'] in play_counts:
+        play_count = play_counts[album['id']]['play_count']
+        if play_count > 0:
+            album_title += f" ({play_count} plays)"
+    return album_title
+
+
+class PlayCountLoadThread(QThread):
+    """Thread for loading play count data from the Navidrome database or API"""
+    progress = pyqtSignal(str)
+    loaded = pyqtSignal(dict, list, list, list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_helper, sonic_client, albums=None):
+        super().__init__()
+        self.db_helper = db_helper
+        self.sonic_client = sonic_client
+        self.albums = albums or []
+
+    def run(self):
+        try:
+            # Try database first, re-copying it if it lives on a remote server
+            self.db_helper.refresh()
+            album_stats = self.db_helper.fetch_all_album_stats()
+            play_counts = album_stats['play_counts']
+            most_played_albums = album_stats['most_played']
+            recently_played_albums = album_stats['recently_played']
+
+            # If database approach failed, try API fallback
+            if not play_counts and not most_played_albums:
+                self.progress.emit("Database unavailable, trying API fallback...")
+                most_played_albums, recently_played_albums = load_api_play_data(self.sonic_client)
+
+            # Pre-format the Albums category rows here so the GUI thread only assigns text
+            album_titles = [album_list_title(album, play_counts) for album in self.albums]
+
+            self.loaded.emit(play_counts, most_played_albums, recently_played_albums, album_titles)
+
+        except Exception as e:
+            self.failed.emit(f"Error loading play count data: {str(e)}")
+
+
+class SubsonicFetchThread(QThread):
+    """Thread for running a single Subsonic API call off the GUI thread"""
+    finished_data = pyqtSignal(object, str)
+    error = pyqtSignal(str, str)
+
+    def __init__(self, sonic_client, method, *args, kind=None):
+        super().__init__()
+        self.sonic_client = sonic_client
+        # method is either the name of a sonic_client method or a callable taking args
+        self.method = method
+        self.args = args
+        self.kind = kind or (method if isinstance(method, str) else method.__name__)
+
+    def run(self):
+        try:
+            if isinstance(self.method, str):
+                fetch = getattr(self.sonic_client, self.method)
+            else:
+                fetch = self.method
+            self.finished_data.emit(fetch(*self.args), self.kind)
+        except Exception as e:
+            self.error.emit(str(e), self.kind)
 
 
-class ImageDownloadThread(QThread):
-    """Thread for downloading album/artist artwork"""
-    image_ready = pyqtSignal(QPixmap)
+class ArtistSongsThread(QThread):
+    """Thread for streaming an artist's songs to the queue album by album"""
+    album_songs = pyqtSignal(list)
+    error = pyqtSignal(str, str)
+
+    def __init__(self, get_artist, fetch_album_songs, artist_id, max_workers=8):
+        super().__init__()
+        self.get_artist = get_artist
+        self.fetch_album_songs = fetch_album_songs
+        self.artist_id = artist_id
+        self.max_workers = max_workers
+        self.kind = f"artist:{artist_id}"
+
+    def run(self):
+        try:
+            artist_albums = self.get_artist(self.artist_id)
+            albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
+            if not albums:
+                return
+
+            # Fetch the first album on its own so playback can start after a single round-trip
+            first_songs = self.fetch_album_songs(albums[0]['id'])
+            if first_songs:
+                self.album_songs.emit(first_songs)
+
+            # Fetch the rest concurrently, emitting in album order as results come in
+            album_ids = [album['id'] for album in albums[1:]]
+            if album_ids:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for songs in executor.map(self.fetch_album_songs, album_ids):
+                        if songs:
+                            self.album_songs.emit(songs)
+        except Exception as e:
+            self.error.emit(str(e), self.kind)
+
+
+class ImageDownloadSignals(QObject):
+    """Signals for ImageDownloadRunnable (QRunnable cannot emit signals itself)"""
+    image_ready = pyqtSignal(str, QImage)
+    finished = pyqtSignal(str)  # Emitted for every download, with or without an image
+
+
+class ImageDownloadRunnable(QRunnable):
+    """Runnable for downloading cover art on a shared QThreadPool"""
     
-    def __init__(self, sonic_client, cover_art_id):
+    def __init__(self, sonic_client, cover_art_id, size=200):
         super().__init__()
         self.sonic_client = sonic_client
         self.cover_art_id = cover_art_id
+        self.size = size
+        self.signals = ImageDownloadSignals()
         
     def run(self):
         try:
-            cover_art = self.sonic_client.getCoverArt(self.cover_art_id, size=200)
-            if cover_art:
-                pixmap = QPixmap()
-                pixmap.loadFromData(cover_art)
-                if not pixmap.isNull():
-                    self.image_ready.emit(pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            # Decode into a QImage; QPixmap may only be created on the GUI thread
+            cached_path = self.sonic_client.cached_cover_art_path(self.cover_art_id, self.size)
+            if cached_path:
+                # Qt reads the cached file itself, without copying it into a Python bytes object first
+                image = read_image(QImageReader(cached_path), self.size)
+            else:
+                cover_art = self.sonic_client.getCoverArt(self.cover_art_id, size=self.size)
+                if not cover_art:
+                    return
+                image = decode_image(cover_art, self.size)
+            if image.isNull():
+                return
+            
+            image = fit_image(image, self.size)  # Only scales up covers smaller than requested
+            self.signals.image_ready.emit(self.cover_art_id, image)
         except Exception as e:
             logger.error(f"Error downloading cover art: {e}")
+        finally:
+            self.signals.finished.emit(self.cover_art_id)
+
+
+class RadioArtworkLoader(QObject):
+    """Downloads radio album art on the GUI thread's event loop with QNetworkAccessManager"""
+    artwork_ready = pyqtSignal(QImage)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._nam = QNetworkAccessManager(self)
+        self._http_cache = QNetworkDiskCache(self)
+        self._http_cache.setCacheDirectory(RADIO_ART_HTTP_CACHE_DIR)
+        self._http_cache.setMaximumCacheSize(RADIO_ART_HTTP_CACHE_MAX_BYTES)
+        self._nam.setCache(self._http_cache)
+        self._reply = None  # Download in progress; superseded when the track changes
+    
+    def load(self, artwork_url):
+        """Start downloading artwork, served from the HTTP cache when still fresh"""
+        if self._reply is not None:
+            self._reply.abort()
+            self._reply = None
+        
+        logger.info(f"Downloading artwork from: {artwork_url}")
+        request = QNetworkRequest(QUrl(artwork_url))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, ART_USER_AGENT)
+        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute,
+                             QNetworkRequest.CacheLoadControl.PreferCache)
+        reply = self._nam.get(request)
+        reply.finished.connect(lambda: self.on_reply_finished(reply, artwork_url))
+        self._reply = reply
+    
+    def clear_cache(self):
+        """Drop all cached artwork responses"""
+        self._http_cache.clear()
+    
+    def on_reply_finished(self, reply, artwork_url):
+        """Decode a finished download"""
+        reply.deleteLater()
+        if reply is self._reply:
+            self._reply = None
+        
+        error = reply.error()
+        if error == QNetworkReply.NetworkError.OperationCanceledError:
+            return  # Replaced by a newer track's artwork
+        if error != QNetworkReply.NetworkError.NoError:
+            logger.warning(f"Failed to download artwork from {artwork_url}: {reply.errorString()}")
+            return
+        
+        content = bytes(reply.readAll())
+        from_cache = reply.attribute(QNetworkRequest.Attribute.SourceIsFromCacheAttribute)
+        logger.info(f"Got {len(content)} bytes of artwork{' from cache' if from_cache else ''}")
+        if not self.emit_artwork_data(content):
+            logger.warning("Failed to load pixmap from downloaded data")
+            logger.info(f"Content preview (first 100 bytes): {content[:100]}")
+    
+    def emit_artwork_data(self, content):
+        """Decode image bytes and emit them as artwork, returning True on success"""
+        image = decode_image(content, 200)
+        if image.isNull():
+            return False
+        logger.info(f"Successfully loaded artwork: {image.width()}x{image.height()}")
+        self.artwork_ready.emit(fit_image(image, 200))
+        return True
 
 
 class ICYMetadataParser(QThread):
     """Thread for parsing ICY metadata from radio streams"""
     metadata_updated = pyqtSignal(dict)
-    artwork_ready = pyqtSignal(QPixmap)
+    artwork_ready = pyqtSignal(QImage)  # Converted to a QPixmap by the receiver on the GUI thread
+    artwork_url_found = pyqtSignal(str)  # Downloaded by RadioArtworkLoader
+    
+    # Drawn once and shared by every parser; a QImage since this runs off the GUI thread
+    _default_artwork = None
+    _default_artwork_lock = threading.Lock()
     
     def __init__(self, stream_url):
         super().__init__()
         self.stream_url = stream_url
         self.running = False
         self.current_track = {}
+        self._response = None  # Open stream, closed by stop() to interrupt a blocking read
         
     def run(self):
         """Monitor ICY metadata from the stream"""
         self.running = True
+        RADIO_ART_CACHE.sweep()
         
+        retry_delay = ICY_RECONNECT_DELAY_MIN
         while self.running:
             try:
-                self.fetch_icy_metadata()
-                self.msleep(10000)  # Check every 10 seconds
+                if not self.stream_icy_metadata():
+                    logger.info("Stream does not provide ICY metadata")
+                    break
+                retry_delay = ICY_RECONNECT_DELAY_MIN  # Connection ended after working; reconnect promptly
             except Exception as e:
+                if not self.running:
+                    break
                 logger.error(f"ICY metadata error: {e}")
-                self.msleep(5000)  # Wait 5 seconds before retry
+            if self.running:
+                self.msleep(retry_delay)
+                retry_delay = min(retry_delay * 2, ICY_RECONNECT_DELAY_MAX)
     
     def stop(self):
         """Stop the metadata monitoring"""
         self.running = False
+        response = self._response
+        if response is not None:
+            response.close()
         
-    def fetch_icy_metadata(self):
-        """Fetch ICY metadata from the stream"""
-        try:
-            # Create request with ICY metadata headers
-            req = urllib.request.Request(self.stream_url)
-            req.add_header('Icy-MetaData', '1')
-            req.add_header('User-Agent', 'Pyper/1.0')
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                # Check if ICY metadata is supported
-                icy_metaint = response.headers.get('icy-metaint')
-                if not icy_metaint:
-                    return
-                    
-                metaint = int(icy_metaint)
-                
-                # Read stream data up to metadata block
-                stream_data = response.read(metaint)
-                
-                # Read metadata length
-                meta_length_byte = response.read(1)
-                if not meta_length_byte:
-                    return
-                    
-                meta_length = ord(meta_length_byte) * 16
-                
-                if meta_length > 0:
-                    # Read metadata
-                    metadata_bytes = response.read(meta_length)
-                    metadata_str = metadata_bytes.decode('utf-8', errors='ignore').strip('\x00')
+    def stream_icy_metadata(self):
+        """Read metadata blocks from one open stream connection until it ends; False if unsupported"""
+        with ART_SESSION.get(self.stream_url, headers=ICY_HEADERS, stream=True, timeout=10) as response:
+            # Check if ICY metadata is supported
+            icy_metaint = response.headers.get('icy-metaint')
+            if not icy_metaint:
+                return False
+            
+            metaint = int(icy_metaint)
+            self._response = response
+            try:
+                raw = response.raw
+                # Audio is only skipped, so every frame is read into the same buffer
+                frame = bytearray(metaint + 1)
+                frame_view = memoryview(frame)
+                while self.running:
+                    # Skip the audio up to the next metadata block, reading its length byte in the same call
+                    if readinto_exact(raw, frame_view) < len(frame):
+                        return True
                     
-                    # Parse metadata
-                    self.parse_metadata(metadata_str)
+                    meta_length = frame[-1] * 16
                     
-        except Exception as e:
-            logger.debug(f"ICY metadata fetch error: {e}")
+                    # Most blocks are empty; the station only sends a title when it changes
+                    if meta_length > 0:
+                        metadata_bytes = read_exact(raw, meta_length)
+                        metadata_str = metadata_bytes.decode('utf-8', errors='ignore').rstrip('\x00')  # Blocks are NUL-padded at the end
+                        
+                        # Parse metadata
+                        self.parse_metadata(metadata_str)
+                return True
+            finally:
+                self._response = None
     
     def parse_metadata(self, metadata_str):
         """Parse ICY metadata string"""
@@ -150,7 +551,7 @@ class ICYMetadataParser(QThread):
             return
             
         # Extract StreamTitle
-        title_match = re.search(r"StreamTitle='([^']*)'", metadata_str)
+        title_match = STREAM_TITLE_RE.search(metadata_str)
         if not title_match:
             return
             
@@ -180,50 +581,66 @@ class ICYMetadataParser(QThread):
             self.metadata_updated.emit(track_info)
             logger.info(f"ICY metadata: {artist} - {title}")
             
-            # Try to fetch album art
-            self.fetch_album_art(artist, title)
+            # Look up album art without holding up the stream reads
+            ART_LOOKUP_EXECUTOR.submit(self.lookup_album_art, artist, title)
+    
+    def lookup_album_art(self, artist, title):
+        """Find album art on ART_LOOKUP_EXECUTOR and emit it if the track is still playing"""
+        artwork_url = self.fetch_album_art(artist, title)
+        if not self.running or self.current_track.get('artist') != artist or self.current_track.get('title') != title:
+            return  # The station moved on while the providers were queried
+        if artwork_url:
+            self.artwork_url_found.emit(artwork_url)
+        else:
+            self.emit_default_radio_artwork()
     
     def fetch_album_art(self, artist, title):
-        """Fetch album art using multiple sources"""
+        """Fetch an album art URL using multiple sources, or None when none has it"""
         try:
             logger.info(f"=== Starting album art search for: {artist} - {title} ===")
             
-            # Try multiple sources in order of preference
+            # Tracks looked up before skip the providers; an empty entry means nothing was found
+            lookup_key = f"track:{artist.lower()}|{title.lower()}"
+            if ART_LOOKUP_MISSES.get(lookup_key):
+                return None
+            cached_url = RADIO_ART_CACHE.get(lookup_key)
+            if cached_url == b'':
+                ART_LOOKUP_MISSES.set(lookup_key, True)
+                logger.info(f"Cached miss for: {artist} - {title}, using default artwork")
+                return None
+            if cached_url:
+                return cached_url.decode('utf-8')
+            
+            # Query all sources at once and take the first one that finds artwork
             artwork_url = None
-            
-            # 1. Try MusicBrainz + Cover Art Archive
-            logger.info("Trying source 1: MusicBrainz + Cover Art Archive")
-            artwork_url = self.search_musicbrainz_art(artist, title)
-            
-            # 2. Try Last.fm as fallback
-            if not artwork_url:
-                logger.info("Trying source 2: Last.fm API")
-                artwork_url = self.search_lastfm_art(artist, title)
-            else:
-                logger.info("Skipping Last.fm - already found artwork from MusicBrainz")
-            
-            # 3. Try iTunes Search API as another fallback
-            if not artwork_url:
-                logger.info("Trying source 3: iTunes Search API")
-                artwork_url = self.search_itunes_art(artist, title)
-            else:
-                logger.info("Skipping iTunes - already found artwork")
+            pending = {
+                ART_EXECUTOR.submit(search, artist, title)
+                for search in (self.search_musicbrainz_art, self.search_itunes_art)
+            }
+            while pending and not artwork_url:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    artwork_url = artwork_url or future.result()
+            for future in pending:
+                future.cancel()  # Losers that already started finish in the background
             
             if artwork_url:
                 logger.info(f"SUCCESS: Found album art URL: {artwork_url}")
-                self.download_artwork(artwork_url)
+                RADIO_ART_CACHE.set(lookup_key, artwork_url.encode('utf-8'))
             else:
                 logger.info(f"FAILURE: No album art found for: {artist} - {title}")
+                RADIO_ART_CACHE.set(lookup_key, b'')  # Don't ask the providers again for a day
+                ART_LOOKUP_MISSES.set(lookup_key, True)
                 logger.info("All sources exhausted, using default artwork")
-                # Emit a default music icon instead of no artwork
-                self.emit_default_radio_artwork()
             
             logger.info(f"=== Album art search complete for: {artist} - {title} ===")
+            return artwork_url
                 
         except Exception as e:
             logger.error(f"Album art fetch error: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
+            return None
     
     def search_musicbrainz_art(self, artist, title):
         """Search for album artwork using MusicBrainz + Cover Art Archive"""
@@ -243,7 +660,7 @@ class ICYMetadataParser(QThread):
             
             for i, query in enumerate(search_queries):
                 try:
-                    logger.info(f"MusicBrainz query {i+1}/3: {query}")
+                    logger.debug("MusicBrainz query %d/3: %s", i + 1, query)
                     mb_url = "https://musicbrainz.org/ws/2/recording/"
                     params = {
                         'query': query,
@@ -251,56 +668,39 @@ class ICYMetadataParser(QThread):
                         'limit': 5
                     }
                     
-                    headers = {
-                        'User-Agent': 'Pyper/1.0 (Music Player; kevin@example.com)'
-                    }
-                    
-                    response = requests.get(mb_url, params=params, headers=headers, timeout=10)
-                    logger.info(f"MusicBrainz response status: {response.status_code}")
+                    response = ART_SESSION.get(mb_url, params=params, headers=JSON_HEADERS, timeout=10)
+                    logger.debug("MusicBrainz response status: %s, encoding: %s", response.status_code,
+                                 response.headers.get('Content-Encoding', 'none'))
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = json_utils.loads(response.content)
                         recordings = data.get('recordings', [])
-                        logger.info(f"Found {len(recordings)} recordings")
+                        logger.debug("Found %d recordings", len(recordings))
                         
                         if len(recordings) == 0:
-                            logger.info("No recordings found for query")
+                            logger.debug("No recordings found for query")
                             continue
                         
+                        # Releases of one album share a release group, so one listing covers them all
+                        release_group_ids = []
                         for j, recording in enumerate(recordings):
-                            logger.info(f"Checking recording {j+1}: {recording.get('title', 'Unknown')}")
-                            releases = recording.get('releases', [])
-                            logger.info(f"Recording has {len(releases)} releases")
-                            
-                            for k, release in enumerate(releases):
-                                release_id = release.get('id')
-                                release_title = release.get('title', 'Unknown')
-                                logger.info(f"Checking release {k+1}: {release_title} (ID: {release_id})")
-                                
-                                if release_id:
-                                    cover_url = f"https://coverartarchive.org/release/{release_id}/front-250"
-                                    logger.info(f"Checking cover art: {cover_url}")
-                                    
-                                    try:
-                                        cover_response = requests.head(cover_url, timeout=5, allow_redirects=True)
-                                        logger.info(f"Cover art response: {cover_response.status_code}")
-                                        if cover_response.status_code == 200:
-                                            logger.info(f"Found MusicBrainz cover art: {cover_url}")
-                                            return cover_url
-                                        elif cover_response.status_code == 307:
-                                            # Follow redirect manually
-                                            redirect_url = cover_response.headers.get('Location')
-                                            if redirect_url:
-                                                logger.info(f"Following redirect to: {redirect_url}")
-                                                redirect_response = requests.head(redirect_url, timeout=5)
-                                                if redirect_response.status_code == 200:
-                                                    logger.info(f"Found MusicBrainz cover art via redirect: {redirect_url}")
-                                                    return redirect_url
-                                        else:
-                                            logger.info(f"Cover art not available (HTTP {cover_response.status_code})")
-                                    except Exception as e:
-                                        logger.info(f"Cover art check failed: {e}")
-                                        continue
+                            logger.debug("Checking recording %d: %s", j + 1, recording.get('title', 'Unknown'))
+                            for release in recording.get('releases', []):
+                                release_group_id = release.get('release-group', {}).get('id')
+                                if release_group_id and release_group_id not in release_group_ids:
+                                    release_group_ids.append(release_group_id)
+                        del release_group_ids[MAX_RELEASE_GROUPS:]
+                        logger.debug("Checking %d release groups for cover art", len(release_group_ids))
+                        
+                        # Results come back in candidate order; closing the iterator cancels unstarted lookups
+                        results = COVER_CHECK_EXECUTOR.map(self.fetch_release_group_art, release_group_ids)
+                        try:
+                            for found_url in results:
+                                if found_url:
+                                    logger.info(f"Found MusicBrainz cover art: {found_url}")
+                                    return found_url
+                        finally:
+                            results.close()
                     else:
                         logger.info(f"MusicBrainz API error: HTTP {response.status_code}")
                         if response.status_code == 503:
@@ -321,19 +721,22 @@ class ICYMetadataParser(QThread):
             logger.info(f"MusicBrainz search error: {e}")
             return None
     
-    def search_lastfm_art(self, artist, title):
-        """Search for album artwork using Last.fm API (free, no key needed for some endpoints)"""
+    @staticmethod
+    def fetch_release_group_art(release_group_id):
+        """Return the front cover thumbnail URL for a release group from Cover Art Archive, or None"""
         try:
-            logger.info(f"Searching Last.fm for: {artist} - {title}")
-            
-            # Last.fm track.getInfo API (requires API key, so we'll skip this for now)
-            # Instead, try a different approach or skip Last.fm
-            logger.info("Last.fm requires API key - skipping for now")
-            return None
-            
+            response = ART_SESSION.get(f"https://coverartarchive.org/release-group/{release_group_id}",
+                                       headers=JSON_HEADERS, timeout=5)
+            if response.status_code != 200:
+                logger.debug("No cover art for release group %s (HTTP %s)", release_group_id, response.status_code)
+                return None
+            for image in json_utils.loads(response.content).get('images', []):
+                if image.get('front'):
+                    thumbnails = image.get('thumbnails', {})
+                    return thumbnails.get('250') or thumbnails.get('small') or image.get('image')
         except Exception as e:
-            logger.info(f"Last.fm search error: {e}")
-            return None
+            logger.info(f"Cover art lookup failed: {e}")
+        return None
     
     def search_itunes_art(self, artist, title):
         """Search for album artwork using iTunes Search API"""
@@ -344,7 +747,7 @@ class ICYMetadataParser(QThread):
             clean_title = title
             if '(' in title and ')' in title:
                 clean_title = title.split('(')[0].strip()
-                logger.info(f"Cleaned title: '{title}' -> '{clean_title}'")
+                logger.debug("Cleaned title: '%s' -> '%s'", title, clean_title)
             
             search_term = f"{artist} {clean_title}".replace(' ', '+')
             itunes_url = f"https://itunes.apple.com/search"
@@ -355,33 +758,29 @@ class ICYMetadataParser(QThread):
                 'limit': 10  # Increase limit for better chances
             }
             
-            headers = {
-                'User-Agent': 'Pyper/1.0 (Music Player)'
-            }
-            
-            logger.info(f"iTunes search term: {search_term}")
-            response = requests.get(itunes_url, params=params, headers=headers, timeout=10)
-            logger.info(f"iTunes response status: {response.status_code}")
+            logger.debug("iTunes search term: %s", search_term)
+            response = ART_SESSION.get(itunes_url, params=params, headers=JSON_HEADERS, timeout=10)
+            logger.debug("iTunes response status: %s", response.status_code)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_utils.loads(response.content)
                 results = data.get('results', [])
-                logger.info(f"iTunes found {len(results)} results")
+                logger.debug("iTunes found %d results", len(results))
                 
                 for i, result in enumerate(results):
                     track_name = result.get('trackName', 'Unknown')
                     artist_name = result.get('artistName', 'Unknown')
-                    logger.info(f"iTunes result {i+1}: {artist_name} - {track_name}")
+                    logger.debug("iTunes result %d: %s - %s", i + 1, artist_name, track_name)
                     
                     # Look for artwork URL
                     artwork_url = result.get('artworkUrl100', '')
                     if artwork_url:
-                        # Convert to higher resolution
-                        artwork_url = artwork_url.replace('100x100', '600x600')
+                        # Ask for a size close to what is displayed
+                        artwork_url = artwork_url.replace('100x100', ITUNES_ARTWORK_SIZE)
                         logger.info(f"Found iTunes album art: {artwork_url}")
                         return artwork_url
                     else:
-                        logger.info(f"No artwork URL for result {i+1}")
+                        logger.debug("No artwork URL for result %d", i + 1)
                 
                 logger.info("No iTunes artwork found in any results")
             else:
@@ -393,73 +792,33 @@ class ICYMetadataParser(QThread):
             logger.info(f"iTunes search error: {e}")
             return None
     
-    def download_artwork(self, artwork_url):
-        """Download and emit artwork"""
-        try:
-            logger.info(f"Downloading artwork from: {artwork_url}")
-            
-            headers = {
-                'User-Agent': 'Pyper/1.0 (Music Player)'
-            }
-            
-            response = requests.get(artwork_url, timeout=15, headers=headers)
-            logger.info(f"Artwork download response: {response.status_code}")
-            
-            if response.status_code == 200:
-                content = response.content
-                content_type = response.headers.get('content-type', 'unknown')
-                logger.info(f"Downloaded {len(content)} bytes, content-type: {content_type}")
+    @classmethod
+    def default_radio_artwork(cls):
+        """Get the shared artwork shown when no album art is found, drawing it on first use"""
+        with cls._default_artwork_lock:
+            if cls._default_artwork is None:
+                logger.info("Creating default radio artwork...")
                 
-                # Check if it's actually an image
-                if not content_type.startswith('image/'):
-                    logger.warning(f"Content type is not an image: {content_type}")
-                    # Try to load anyway, sometimes servers don't set proper content-type
+                # Create a simple default radio artwork
+                image = QImage(200, 200, QImage.Format.Format_ARGB32_Premultiplied)
+                image.fill(Qt.GlobalColor.darkGray)
                 
-                pixmap = QPixmap()
-                success = pixmap.loadFromData(content)
+                # Draw a musical note or radio icon
+                painter = QPainter(image)
+                painter.setPen(Qt.GlobalColor.white)
+                painter.setFont(QFont("Arial", 48))
                 
-                if success and not pixmap.isNull():
-                    logger.info(f"Successfully loaded artwork: {pixmap.width()}x{pixmap.height()}")
-                    scaled_pixmap = pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    self.artwork_ready.emit(scaled_pixmap)
-                    logger.info("Emitted artwork successfully")
-                else:
-                    logger.warning("Failed to load pixmap from downloaded data")
-                    logger.info(f"Content preview (first 100 bytes): {content[:100]}")
-            else:
-                logger.warning(f"Failed to download artwork: HTTP {response.status_code}")
-                if response.status_code == 404:
-                    logger.info("Artwork URL returned 404 - not found")
-                elif response.status_code == 403:
-                    logger.info("Artwork URL returned 403 - forbidden")
-                    
-        except Exception as e:
-            logger.error(f"Artwork download error: {e}")
-            import traceback
-            logger.error(f"Download traceback: {traceback.format_exc()}")
+                # Use a simple text character instead of emoji which might not render
+                painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
+                painter.end()
+                
+                cls._default_artwork = image
+            return cls._default_artwork
     
     def emit_default_radio_artwork(self):
-        """Create and emit a default radio artwork when no album art is found"""
+        """Emit the default radio artwork when no album art is found"""
         try:
-            logger.info("Creating default radio artwork...")
-            
-            # Create a simple default radio artwork
-            pixmap = QPixmap(200, 200)
-            pixmap.fill(Qt.GlobalColor.darkGray)
-            
-            # Draw a musical note or radio icon
-            painter = QPainter(pixmap)
-            painter.setPen(Qt.GlobalColor.white)
-            painter.setFont(QFont("Arial", 48))
-            
-            # Use a simple text character instead of emoji which might not render
-            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
-            painter.end()
-            
-            logger.info(f"Created default artwork: {pixmap.width()}x{pixmap.height()}")
-            self.artwork_ready.emit(pixmap)
-            logger.info("Emitted default radio artwork")
-            
+            self.artwork_ready.emit(self.default_radio_artwork())
         except Exception as e:
             logger.error(f"Error creating default artwork: {e}")
             import traceback
@@ -0,0 +1,175 @@
+"""
+Cache Utilities Module for Pyper Music Player
+Shared in-memory and on-disk caching helpers
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+try:
+    from . import json_utils
+except ImportError:
+    import json_utils
+
+# Get logger
+logger = logging.getLogger('Pyper')
+
+# Base directory for persistent caches (follows the XDG base directory spec)
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'pyper')
+
+
+def load_json_cache(name):
+    """Load a JSON cache file from the cache directory, or None if unavailable"""
+    try:
+        with open(os.path.join(CACHE_DIR, name), 'rb') as f:
+            return json_utils.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read cache file {name}: {e}")
+        return None
+
+
+def save_json_cache(name, data):
+    """Write a JSON cache file to the cache directory"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, name), 'w') as f:
+            json.dump(data, f)
+    except Exception as e:
+        logger.warning(f"Failed to write cache file {name}: {e}")
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize=512, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Get a cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskCache:
+    """Size-bounded directory of byte blobs keyed by string; an empty blob records a known miss"""
+    
+    def __init__(self, directory, max_bytes, ttl=None, negative_ttl=None, sweep_interval=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Without a ttl entries never expire and hits refresh their mtime, so sweeps evict the least recently used
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.sweep_interval = sweep_interval  # Minimum seconds between sweeps, tracked by a stamp file
+    
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.bin')
+    
+    def cached_path(self, key):
+        """Path of a live entry's file, for readers that stream it themselves, or None"""
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if self.ttl is None:
+                os.utime(path)  # Mark as recently used for eviction
+            elif time.time() - stat.st_mtime > (self.ttl if stat.st_size else self.negative_ttl):
+                return None
+        except OSError:
+            return None
+        return path
+    
+    def get(self, key):
+        """Get cached bytes (b'' for a cached miss), or None if missing or expired"""
+        path = self.cached_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def set(self, key, data):
+        """Store bytes for a key; pass b'' to remember that there is nothing to find"""
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write disk cache entry in {self.directory}: {e}")
+    
+    def sweep(self):
+        """Evict the oldest entries until the directory fits in max_bytes, at most once per sweep interval"""
+        stamp_path = os.path.join(self.directory, '.last_sweep')
+        if self.sweep_interval is not None:
+            try:
+                if time.time() - os.path.getmtime(stamp_path) < self.sweep_interval:
+                    return
+            except OSError:
+                pass  # Never swept
+        
+        try:
+            with os.scandir(self.directory) as entries:
+                files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                         for entry in entries if entry.name.endswith('.bin')]
+            total_size = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total_size <= self.max_bytes:
+                    break
+                os.remove(path)
+                total_size -= size
+            if self.sweep_interval is not None:
+                with open(stamp_path, 'w'):
+                    pass
+                os.utime(stamp_path)
+        except FileNotFoundError:
+            pass  # Nothing cached yet
+        except OSError as e:
+            logger.warning(f"Failed to sweep disk cache {self.directory}: {e}")
+    
+    def clear(self):
+        """Remove every cached entry"""
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.bin'):
+                        os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to clear disk cache {self.directory}: {e}")
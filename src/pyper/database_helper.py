@@ -8,11 +8,102 @@ import sqlite3
 import subprocess
 import tempfile
 import shutil
+import shlex
 import logging
+import threading
+from functools import lru_cache
+from urllib.request import pathname2url
 
 # Get logger
 logger = logging.getLogger('Pyper')
 
+# Applied once per connection; these only affect our own connection, never the database file
+DB_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Persistent settings, only applied to our private copy of a remote database
+COPY_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+"""
+
+# Indexes the most/recently played queries walk in order; only created on our private copy of a remote database
+ALBUM_STATS_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_ann_album_pc ON annotation(item_type, play_count DESC, play_date DESC);
+    CREATE INDEX IF NOT EXISTS idx_ann_album_pd ON annotation(item_type, play_date DESC) WHERE item_type = 'album';
+"""
+
+# Album columns aliased to the keys the UI uses
+ALBUM_STATS_COLUMNS = """
+        a.id AS id,
+        a.name AS name,
+        a.album_artist AS artist,
+        a.id AS coverArt,
+        a.max_year AS year,
+        a.song_count AS songCount,
+        COALESCE(an.play_count, 0) AS playCount,
+        an.play_date AS lastPlayed
+"""
+
+# Every album with its annotation, for the play count badges
+ALBUM_STATS_QUERY = f"""
+    SELECT {ALBUM_STATS_COLUMNS}
+    FROM album a
+    LEFT JOIN annotation an ON a.id = an.item_id AND an.item_type = 'album'
+"""
+
+# Top albums by plays and by last play; NULL dates sort last
+MOST_PLAYED_QUERY = f"""
+    SELECT {ALBUM_STATS_COLUMNS}
+    FROM annotation an
+    JOIN album a ON a.id = an.item_id
+    WHERE an.item_type = 'album' AND an.play_count > 0
+    ORDER BY an.play_count DESC, an.play_date DESC
+    LIMIT ?
+"""
+RECENTLY_PLAYED_QUERY = f"""
+    SELECT {ALBUM_STATS_COLUMNS}
+    FROM annotation an
+    JOIN album a ON a.id = an.item_id
+    WHERE an.item_type = 'album' AND an.play_date IS NOT NULL
+    ORDER BY an.play_date DESC
+    LIMIT ?
+"""
+
+
+def album_play_counts(rows):
+    """Map album ids to their play stats from ALBUM_STATS_QUERY rows"""
+    return {
+        row['id']: {
+            'name': row['name'],
+            'artist': row['artist'],
+            'play_count': row['playCount'],
+            'last_played': row['lastPlayed']
+        }
+        for row in rows
+    }
+
+
+def navidrome_db_candidates():
+    """Yield common Navidrome database locations, most likely first"""
+    yield "/var/lib/navidrome/navidrome.db"
+    yield "/opt/navidrome/navidrome.db"
+    yield "/home/navidrome/navidrome.db"
+    xdg_data_home = os.environ.get('XDG_DATA_HOME') or os.path.expanduser("~/.local/share")
+    yield os.path.join(xdg_data_home, "navidrome", "navidrome.db")
+    yield os.path.expanduser("~/Library/Application Support/navidrome/navidrome.db")
+    yield os.path.expanduser("~/navidrome/navidrome.db")
+    yield "./navidrome.db"
+
+
+@lru_cache(maxsize=1)
+def find_navidrome_db():
+    """Return the first existing Navidrome database file, or None"""
+    return next((path for path in navidrome_db_candidates() if os.path.isfile(path)), None)
+
 
 class NavidromeDBHelper:
     """Helper class to access Navidrome's SQLite database for play counts and stats"""
@@ -21,29 +112,27 @@ class NavidromeDBHelper:
         self.db_path = db_path
         self.ssh_config = ssh_config
         self.temp_db_path = None
-        
-        if not db_path:
-            # Try common Navidrome database locations
-            self.db_path = self.find_navidrome_db()
+        self._conn = None
+        self._remote_mtime = None  # Remote database mtime at the time of the last copy
+        self._lock = threading.RLock()  # Serializes use of the shared connection across threads
+        # Without a configured path, common locations are searched on first connection (off the GUI thread)
     
     def find_navidrome_db(self):
-        """Try to find the Navidrome database file"""
-        common_paths = [
-            "/var/lib/navidrome/navidrome.db",
-            "/opt/navidrome/navidrome.db", 
-            "/home/navidrome/navidrome.db",
-            "~/navidrome/navidrome.db",
-            "./navidrome.db"
-        ]
-        
-        for path in common_paths:
-            expanded_path = os.path.expanduser(path)
-            if os.path.exists(expanded_path):
-                return expanded_path
-        return None
+        """Try to find the Navidrome database file (searched once per process)"""
+        return find_navidrome_db()
     
     def get_connection(self):
-        """Get database connection if available"""
+        """Get the shared database connection, opening it on first use"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self.open_connection()
+            return self._conn
+    
+    def open_connection(self):
+        """Open a new database connection if available"""
+        if not self.db_path:
+            # Try common Navidrome database locations
+            self.db_path = self.find_navidrome_db()
         db_to_use = self.db_path
         
         # If SSH config is provided, copy database from remote server
@@ -54,11 +143,44 @@ class NavidromeDBHelper:
         
         if not db_to_use or not os.path.exists(db_to_use):
             return None
+        is_copy = db_to_use == self.temp_db_path
         try:
-            return sqlite3.connect(db_to_use, timeout=5.0)
+            if is_copy:
+                conn = sqlite3.connect(db_to_use, timeout=5.0, check_same_thread=False)
+            else:
+                # The server's live database is opened read-only so we never change or lock it for writing
+                db_uri = f"file:{pathname2url(os.path.abspath(db_to_use))}?mode=ro"
+                conn = sqlite3.connect(db_uri, uri=True, timeout=5.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
         except Exception as e:
             logger.error(f"Database connection error: {e}")
             return None
+        
+        try:
+            conn.executescript(DB_PRAGMAS)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not apply database pragmas: {e}")
+        
+        # The copy is ours alone, so changing its journal mode and adding indexes to it is safe
+        if is_copy:
+            try:
+                conn.executescript(COPY_PRAGMAS)
+                conn.executescript(ALBUM_STATS_INDEXES)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not prepare database copy: {e}")
+        return conn
+    
+    def close_connection(self):
+        """Close the shared database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def refresh(self):
+        """Drop a remote database copy so the next query fetches a fresh one"""
+        if self.ssh_config and self.ssh_config.get('ssh_host'):
+            self.close_connection()
     
     def get_remote_database(self):
         """Copy database from remote server via SSH"""
@@ -73,24 +195,19 @@ class NavidromeDBHelper:
             
             ssh_host = self.ssh_config.get('ssh_host')
             ssh_user = self.ssh_config.get('ssh_user', 'root')
-            ssh_key = self.ssh_config.get('ssh_key_path')
             remote_path = self.db_path
+            remote_login = f"{ssh_user}@{ssh_host}"
             
-            # Build SCP command
-            scp_cmd = ['scp']
-            if ssh_key:
-                expanded_key = os.path.expanduser(ssh_key)
-                if os.path.exists(expanded_key):
-                    scp_cmd.extend(['-i', expanded_key])
-            
-            # Add SSH options for non-interactive use
-            scp_cmd.extend([
-                '-o', 'StrictHostKeyChecking=no',
-                '-o', 'ConnectTimeout=10',
-                '-o', 'BatchMode=yes'
-            ])
+            # Skip the copy when the remote database hasn't changed since the last one
+            remote_mtime = self.get_remote_mtime(remote_login, remote_path)
+            if (remote_mtime is not None and remote_mtime == self._remote_mtime
+                    and os.path.exists(self.temp_db_path)):
+                logger.info("Remote database unchanged, reusing local copy")
+                return self.temp_db_path
             
-            remote_source = f"{ssh_user}@{ssh_host}:{remote_path}"
+            # Build SCP command
+            scp_cmd = ['scp'] + self.get_ssh_options()
+            remote_source = f"{remote_login}:{remote_path}"
             scp_cmd.extend([remote_source, self.temp_db_path])
             
             logger.info(f"Copying database from {remote_source}...")
@@ -100,6 +217,7 @@ class NavidromeDBHelper:
             
             if result.returncode == 0:
                 logger.info(f"Database copied successfully to {self.temp_db_path}")
+                self._remote_mtime = remote_mtime
                 return self.temp_db_path
             else:
                 logger.error(f"SCP failed: {result.stderr}")
@@ -112,8 +230,41 @@ class NavidromeDBHelper:
             logger.error(f"Error copying remote database: {e}")
             return None
     
+    def get_ssh_options(self):
+        """Build the ssh/scp options shared by all remote commands"""
+        options = []
+        ssh_key = self.ssh_config.get('ssh_key_path')
+        if ssh_key:
+            expanded_key = os.path.expanduser(ssh_key)
+            if os.path.exists(expanded_key):
+                options.extend(['-i', expanded_key])
+        
+        # Non-interactive use; a shared master connection saves the handshake on the stat + copy pair
+        options.extend([
+            '-o', 'StrictHostKeyChecking=no',
+            '-o', 'ConnectTimeout=10',
+            '-o', 'BatchMode=yes',
+            '-o', 'ControlMaster=auto',
+            '-o', 'ControlPath=~/.ssh/pyper-%C',
+            '-o', 'ControlPersist=60'
+        ])
+        return options
+    
+    def get_remote_mtime(self, remote_login, remote_path):
+        """Get the remote database's modification time, or None if it can't be read"""
+        ssh_cmd = ['ssh'] + self.get_ssh_options() + [remote_login, f"stat -c %Y {shlex.quote(remote_path)}"]
+        try:
+            result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=15)
+            if result.returncode == 0:
+                return int(result.stdout.strip())
+            logger.warning(f"Could not stat remote database: {result.stderr.strip()}")
+        except (subprocess.TimeoutExpired, ValueError) as e:
+            logger.warning(f"Could not stat remote database: {e}")
+        return None
+    
     def cleanup(self):
         """Clean up temporary files"""
+        self.close_connection()
         if self.temp_db_path and os.path.exists(self.temp_db_path):
             try:
                 temp_dir = os.path.dirname(self.temp_db_path)
@@ -122,131 +273,54 @@ class NavidromeDBHelper:
             except Exception as e:
                 logger.error(f"Error cleaning up temp files: {e}")
     
-    def get_album_play_counts(self):
-        """Get play counts for albums"""
+    def fetch_rows(self, query, params=()):
+        """Run a query on the shared connection and return all its rows, or None on error"""
         conn = self.get_connection()
         if not conn:
-            return {}
+            return None
         
         try:
-            cursor = conn.cursor()
-            # Get play counts by album from annotation table
-            cursor.execute("""
-                SELECT 
-                    a.id,
-                    a.name,
-                    a.album_artist,
-                    COALESCE(an.play_count, 0) as play_count,
-                    an.play_date as last_played
-                FROM album a
-                LEFT JOIN annotation an ON a.id = an.item_id AND an.item_type = 'album'
-                WHERE an.play_count > 0 OR an.play_count IS NULL
-                ORDER BY play_count DESC
-            """)
-            
-            results = {}
-            for row in cursor.fetchall():
-                album_id, name, artist, play_count, last_played = row
-                if play_count is None:
-                    play_count = 0
-                results[album_id] = {
-                    'name': name,
-                    'artist': artist,
-                    'play_count': play_count,
-                    'last_played': last_played
-                }
-            
-            conn.close()
-            return results
+            with self._lock:
+                cursor = conn.cursor()
+                cursor.arraysize = 1000
+                cursor.execute(query, params)
+                rows = []
+                while True:
+                    batch = cursor.fetchmany()
+                    if not batch:
+                        break
+                    rows.extend(batch)
+                return rows
         except Exception as e:
-            print(f"Database query error: {e}")
-            conn.close()
-            return {}
+            logger.error(f"Database query error: {e}")
+            return None
+    
+    def fetch_all_album_stats(self, limit=50):
+        """Get album play counts plus most and recently played albums in one pass over the shared connection"""
+        stats = {'play_counts': {}, 'most_played': [], 'recently_played': []}
+        with self._lock:
+            rows = self.fetch_rows(ALBUM_STATS_QUERY)
+            # Sorted and limited by SQLite, walking the play count and play date indexes
+            most_played = self.fetch_rows(MOST_PLAYED_QUERY, (limit,))
+            recently_played = self.fetch_rows(RECENTLY_PLAYED_QUERY, (limit,))
+        if rows is None or most_played is None or recently_played is None:
+            return stats
+        
+        stats['play_counts'] = album_play_counts(rows)
+        
+        # Columns are already named after the album dict keys
+        stats['most_played'] = [dict(row) for row in most_played]
+        stats['recently_played'] = [dict(row) for row in recently_played]
+        return stats
+    
+    def get_album_play_counts(self):
+        """Get play counts for albums"""
+        return album_play_counts(self.fetch_rows(ALBUM_STATS_QUERY) or [])
     
     def get_most_played_albums(self, limit=50):
         """Get most played albums"""
-        conn = self.get_connection()
-        if not conn:
-            return []
-        
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    a.id,
-                    a.name,
-                    a.album_artist,
-                    a.id as cover_art_id,
-                    a.max_year,
-                    an.play_count
-                FROM album a
-                JOIN annotation an ON a.id = an.item_id AND an.item_type = 'album'
-                WHERE an.play_count > 0
-                ORDER BY an.play_count DESC, an.play_date DESC
-                LIMIT ?
-            """, (limit,))
-            
-            results = []
-            for row in cursor.fetchall():
-                album_id, name, artist, cover_art_id, year, play_count = row
-                results.append({
-                    'id': album_id,
-                    'name': name,
-                    'artist': artist,
-                    'coverArt': cover_art_id,
-                    'year': year,
-                    'playCount': play_count,
-                    'songCount': 0  # Will be filled when needed
-                })
-            
-            conn.close()
-            return results
-        except Exception as e:
-            print(f"Database query error: {e}")
-            conn.close()
-            return []
+        return [dict(row) for row in self.fetch_rows(MOST_PLAYED_QUERY, (limit,)) or []]
     
     def get_recently_played_albums(self, limit=50):
         """Get recently played albums"""
-        conn = self.get_connection()
-        if not conn:
-            return []
-        
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    a.id,
-                    a.name,
-                    a.album_artist,
-                    a.id as cover_art_id,
-                    a.max_year,
-                    an.play_date as last_played,
-                    an.play_count
-                FROM album a
-                JOIN annotation an ON a.id = an.item_id AND an.item_type = 'album'
-                WHERE an.play_date IS NOT NULL
-                ORDER BY an.play_date DESC
-                LIMIT ?
-            """, (limit,))
-            
-            results = []
-            for row in cursor.fetchall():
-                album_id, name, artist, cover_art_id, year, last_played, play_count = row
-                results.append({
-                    'id': album_id,
-                    'name': name,
-                    'artist': artist,
-                    'coverArt': cover_art_id,
-                    'year': year,
-                    'lastPlayed': last_played,
-                    'playCount': play_count,
-                    'songCount': 0  # Will be filled when needed
-                })
-            
-            conn.close()
-            return results
-        except Exception as e:
-            print(f"Database query error: {e}")
-            conn.close()
-            return [] 
\ No newline at end of file
+        return [dict(row) for row in self.fetch_rows(RECENTLY_PLAYED_QUERY, (limit,)) or []]
@@ -0,0 +1,26 @@
+"""
+JSON Utilities Module for Pyper Music Player
+Fast JSON parsing with orjson when it is installed, falling back to the standard library
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(f):
+    """Parse JSON from an open file (binary mode avoids a decode step with orjson)"""
+    return loads(f.read())
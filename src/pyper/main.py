@@ -6,8 +6,6 @@ Main application module
 
 import sys
 import os
-import json
-import hashlib
 import random
 import string
 import sqlite3
@@ -15,20 +13,28 @@ import subprocess
 import tempfile
 import shutil
 import logging
+import logging.handlers
+import queue
+import atexit
+import time
 import urllib.request
 import urllib.parse
 import re
+import difflib
+from datetime import datetime
+from functools import partial
 from typing import Optional, Dict, Any
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QSplitter,
+    QListWidget, QPushButton, QLabel, QSplitter,
     QMessageBox, QScrollArea, QMenu, QDialog, QTextEdit, QLineEdit, 
-    QTabWidget, QProgressBar, QMenuBar, QGridLayout, QSystemTrayIcon
+    QTabWidget, QProgressBar, QMenuBar, QGridLayout, QSystemTrayIcon,
+    QAbstractItemView
 )
 from PyQt6.QtGui import QAction, QActionGroup, QIcon, QPainter
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl, QTimer, QPoint
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QSignalBlocker, pyqtSignal, QUrl, QTimer, QPoint
+from PyQt6.QtGui import QPixmap, QPixmapCache, QFont
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 import requests
@@ -40,9 +46,12 @@ try:
     from .theme_manager import ThemeManager
     from .database_helper import NavidromeDBHelper
     from .subsonic_client import CustomSubsonicClient
-    from .background_tasks import LibraryRefreshThread, ImageDownloadThread, ICYMetadataParser
-    from .ui_components import NowPlayingDialog, ContextualInfoPanel, AlbumGridWidget, MiniPlayerDialog
+    from .background_tasks import LibraryRefreshThread, PlayCountLoadThread, SubsonicFetchThread, ArtistSongsThread, ImageDownloadRunnable, ICYMetadataParser, RadioArtworkLoader, RADIO_ART_CACHE, album_list_title, album_decades
+    from .ui_components import NowPlayingDialog, ContextualInfoPanel, AlbumGridWidget, MiniPlayerDialog, format_duration, find_cover_pixmap, cache_cover_pixmap, PIXMAP_CACHE_LIMIT_KB
     from .desktop_integration import DesktopIntegrationManager
+    from .cache_utils import load_json_cache, save_json_cache
+    from . import json_utils
+    from .paths import CONFIG_PATH, LOG_DIR, ASSETS_DIR
 except ImportError:
     # Fall back to absolute imports (when run directly)
     import sys
@@ -51,23 +60,32 @@ except ImportError:
     from theme_manager import ThemeManager
     from database_helper import NavidromeDBHelper
     from subsonic_client import CustomSubsonicClient
-    from background_tasks import LibraryRefreshThread, ImageDownloadThread, ICYMetadataParser
-    from ui_components import NowPlayingDialog, ContextualInfoPanel, AlbumGridWidget
+    from background_tasks import LibraryRefreshThread, PlayCountLoadThread, SubsonicFetchThread, ArtistSongsThread, ImageDownloadRunnable, ICYMetadataParser, RadioArtworkLoader, RADIO_ART_CACHE, album_list_title, album_decades
+    from ui_components import NowPlayingDialog, ContextualInfoPanel, AlbumGridWidget, format_duration, find_cover_pixmap, cache_cover_pixmap, PIXMAP_CACHE_LIMIT_KB
     from desktop_integration import DesktopIntegrationManager
+    from cache_utils import load_json_cache, save_json_cache
+    import json_utils
+    from paths import CONFIG_PATH, LOG_DIR, ASSETS_DIR
 
 # Setup logging
-log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, 'pyper.log')
+os.makedirs(LOG_DIR, exist_ok=True)
+log_file = os.path.join(LOG_DIR, 'pyper.log')
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
+# Records are queued by the calling thread and written by a listener thread, so logging never blocks the UI
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.handlers.RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3),
+    logging.StreamHandler()
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[logging.handlers.QueueHandler(log_queue)])
 logger = logging.getLogger('Pyper')
 
 # Log startup
@@ -80,22 +98,35 @@ PLAYER_BAR_HEIGHT = 100
 CONTEXTUAL_PANEL_HEIGHT = 180  # Much taller to prevent text cutoff
 ARTWORK_SIZE = 80
 THUMBNAIL_SIZE = 70
+NOW_PLAYING_ARTWORK_SIZE = 200  # Largest place the current track's cover is shown (Now Playing dialog)
+NOW_PLAYING_ARTWORK_PRIORITY = 2  # Ahead of queued album grid covers on the thread pool
 MAX_CONTEXTUAL_ALBUMS = 8
 DEFAULT_SEARCH_LIMITS = {'artists': 20, 'albums': 20, 'songs': 50}
+ICON_PATH = os.path.join(ASSETS_DIR, 'pyper-icon.png')
+ALBUM_FETCH_WORKERS = 8  # Concurrent getAlbum requests when expanding an artist
+AUTH_TOKEN_TTL = 600  # seconds a cached stream salt/token pair is reused
+GENRE_CACHE_FILE = 'genres.json'
+SONGS_ROLE = Qt.ItemDataRole.UserRole + 1  # Album songs already fetched for a list item
+GENRE_CACHE_SAVE_DELAY = 2000  # ms to wait before writing the genre cache
+THREAD_POOL_SIZE = 8  # Workers on the global QThreadPool (cover art downloads, scrobbles)
+RECENTLY_ADDED_TAB = 3
+MOST_PLAYED_TAB = 4
+RECENTLY_PLAYED_TAB = 5
+RADIO_TAB = 6
 
 # --- Configuration ---
 def load_config():
     """Load configuration from config file"""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'config.json')
+    config_path = CONFIG_PATH
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return json_utils.load(f)
     except FileNotFoundError:
         QMessageBox.critical(None, "Configuration Error", 
                            f"Configuration file not found at {config_path}\n"
                            "Please copy config.example.json to config.json and update with your settings.")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         QMessageBox.critical(None, "Configuration Error", 
                            f"Invalid JSON in configuration file: {e}")
         sys.exit(1)
@@ -114,6 +145,8 @@ if 'ui' in CONFIG:
 
 
 class PyperMainWindow(QMainWindow):
+    _app_icon = None  # Application icon, loaded once and shared by all windows
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Pyper - Modern Navidrome Music Player")
@@ -125,17 +158,47 @@ class PyperMainWindow(QMainWindow):
         
         # Initialize Navidrome connection
         self.sonic_client = None
+        self.refresh_thread = None
+        
+        # Stream URL auth, cached so track changes don't rehash the password
+        self._auth_salt = None
+        self._auth_token = None
+        self._auth_expiry = 0.0
+        self._stream_url_template = f"{NAVIDROME_URL}/rest/stream?id={{id}}&u={{u}}&t={{t}}&s={{s}}&v=1.16.1&c=Pyper"
+        self._next_stream = (None, None)  # (song id, stream URL) prepared for the upcoming track
+        self._fetch_threads = set()  # Running SubsonicFetchThreads
+        # Tokens of the latest request feeding each pane; results carrying any other token are stale
+        self._request_serial = 0
+        self._items_request = None  # Second pane list (genres)
+        self._subitems_request = None  # Third pane list
+        self._grid_request = None  # Album grid
+        self._songs_request = None  # Songs list
+        self._search_request = None  # Search results
+        self._pending_song_id = None  # Song to select after "Go to Song"
+        
         self.library_data = {}
+        self._artist_by_id = {}  # Artists keyed by id, rebuilt on library refresh
         self.current_queue = []
         self.current_playing_index = -1
         self.current_artwork_pixmap = None
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)  # Decoded cover art shared by every view, keyed by id and size
+        self._artwork_request = None  # coverArt id the artwork label should show
         self.search_results = {}  # Store search results
         self.radio_stations = []  # Store radio stations
         
+        # Genres cached across sessions, keyed by the library's lastModified scan id
+        self._genre_cache = load_json_cache(GENRE_CACHE_FILE) or {}
+        self._genre_cache_timer = QTimer(self)
+        self._genre_cache_timer.setSingleShot(True)
+        self._genre_cache_timer.setInterval(GENRE_CACHE_SAVE_DELAY)
+        self._genre_cache_timer.timeout.connect(self._save_genre_cache)
+        
         # Radio metadata
         self.icy_parser = None
         self.current_radio_track = {}
         self.is_playing_radio = False
+        self.radio_artwork_loader = RadioArtworkLoader(self)
+        self.radio_artwork_loader.artwork_ready.connect(self.on_radio_artwork_ready)
         
         # Initialize database helper for play counts
         db_path = CONFIG.get('navidrome', {}).get('database_path')
@@ -146,6 +209,7 @@ class PyperMainWindow(QMainWindow):
         }
         self.db_helper = NavidromeDBHelper(db_path, ssh_config)
         self.play_counts = {}
+        self._album_titles = []  # Albums category rows, formatted by PlayCountLoadThread
         self.most_played_albums = []
         self.recently_played_albums = []
         self.recently_added_albums = []  # New: Recently added albums
@@ -166,6 +230,9 @@ class PyperMainWindow(QMainWindow):
         self.contextual_panel = None
         
         # Media player
+        self._total_time_str = "00:00"  # Formatted duration of the current track
+        self._last_pos_sec = -1  # Last playback second shown in the time label
+        self._last_progress = -1  # Last value set on the progress bar
         self.media_player = QMediaPlayer()
         self.audio_output = QAudioOutput()
         self.media_player.setAudioOutput(self.audio_output)
@@ -208,6 +275,10 @@ class PyperMainWindow(QMainWindow):
                 self.icy_parser.stop()
                 self.icy_parser.wait()
             
+            # Let in-flight API calls finish before their threads are destroyed
+            for thread in list(self._fetch_threads):
+                thread.wait()
+            
             # Clean up album grid threads
             if hasattr(self, 'album_grid') and self.album_grid:
                 self.album_grid.cleanup_threads()
@@ -230,6 +301,9 @@ class PyperMainWindow(QMainWindow):
         # Create menu bar
         self.create_menu_bar()
         
+        # One font shared by the now playing label and every tab header (QFont copies are implicitly shared)
+        header_font = QFont("Arial", 12, QFont.Weight.Bold)
+        
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
@@ -362,7 +436,7 @@ class PyperMainWindow(QMainWindow):
         
         # Now playing info
         self.now_playing_label = QLabel("Not playing")
-        self.now_playing_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.now_playing_label.setFont(header_font)
         controls_layout.addWidget(self.now_playing_label)
         
         # Controls row
@@ -555,7 +629,7 @@ class PyperMainWindow(QMainWindow):
         # Queue header with clear button
         queue_header_layout = QHBoxLayout()
         queue_label = QLabel("Playback Queue")
-        queue_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        queue_label.setFont(header_font)
         self.clear_queue_button = QPushButton("Clear Queue")
         self.clear_queue_button.clicked.connect(self.clear_queue)
         self.clear_queue_button.setStyleSheet("""
@@ -582,6 +656,7 @@ class PyperMainWindow(QMainWindow):
         queue_layout.addLayout(queue_header_layout)
         
         self.queue_list = QListWidget()
+        self.queue_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.queue_list.itemDoubleClicked.connect(self.queue_item_double_clicked)
         self.queue_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.queue_list.customContextMenuRequested.connect(self.show_queue_context_menu)
@@ -592,7 +667,7 @@ class PyperMainWindow(QMainWindow):
         recently_added_layout = QVBoxLayout(recently_added_tab)
         
         recently_added_header = QLabel("Recently Added Albums")
-        recently_added_header.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        recently_added_header.setFont(header_font)
         recently_added_layout.addWidget(recently_added_header)
         
         self.recently_added_list = QListWidget()
@@ -606,7 +681,7 @@ class PyperMainWindow(QMainWindow):
         most_played_layout = QVBoxLayout(most_played_tab)
         
         most_played_header = QLabel("Most Played Albums")
-        most_played_header.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        most_played_header.setFont(header_font)
         most_played_layout.addWidget(most_played_header)
         
         self.most_played_list = QListWidget()
@@ -620,7 +695,7 @@ class PyperMainWindow(QMainWindow):
         recently_played_layout = QVBoxLayout(recently_played_tab)
         
         recently_played_header = QLabel("Recently Played Albums")
-        recently_played_header.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        recently_played_header.setFont(header_font)
         recently_played_layout.addWidget(recently_played_header)
         
         self.recently_played_list = QListWidget()
@@ -634,7 +709,7 @@ class PyperMainWindow(QMainWindow):
         radio_layout = QVBoxLayout(radio_tab)
         
         radio_header = QLabel("Internet Radio Stations")
-        radio_header.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        radio_header.setFont(header_font)
         radio_layout.addWidget(radio_header)
         
         self.radio_list = QListWidget()
@@ -652,6 +727,17 @@ class PyperMainWindow(QMainWindow):
         self.tab_widget.addTab(recently_played_tab, "Recently Played")
         self.tab_widget.addTab(radio_tab, "Radio")
         
+        # Every row is a single line of text, so the views can size all rows from the first one
+        for list_widget in (self.items_list, self.subitems_list, self.songs_list, self.search_artists_list,
+                            self.search_albums_list, self.search_songs_list, self.queue_list,
+                            self.recently_added_list, self.most_played_list, self.recently_played_list,
+                            self.radio_list):
+            list_widget.setUniformItemSizes(True)
+        
+        # Tab lists refreshed while hidden are only filled in once their tab is shown
+        self._tab_populators = {}  # tab index -> populate method
+        self.tab_widget.currentChanged.connect(self._populate_shown_tab)
+        
         browser_layout.addWidget(self.tab_widget)
         content_splitter.addWidget(browser_widget)
         
@@ -662,12 +748,27 @@ class PyperMainWindow(QMainWindow):
         # Set splitter proportions (player at top, browser in middle, contextual panel at bottom)
         content_splitter.setSizes([150, 500, 120])
         
+        # Shared context menu template, re-bound to the clicked item on each popup
+        self._ctx_menu = QMenu(self)
+        self._ctx_add = self._ctx_menu.addAction("Add to Queue")
+        self._ctx_play = self._ctx_menu.addAction("Play Now")
+        self._ctx_separator = self._ctx_menu.addSeparator()
+        self._ctx_go_actions = {
+            'song': self._ctx_menu.addAction("Go to Song"),
+            'album': self._ctx_menu.addAction("Go to Album"),
+            'artist': self._ctx_menu.addAction("Go to Artist"),
+        }
+        
     def create_menu_bar(self):
         """Create the application menu bar with theme selection"""
         menubar = self.menuBar()
         
         # File menu (should come first)
         file_menu = menubar.addMenu('File')
+        clear_art_action = QAction('Clear Cover Art Cache', self)
+        clear_art_action.triggered.connect(self.clear_cover_art_cache)
+        file_menu.addAction(clear_art_action)
+        file_menu.addSeparator()
         quit_action = QAction('Quit', self)
         quit_action.setShortcut('Ctrl+Q')
         quit_action.triggered.connect(self.force_quit)
@@ -682,27 +783,14 @@ class PyperMainWindow(QMainWindow):
         # Create action group for theme selection
         self.theme_action_group = QActionGroup(self)
         self.theme_action_group.setExclusive(True)
+        self.theme_action_group.triggered.connect(self._on_theme_action_triggered)
         
-        # Get current theme from config
-        current_theme = CONFIG.get('ui', {}).get('theme', 'dark_teal')
-        
-        # Add theme actions
-        for theme_id, theme_name in self.theme_manager.get_theme_list():
-            action = QAction(theme_name, self)
-            action.setCheckable(True)
-            action.setData(theme_id)
-            
-            # Check current theme
-            if theme_id == current_theme or (current_theme.endswith('.xml') and theme_id == current_theme[:-4]):
-                action.setChecked(True)
-            
-            action.triggered.connect(lambda checked, t_id=theme_id: self.change_theme(t_id))
-            
-            self.theme_action_group.addAction(action)
-            theme_menu.addAction(action)
+        # Theme actions are added the first time the menu opens, so theme files aren't read at startup
+        self.theme_menu = theme_menu
+        theme_menu.aboutToShow.connect(self.populate_theme_menu)
         
         # Add separator and theme info
-        theme_menu.addSeparator()
+        self.theme_menu_separator = theme_menu.addSeparator()
         info_action = QAction('About Themes...', self)
         info_action.triggered.connect(self.show_theme_info)
         theme_menu.addAction(info_action)
@@ -713,21 +801,56 @@ class PyperMainWindow(QMainWindow):
         mini_player_action.triggered.connect(self.toggle_mini_player)
         view_menu.addAction(mini_player_action)
         
+    def clear_cover_art_cache(self):
+        """Forget all cached cover art, in memory and on disk"""
+        QPixmapCache.clear()
+        RADIO_ART_CACHE.clear()
+        self.radio_artwork_loader.clear_cache()
+        if self.sonic_client:
+            self.sonic_client.clear_cover_art_cache()
+        self.status_label.setText("Cover art cache cleared")
+    
     def setup_connections(self):
         """Setup signal connections"""
         pass
     
     def create_context_menu(self, item, add_callback, play_callback):
-        """Create a standard context menu for items"""
-        menu = QMenu(self)
+        """Bind the shared Add/Play context menu to an item and return it"""
+        self._bind_ctx_action(self._ctx_add, partial(add_callback, item))
+        self._bind_ctx_action(self._ctx_play, partial(play_callback, item))
         
-        add_action = menu.addAction("Add to Queue")
-        add_action.triggered.connect(lambda: add_callback(item))
+        self._ctx_separator.setVisible(False)
+        for action in self._ctx_go_actions.values():
+            action.setVisible(False)
         
-        play_action = menu.addAction("Play Now")
-        play_action.triggered.connect(lambda: play_callback(item))
+        return self._ctx_menu
+    
+    def _bind_ctx_action(self, action, slot):
+        """Replace whatever slot a shared context menu action was bound to"""
+        try:
+            action.triggered.disconnect()
+        except TypeError:
+            pass  # Nothing connected yet
+        action.triggered.connect(slot)
+    
+    def _show_ctx(self, list_widget, position, add_callback, play_callback, go_to=()):
+        """Show the shared context menu for the list item at position"""
+        item = list_widget.itemAt(position)
+        if not item:
+            return
         
-        return menu
+        data = item.data(Qt.ItemDataRole.UserRole)
+        menu = self.create_context_menu(item, add_callback, play_callback)
+        
+        # The first "Go to" target is the item's own type; the others need a reference in its data
+        for item_type, action in self._ctx_go_actions.items():
+            visible = item_type in go_to and (item_type == go_to[0] or bool(data and data.get(item_type)))
+            action.setVisible(visible)
+            if visible:
+                self._bind_ctx_action(action, partial(self.go_to_browse_item, data, item_type))
+                self._ctx_separator.setVisible(True)
+        
+        menu.exec(list_widget.mapToGlobal(position))
     
     def change_theme(self, theme_id):
         """Change the application theme"""
@@ -765,19 +888,25 @@ class PyperMainWindow(QMainWindow):
         
         QMessageBox.information(self, "Theme Information", info_text)
     
+    @classmethod
+    def get_app_icon(cls):
+        """Get the shared application icon, loading it from disk on first use"""
+        if cls._app_icon is None:
+            cls._app_icon = QIcon(ICON_PATH)
+            if cls._app_icon.isNull():
+                logger.warning(f"Icon file not found at: {ICON_PATH}")
+            else:
+                logger.info(f"Application icon loaded from: {ICON_PATH}")
+        return cls._app_icon
+    
     def set_application_icon(self):
         """Set the application icon"""
         try:
-            # Try to use the custom icon from assets directory
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'pyper-icon.png')
-            if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
+            icon = self.get_app_icon()
+            if not icon.isNull():
                 self.setWindowIcon(icon)
                 # Also set for the application
                 QApplication.instance().setWindowIcon(icon)
-                logger.info(f"Application icon set from: {icon_path}")
-            else:
-                logger.warning(f"Icon file not found at: {icon_path}")
         except Exception as e:
             logger.error(f"Failed to set application icon: {e}")
     
@@ -792,9 +921,9 @@ class PyperMainWindow(QMainWindow):
         
         # Set tray icon
         try:
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'pyper-icon.png')
-            if os.path.exists(icon_path):
-                self.tray_icon.setIcon(QIcon(icon_path))
+            icon = self.get_app_icon()
+            if not icon.isNull():
+                self.tray_icon.setIcon(icon)
             else:
                 # Fallback to default icon
                 self.tray_icon.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaPlay))
@@ -849,7 +978,7 @@ class PyperMainWindow(QMainWindow):
         
         # Theme switching submenu
         self.tray_theme_menu = QMenu("Switch Theme", self)
-        self.create_tray_theme_menu()
+        self.tray_theme_menu.aboutToShow.connect(self.create_tray_theme_menu)
         self.tray_menu.addMenu(self.tray_theme_menu)
         
         self.tray_menu.addSeparator()
@@ -873,25 +1002,49 @@ class PyperMainWindow(QMainWindow):
         # Set the menu
         self.tray_icon.setContextMenu(self.tray_menu)
     
-    def create_tray_theme_menu(self):
-        """Create the theme switching submenu for tray"""
-        self.tray_theme_menu.clear()
+    def populate_theme_menu(self):
+        """Add the theme actions to the Themes menu on first show"""
+        if self.theme_action_group.actions():
+            return
         
-        # Create theme action group for exclusivity
-        self.tray_theme_group = QActionGroup(self)
+        # Check the applied theme, falling back to the one in config
+        current_theme = self.theme_manager.current_theme or CONFIG.get('ui', {}).get('theme', 'dark_teal')
         
-        for theme_id, theme_data in self.theme_manager.available_themes.items():
-            action = QAction(theme_data['name'], self)
+        for theme_id, theme_name in self.theme_manager.get_theme_list():
+            action = QAction(theme_name, self)
             action.setCheckable(True)
             action.setData(theme_id)
-            action.triggered.connect(lambda checked, tid=theme_id: self.change_theme(tid))
             
             # Check current theme
-            if theme_id == self.theme_manager.current_theme:
+            if theme_id == current_theme or (current_theme.endswith('.xml') and theme_id == current_theme[:-4]):
                 action.setChecked(True)
             
-            self.tray_theme_group.addAction(action)
-            self.tray_theme_menu.addAction(action)
+            self.theme_action_group.addAction(action)
+            self.theme_menu.insertAction(self.theme_menu_separator, action)
+    
+    def _on_theme_action_triggered(self, action):
+        """Switch to the theme stored on a triggered Themes menu action"""
+        self.change_theme(action.data())
+    
+    def create_tray_theme_menu(self):
+        """Create the theme switching submenu for tray on first show, then sync its checked theme"""
+        if not self.tray_theme_menu.actions():
+            # Create theme action group for exclusivity
+            self.tray_theme_group = QActionGroup(self)
+            self.tray_theme_group.triggered.connect(self._on_theme_action_triggered)
+            
+            for theme_id, theme_name in self.theme_manager.get_theme_list():
+                action = QAction(theme_name, self)
+                action.setCheckable(True)
+                action.setData(theme_id)
+                
+                self.tray_theme_group.addAction(action)
+                self.tray_theme_menu.addAction(action)
+        
+        # Check current theme
+        for action in self.tray_theme_group.actions():
+            if action.data() == self.theme_manager.current_theme:
+                action.setChecked(True)
     
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
@@ -923,7 +1076,7 @@ class PyperMainWindow(QMainWindow):
         try:
             tray_geometry = self.tray_icon.geometry()
             self.tray_hover_widget.show_at_tray(tray_geometry)
-        except:
+        except Exception:
             # Fallback to default positioning if tray geometry fails
             self.tray_hover_widget.show_at_tray()
     
@@ -1015,33 +1168,115 @@ class PyperMainWindow(QMainWindow):
         """Refresh the music library from Navidrome"""
         if not self.sonic_client:
             return
+        
+        # Ignore repeated clicks while a refresh is still running
+        if self.refresh_thread and self.refresh_thread.isRunning():
+            return
             
         self.refresh_button.setEnabled(False)
         self.status_label.setText("Refreshing library...")
         
+        # Start from an empty library; categories are filled in as they stream in
+        self.library_data = {}
+        self._artist_by_id = {}
+        self.sonic_client.clear_cache()
+        self._clear_lists(self.items_list, self.subitems_list, self.songs_list)
+        self.album_grid.clear()
+        
+        # Select "Artists" so the first results show up as soon as they arrive
+        if self.category_list.count() > 0:
+            self.category_list.setCurrentRow(0)
+        
         self.refresh_thread = LibraryRefreshThread(self.sonic_client)
         self.refresh_thread.progress.connect(self.status_label.setText)
+        self.refresh_thread.partial.connect(self.library_partial)
         self.refresh_thread.finished.connect(self.library_refreshed)
         self.refresh_thread.error.connect(self.refresh_error)
         self.refresh_thread.start()
     
+    def library_partial(self, category, chunk):
+        """Handle a chunk of library data streamed from the refresh thread"""
+        self.library_data.setdefault(category, []).extend(chunk)
+        
+        if category == 'artists_flat':
+            self._artist_by_id.update((artist['id'], artist) for artist in chunk)
+            current_category = self.category_list.currentItem()
+            if current_category and current_category.text() == "Artists":
+                self._append_items(chunk)
+    
+    def _append_items(self, artists):
+        """Append artists to the items list in one batch"""
+        self._add_list_items(self.items_list, [artist['name'] for artist in artists], artists)
+    
+    def _add_list_items(self, list_widget, titles, values):
+        """Append rows to a list widget in one batch, storing each value under UserRole"""
+        start_row = list_widget.count()
+        list_widget.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(list_widget)
+        try:
+            list_widget.addItems(titles)
+            for row, value in enumerate(values, start_row):
+                list_widget.item(row).setData(Qt.ItemDataRole.UserRole, value)
+        finally:
+            blocker.unblock()
+            list_widget.setUpdatesEnabled(True)
+    
+    def _sync_list_items(self, list_widget, titles, values):
+        """Bring a list widget in line with new rows, inserting and removing only the rows whose text changed"""
+        old_titles = [list_widget.item(row).text() for row in range(list_widget.count())]
+        matcher = difflib.SequenceMatcher(None, old_titles, titles, autojunk=False)
+        list_widget.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(list_widget)
+        try:
+            # Apply edits from the bottom up so earlier row numbers stay valid
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                for row in reversed(range(i1, i2)):
+                    list_widget.takeItem(row)
+                list_widget.insertItems(i1, titles[j1:j2])
+            # Rows with unchanged text may still carry an outdated copy of their data
+            for row, value in enumerate(values):
+                list_widget.item(row).setData(Qt.ItemDataRole.UserRole, value)
+        finally:
+            blocker.unblock()
+            list_widget.setUpdatesEnabled(True)
+    
+    def _clear_lists(self, *list_widgets):
+        """Empty several list widgets with repaints and widget signals suspended until all are done"""
+        blockers = []
+        for list_widget in list_widgets:
+            list_widget.setUpdatesEnabled(False)
+            blockers.append(QSignalBlocker(list_widget))
+        try:
+            for list_widget in list_widgets:
+                list_widget.clear()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            for list_widget in list_widgets:
+                list_widget.setUpdatesEnabled(True)
+    
+    def _song_list_title(self, song):
+        """Format a song row as 'Title - Artist (m:ss)'"""
+        song_title = f"{song['title']} - {song.get('artist', 'Unknown Artist')}"
+        if 'duration' in song:
+            song_title += f" ({self.format_duration(song['duration'])})"
+        return song_title
+    
     def library_refreshed(self, library_data):
         """Handle completed library refresh"""
         self.library_data = library_data
+        self._artist_by_id = {artist['id']: artist for artist in library_data.get('artists_flat', [])}
         self.refresh_button.setEnabled(True)
         self.status_label.setText("Library refreshed successfully")
         
-        # Clear current selections
-        self.items_list.clear()
-        self.subitems_list.clear()
-        self.album_grid.clear()
-        self.songs_list.clear()
         self.clear_search_results()
         
-        # Auto-expand artists on startup
-        if self.category_list.count() > 0:
-            self.category_list.setCurrentRow(0)  # Select "Artists"
-            self.category_selected(self.category_list.item(0))
+        # Artists were populated while streaming; rebuild any other category picked meanwhile
+        current_category = self.category_list.currentItem()
+        if current_category and current_category.text() != "Artists":
+            self.category_selected(current_category)
         
         # Load play count data and populate new tabs
         self.load_play_count_data()
@@ -1061,10 +1296,10 @@ class PyperMainWindow(QMainWindow):
     def category_selected(self, item):
         """Handle category selection (Artists, Albums, Playlists, Genres, Years)"""
         category = item.text()
-        self.items_list.clear()
-        self.subitems_list.clear()
+        self._items_request = None
+        self._reset_pane_requests()
+        self._clear_lists(self.items_list, self.subitems_list, self.songs_list)
         self.album_grid.clear()
-        self.songs_list.clear()
         
         # Show list and hide grid for all categories
         self.album_grid.hide()
@@ -1076,71 +1311,65 @@ class PyperMainWindow(QMainWindow):
             self.contextual_panel.show_default_message()
         
         if category == "Artists":
-            for artist_group in self.library_data.get('artists', []):
-                for artist in artist_group.get('artist', []):
-                    list_item = QListWidgetItem(artist['name'])
-                    list_item.setData(Qt.ItemDataRole.UserRole, artist)
-                    self.items_list.addItem(list_item)
+            self._append_items(self.library_data.get('artists_flat', []))
         elif category == "Albums":
-            for album in self.library_data.get('albums', []):
-                album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
-                # Add play count if available
-                if album['id'] in self.play_counts:
-                    play_count = self.play_counts[album['id']]['play_count']
-                    if play_count > 0:
-                        album_title += f" ({play_count} plays)"
-                list_item = QListWidgetItem(album_title)
-                list_item.setData(Qt.ItemDataRole.UserRole, album)
-                self.items_list.addItem(list_item)
+            albums = self.library_data.get('albums', [])
+            album_titles = self._album_titles
+            if len(album_titles) != len(albums):
+                # Play counts haven't been joined in the background yet
+                album_titles = [album_list_title(album, self.play_counts) for album in albums]
+            self._add_list_items(self.items_list, album_titles, albums)
         elif category == "Playlists":
-            for playlist in self.library_data.get('playlists', []):
-                list_item = QListWidgetItem(playlist['name'])
-                list_item.setData(Qt.ItemDataRole.UserRole, playlist)
-                self.items_list.addItem(list_item)
+            playlists = self.library_data.get('playlists', [])
+            self._add_list_items(self.items_list, [playlist['name'] for playlist in playlists], playlists)
         elif category == "Genres":
-            try:
+            scan_id = self.library_data.get('lastModified')
+            if scan_id is not None and self._genre_cache.get('scan_id') == scan_id:
+                self._show_genres(self._genre_cache.get('data'))
+            else:
                 self.status_label.setText("Loading genres...")
                 logger.info("Loading genres from server")
-                genres_response = self.sonic_client.getGenres()
-                genres = genres_response.get('subsonic-response', {}).get('genres', {}).get('genre', [])
-                for genre in genres:
-                    genre_name = genre.get('value', genre.get('name', 'Unknown Genre'))
-                    list_item = QListWidgetItem(genre_name)
-                    list_item.setData(Qt.ItemDataRole.UserRole, {'name': genre_name, 'type': 'genre'})
-                    self.items_list.addItem(list_item)
-                self.status_label.setText(f"Loaded {len(genres)} genres")
-            except Exception as e:
-                logger.error(f"Error loading genres: {e}")
-                self.status_label.setText("Error loading genres")
+                self._items_request = self._next_request("genres")
+                self._run_fetch('getGenres', kind=self._items_request,
+                                on_result=partial(self._on_genres_loaded, scan_id))
         elif category == "Years":
-            # Generate year ranges based on available albums
-            years = set()
-            for album in self.library_data.get('albums', []):
-                year = album.get('year')
-                if year and year > 0:
-                    years.add(year)
-            
-            # Create decade ranges
-            decades = {}
-            for year in sorted(years):
-                decade = (year // 10) * 10
-                decade_label = f"{decade}s"
-                if decade_label not in decades:
-                    decades[decade_label] = {'start': decade, 'end': decade + 9, 'count': 0}
-                decades[decade_label]['count'] += 1
-            
-            # Add decade items
-            for decade_label, decade_info in sorted(decades.items(), key=lambda x: x[1]['start'], reverse=True):
-                display_text = f"{decade_label} ({decade_info['count']} albums)"
-                list_item = QListWidgetItem(display_text)
-                list_item.setData(Qt.ItemDataRole.UserRole, {'name': decade_label, 'type': 'decade', 'start': decade_info['start'], 'end': decade_info['end']})
-                self.items_list.addItem(list_item)
+            # Decade ranges are counted by the refresh thread; count here only while albums are still streaming in
+            decades = self.library_data.get('decades')
+            if decades is None:
+                decades = album_decades(self.library_data.get('albums', []))
+            self._add_list_items(self.items_list, [f"{decade['name']} ({decade['count']} albums)" for decade in decades],
+                                 decades)
+    
+    def _on_genres_loaded(self, scan_id, genres_response, kind):
+        """Cache the genres fetched in the background and list them"""
+        if kind != self._items_request:
+            return
+        if not genres_response:
+            self.status_label.setText("Error loading genres")
+            return
+        
+        genres = genres_response.get('subsonic-response', {}).get('genres', {}).get('genre', [])
+        self._genre_cache = {'scan_id': scan_id, 'data': genres}
+        if scan_id is not None:
+            self._genre_cache_timer.start()
+        self._show_genres(genres)
+    
+    def _show_genres(self, genres):
+        """Fill the items list with genres"""
+        genre_names = [genre.get('value', genre.get('name', 'Unknown Genre')) for genre in genres]
+        self._add_list_items(self.items_list, genre_names,
+                             [{'name': genre_name, 'type': 'genre'} for genre_name in genre_names])
+        self.status_label.setText(f"Loaded {len(genres)} genres")
+    
+    def _save_genre_cache(self):
+        """Write the genre cache to disk (debounced via QTimer)"""
+        save_json_cache(GENRE_CACHE_FILE, self._genre_cache)
     
     def item_selected(self, item):
         """Handle item selection in the second pane"""
-        self.subitems_list.clear()
+        self._reset_pane_requests()
+        self._clear_lists(self.subitems_list, self.songs_list)
         self.album_grid.clear()
-        self.songs_list.clear()
         data = item.data(Qt.ItemDataRole.UserRole)
         
         if not data:
@@ -1148,138 +1377,209 @@ class PyperMainWindow(QMainWindow):
             
         # Determine what type of item was selected
         if 'albumCount' in data:  # It's an artist, show albums in grid
-            try:
-                artist_albums = self.sonic_client.getArtist(data['id'])
-                albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
-                
-                # Show album grid and hide list
-                self.subitems_list.hide()
-                self.album_grid.show()
-                
-                # Setup album grid
-                self.album_grid.set_sonic_client(self.sonic_client)
-                self.album_grid.set_play_counts(self.play_counts)
-                
-                # Apply current theme colors
-                if hasattr(self.theme_manager, 'current_theme') and self.theme_manager.current_theme:
-                    current_theme_data = self.theme_manager.available_themes.get(self.theme_manager.current_theme, {})
-                    if 'colors' in current_theme_data:
-                        self.album_grid.apply_theme_colors(current_theme_data['colors'])
-                
-                self.album_grid.populate_albums(albums)
-                
-                # Hide contextual panel for artist album browsing (as requested)
-                if self.contextual_panel:
-                    self.contextual_panel.hide()
-                    
-            except Exception as e:
-                logger.error(f"Error fetching artist albums: {e}")
+            # Show album grid and hide list
+            self.subitems_list.hide()
+            self.album_grid.show()
+            
+            # Setup album grid
+            self.album_grid.set_sonic_client(self.sonic_client)
+            self.album_grid.set_play_counts(self.play_counts)
+            
+            # Apply current theme colors
+            if hasattr(self.theme_manager, 'current_theme') and self.theme_manager.current_theme:
+                current_theme_data = self.theme_manager.available_themes.get(self.theme_manager.current_theme, {})
+                if 'colors' in current_theme_data:
+                    self.album_grid.apply_theme_colors(current_theme_data['colors'])
+            
+            # Hide contextual panel for artist album browsing (as requested)
+            if self.contextual_panel:
+                self.contextual_panel.hide()
+            
+            self._grid_request = self._next_request(f"artist:{data['id']}")
+            self._run_fetch('getArtist', data['id'], kind=self._grid_request,
+                            on_result=self._populate_album_grid)
                 
         elif 'artist' in data and 'name' in data and 'songCount' in data:  # It's an album, show songs directly in pane 4
-            try:
-                # Show list and hide grid
-                self.album_grid.hide()
-                self.subitems_list.show()
-                
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                for song in album_songs.get('subsonic-response', {}).get('album', {}).get('song', []):
-                    track_num = str(song.get('track', '0'))
-                    song_title = f"{track_num.zfill(2)}. {song['title']}"
-                    if 'duration' in song:
-                        duration = self.format_duration(song['duration'])
-                        song_title += f" ({duration})"
-                    list_item = QListWidgetItem(song_title)
-                    list_item.setData(Qt.ItemDataRole.UserRole, song)
-                    self.songs_list.addItem(list_item)
-                    
-                # Load album artwork
-                if 'coverArt' in data:
-                    self.load_artwork(data['coverArt'])
+            # Show list and hide grid
+            self.album_grid.hide()
+            self.subitems_list.show()
+            
+            self._request_album_songs(data['id'], item)
                 
-                # Show album info in contextual panel
-                if self.contextual_panel:
-                    self.contextual_panel.show()
-                    self.contextual_panel.show_album_info(data, self.sonic_client)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching album songs: {e}")
+            # Load album artwork
+            if 'coverArt' in data:
+                self.load_artwork(data['coverArt'])
+            
+            # Show album info in contextual panel
+            if self.contextual_panel:
+                self.contextual_panel.show()
+                self.contextual_panel.show_album_info(data, self.sonic_client)
                 
         elif 'public' in data:  # It's a playlist, show songs directly in pane 4
-            try:
-                # Show list and hide grid
-                self.album_grid.hide()
-                self.subitems_list.show()
+            # Show list and hide grid
+            self.album_grid.hide()
+            self.subitems_list.show()
+            
+            self._songs_request = self._next_request(f"playlist:{data['id']}")
+            self._run_fetch('getPlaylist', data['id'], kind=self._songs_request,
+                            on_result=self._populate_playlist_songs)
                 
-                playlist_songs = self.sonic_client.getPlaylist(data['id'])
-                for song in playlist_songs.get('subsonic-response', {}).get('playlist', {}).get('entry', []):
-                    song_title = f"{song['title']} - {song.get('artist', 'Unknown Artist')}"
-                    if 'duration' in song:
-                        duration = self.format_duration(song['duration'])
-                        song_title += f" ({duration})"
-                    list_item = QListWidgetItem(song_title)
-                    list_item.setData(Qt.ItemDataRole.UserRole, song)
-                    self.songs_list.addItem(list_item)
-                    
-                # Show contextual panel
-                if self.contextual_panel:
-                    self.contextual_panel.show()
-                    
-            except Exception as e:
-                logger.error(f"Error fetching playlist songs: {e}")
+            # Show contextual panel
+            if self.contextual_panel:
+                self.contextual_panel.show()
                 
         elif data.get('type') == 'genre':  # It's a genre, show albums in that genre
-            try:
-                # Show list and hide grid
-                self.album_grid.hide()
-                self.subitems_list.show()
-                
-                self.status_label.setText(f"Loading albums for genre: {data['name']}")
-                genre_albums = self.sonic_client.getAlbumList2_byGenre(data['name'])
-                albums = genre_albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-                for album in albums:
-                    album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
-                    if album.get('year'):
-                        album_title += f" ({album['year']})"
-                    list_item = QListWidgetItem(album_title)
-                    list_item.setData(Qt.ItemDataRole.UserRole, album)
-                    self.subitems_list.addItem(list_item)
-                
-                # Show genre info in contextual panel
-                if self.contextual_panel:
-                    self.contextual_panel.show()
-                    self.contextual_panel.show_genre_info(data['name'], albums, self.sonic_client)
-                    
-                self.status_label.setText(f"Loaded {len(albums)} albums for {data['name']}")
-            except Exception as e:
-                logger.error(f"Error fetching genre albums: {e}")
-                self.status_label.setText("Error loading genre albums")
+            # Show list and hide grid
+            self.album_grid.hide()
+            self.subitems_list.show()
+            
+            self.status_label.setText(f"Loading albums for genre: {data['name']}")
+            self._subitems_request = self._next_request(f"genre:{data['name']}")
+            self._run_fetch('getAlbumList2_byGenre', data['name'], kind=self._subitems_request,
+                            on_result=partial(self._populate_genre_albums, data))
                 
         elif data.get('type') == 'decade':  # It's a decade, show albums from that decade
+            # Show list and hide grid
+            self.album_grid.hide()
+            self.subitems_list.show()
+            
+            self.status_label.setText(f"Loading albums from {data['name']}")
+            self._subitems_request = self._next_request(f"decade:{data['start']}")
+            self._run_fetch('getAlbumList2_byYear', data['start'], data['end'], kind=self._subitems_request,
+                            on_result=partial(self._populate_decade_albums, data))
+    
+    def _next_request(self, label):
+        """Make a token unique to one request, so repeating a selection can't match an older response"""
+        self._request_serial += 1
+        return f"{label}#{self._request_serial}"
+    
+    def _reset_pane_requests(self):
+        """Forget the requests feeding the third and fourth panes, so their late results are dropped"""
+        self._subitems_request = None
+        self._grid_request = None
+        self._songs_request = None
+    
+    def _run_fetch(self, method, *args, kind=None, on_result=None, on_error=None):
+        """Run a sonic_client call on a worker thread, delivering the result on the GUI thread"""
+        thread = SubsonicFetchThread(self.sonic_client, method, *args, kind=kind)
+        if on_result:
+            thread.finished_data.connect(on_result)
+        thread.error.connect(on_error or self._on_fetch_error)
+        self._start_fetch_thread(thread)
+        return thread
+    
+    def _start_fetch_thread(self, thread):
+        """Start a fetch thread, keeping a reference until it has finished"""
+        thread.finished.connect(partial(self._on_fetch_thread_finished, thread))
+        self._fetch_threads.add(thread)
+        thread.start()
+    
+    def _on_fetch_thread_finished(self, thread):
+        """Release a finished fetch thread"""
+        thread.wait()
+        self._fetch_threads.discard(thread)
+    
+    def _on_fetch_error(self, error_message, kind):
+        """Handle a failed background fetch"""
+        logger.error(f"Error fetching {kind}: {error_message}")
+        self.status_label.setText("Error loading data from server")
+    
+    def _request_album_songs(self, album_id, source_item=None):
+        """Fetch an album's songs in the background to fill the songs list"""
+        self._songs_request = self._next_request(f"album:{album_id}")
+        self._run_fetch('getAlbum', album_id, kind=self._songs_request,
+                        on_result=partial(self._populate_songs_list, source_item))
+    
+    def _populate_songs_list(self, source_item, album_songs, kind):
+        """Fill the songs list with a fetched album's songs"""
+        if kind != self._songs_request:
+            return  # A newer selection replaced this request
+        
+        songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
+        
+        # Keep the songs on the album's list item so double-clicking it needs no refetch
+        if source_item is not None:
             try:
-                # Show list and hide grid
-                self.album_grid.hide()
-                self.subitems_list.show()
-                
-                self.status_label.setText(f"Loading albums from {data['name']}")
-                decade_albums = self.sonic_client.getAlbumList2_byYear(data['start'], data['end'])
-                albums = decade_albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-                for album in albums:
-                    album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
-                    if album.get('year'):
-                        album_title += f" ({album['year']})"
-                    list_item = QListWidgetItem(album_title)
-                    list_item.setData(Qt.ItemDataRole.UserRole, album)
-                    self.subitems_list.addItem(list_item)
-                
-                # Show decade info in contextual panel
-                if self.contextual_panel:
-                    self.contextual_panel.show()
-                    self.contextual_panel.show_decade_info(data['name'], albums, self.sonic_client)
-                    
-                self.status_label.setText(f"Loaded {len(albums)} albums from {data['name']}")
-            except Exception as e:
-                logger.error(f"Error fetching decade albums: {e}")
-                self.status_label.setText("Error loading decade albums")
+                source_item.setData(SONGS_ROLE, songs)
+            except RuntimeError:
+                pass  # The list was cleared while the request was in flight
+        
+        self._add_list_items(self.songs_list, [self.format_album_song_title(song) for song in songs], songs)
+        self._select_pending_song()
+    
+    def _populate_playlist_songs(self, playlist_songs, kind):
+        """Fill the songs list with a fetched playlist's songs"""
+        if kind != self._songs_request:
+            return
+        
+        songs = playlist_songs.get('subsonic-response', {}).get('playlist', {}).get('entry', [])
+        self._add_list_items(self.songs_list, [self._song_list_title(song) for song in songs], songs)
+    
+    def _select_pending_song(self):
+        """Select the song requested by "Go to Song" once its album has loaded"""
+        if not self._pending_song_id:
+            return
+        
+        for i in range(self.songs_list.count()):
+            song_data = self.songs_list.item(i).data(Qt.ItemDataRole.UserRole)
+            if song_data and song_data.get('id') == self._pending_song_id:
+                self.songs_list.setCurrentRow(i)
+                break
+        self._pending_song_id = None
+    
+    def _populate_album_grid(self, artist_albums, kind):
+        """Fill the album grid with a fetched artist's albums"""
+        if kind != self._grid_request:
+            return
+        
+        albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
+        self.album_grid.populate_albums(albums)
+    
+    def _populate_album_subitems(self, albums):
+        """Fill the third pane with a list of albums"""
+        titles = []
+        for album in albums:
+            album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
+            if album.get('year'):
+                album_title += f" ({album['year']})"
+            titles.append(album_title)
+        self._add_list_items(self.subitems_list, titles, albums)
+    
+    def _populate_genre_albums(self, data, genre_albums, kind):
+        """Show the fetched albums of a genre"""
+        if kind != self._subitems_request:
+            return
+        if not genre_albums:
+            self.status_label.setText("Error loading genre albums")
+            return
+        
+        albums = genre_albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+        self._populate_album_subitems(albums)
+        
+        # Show genre info in contextual panel
+        if self.contextual_panel:
+            self.contextual_panel.show()
+            self.contextual_panel.show_genre_info(data['name'], albums, self.sonic_client)
+            
+        self.status_label.setText(f"Loaded {len(albums)} albums for {data['name']}")
+    
+    def _populate_decade_albums(self, data, decade_albums, kind):
+        """Show the fetched albums of a decade"""
+        if kind != self._subitems_request:
+            return
+        if not decade_albums:
+            self.status_label.setText("Error loading decade albums")
+            return
+        
+        albums = decade_albums.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+        self._populate_album_subitems(albums)
+        
+        # Show decade info in contextual panel
+        if self.contextual_panel:
+            self.contextual_panel.show()
+            self.contextual_panel.show_decade_info(data['name'], albums, self.sonic_client)
+            
+        self.status_label.setText(f"Loaded {len(albums)} albums from {data['name']}")
     
     def artwork_clicked(self, event):
         """Handle clicks on album artwork"""
@@ -1310,17 +1610,25 @@ class PyperMainWindow(QMainWindow):
         if not query:
             return
             
-        try:
-            self.status_label.setText("Searching...")
-            results = self.sonic_client.search3(query)
-            self.search_results = results.get('subsonic-response', {}).get('searchResult3', {})
-            
-            self.populate_search_results()
-            self.tab_widget.setCurrentIndex(1)  # Switch to search tab
-            self.status_label.setText(f"Search complete: '{query}'")
-            
-        except Exception as e:
-            logger.error(f"Search error: {e}")
+        self.status_label.setText("Searching...")
+        self._search_request = self._next_request(f"search:{query}")
+        self._run_fetch('search3', query, kind=self._search_request,
+                        on_result=partial(self._on_search_results, query), on_error=self._on_search_error)
+    
+    def _on_search_results(self, query, results, kind):
+        """Show search results fetched in the background"""
+        if kind != self._search_request:
+            return
+        
+        self.search_results = results.get('subsonic-response', {}).get('searchResult3', {})
+        self.populate_search_results()
+        self.tab_widget.setCurrentIndex(1)  # Switch to search tab
+        self.status_label.setText(f"Search complete: '{query}'")
+    
+    def _on_search_error(self, error_message, kind):
+        """Handle a failed background search"""
+        logger.error(f"Search error: {error_message}")
+        if kind == self._search_request:
             self.status_label.setText("Search failed")
     
     def populate_search_results(self):
@@ -1329,106 +1637,83 @@ class PyperMainWindow(QMainWindow):
         
         # Artists
         artists = self.search_results.get('artist', [])
-        for artist in artists:
-            list_item = QListWidgetItem(artist['name'])
-            list_item.setData(Qt.ItemDataRole.UserRole, artist)
-            self.search_artists_list.addItem(list_item)
+        self._add_list_items(self.search_artists_list, [artist['name'] for artist in artists], artists)
         
         # Albums
         albums = self.search_results.get('album', [])
-        for album in albums:
-            album_title = f"{album['name']} - {album.get('artist', 'Unknown Artist')}"
-            list_item = QListWidgetItem(album_title)
-            list_item.setData(Qt.ItemDataRole.UserRole, album)
-            self.search_albums_list.addItem(list_item)
+        self._add_list_items(self.search_albums_list,
+                             [f"{album['name']} - {album.get('artist', 'Unknown Artist')}" for album in albums], albums)
         
         # Songs
         songs = self.search_results.get('song', [])
-        for song in songs:
-            song_title = f"{song['title']} - {song.get('artist', 'Unknown Artist')}"
-            if 'duration' in song:
-                duration = self.format_duration(song['duration'])
-                song_title += f" ({duration})"
-            list_item = QListWidgetItem(song_title)
-            list_item.setData(Qt.ItemDataRole.UserRole, song)
-            self.search_songs_list.addItem(list_item)
+        self._add_list_items(self.search_songs_list, [self._song_list_title(song) for song in songs], songs)
     
     def clear_search_results(self):
         """Clear all search result lists"""
-        self.search_artists_list.clear()
-        self.search_albums_list.clear()
-        self.search_songs_list.clear()
+        self._clear_lists(self.search_artists_list, self.search_albums_list, self.search_songs_list)
     
     def load_play_count_data(self):
-        """Load play count data from Navidrome database or API"""
-        try:
-            self.status_label.setText("Loading play count data...")
-            
-            # Try database first
-            self.play_counts = self.db_helper.get_album_play_counts()
-            self.most_played_albums = self.db_helper.get_most_played_albums()
-            self.recently_played_albums = self.db_helper.get_recently_played_albums()
-            
-            # If database approach failed, try API fallback
-            if not self.play_counts and not self.most_played_albums:
-                self.status_label.setText("Database unavailable, trying API fallback...")
-                self.load_api_play_data()
-            
-            self.populate_most_played_list()
-            self.populate_recently_played_list()
-            
-            if self.play_counts or self.most_played_albums:
-                source = "database" if self.play_counts else "API"
-                self.status_label.setText(f"Loaded play data from {source}")
-            else:
-                self.status_label.setText("Library refreshed (no play count data available)")
-                
-        except Exception as e:
-            print(f"Error loading play count data: {e}")
-            self.status_label.setText("Library refreshed (play count data unavailable)")
+        """Load play count data from Navidrome database or API in the background"""
+        self.status_label.setText("Loading play count data...")
+        
+        self._album_titles = []
+        self._pc_thread = PlayCountLoadThread(self.db_helper, self.sonic_client, self.library_data.get('albums', []))
+        self._pc_thread.progress.connect(self.status_label.setText)
+        self._pc_thread.loaded.connect(self._on_play_counts_loaded)
+        self._pc_thread.failed.connect(self._on_play_counts_failed)
+        self._pc_thread.start()
+    
+    def _on_play_counts_loaded(self, play_counts, most_played_albums, recently_played_albums, album_titles):
+        """Handle play count data loaded by the background thread"""
+        self.play_counts = play_counts
+        self._album_titles = album_titles
+        self.most_played_albums = most_played_albums
+        self.recently_played_albums = recently_played_albums
+        
+        self._populate_tab(MOST_PLAYED_TAB, self.populate_most_played_list)
+        self._populate_tab(RECENTLY_PLAYED_TAB, self.populate_recently_played_list)
+        
+        if self.play_counts or self.most_played_albums:
+            source = "database" if self.play_counts else "API"
+            self.status_label.setText(f"Loaded play data from {source}")
+        else:
+            self.status_label.setText("Library refreshed (no play count data available)")
+    
+    def _on_play_counts_failed(self, error_message):
+        """Handle play count loading failure"""
+        logger.error(error_message)
+        self.status_label.setText("Library refreshed (play count data unavailable)")
+    
+    def _populate_tab(self, tab_index, populate):
+        """Fill a tab's list now if the tab is showing, otherwise the next time it is shown"""
+        if self.tab_widget.currentIndex() == tab_index:
+            self._tab_populators.pop(tab_index, None)
+            populate()
+        else:
+            self._tab_populators[tab_index] = populate
     
-    def load_api_play_data(self):
-        """Load play data using Navidrome API as fallback"""
-        try:
-            # Try to get frequently played albums
-            frequent_response = self.sonic_client.getAlbumList2_byFrequent(50)
-            if frequent_response:
-                albums = frequent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-                self.most_played_albums = []
-                for i, album in enumerate(albums):
-                    album_data = album.copy()
-                    album_data['playCount'] = 50 - i  # Estimate based on order
-                    self.most_played_albums.append(album_data)
-            
-            # Try to get recently played albums
-            recent_response = self.sonic_client.getAlbumList2_byRecent(50)
-            if recent_response:
-                albums = recent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-                self.recently_played_albums = []
-                for album in albums:
-                    album_data = album.copy()
-                    album_data['playCount'] = 1  # Default count
-                    self.recently_played_albums.append(album_data)
-                    
-        except Exception as e:
-            print(f"API fallback failed: {e}")
+    def _populate_shown_tab(self, index):
+        """Fill the newly shown tab's list if its data changed while it was hidden"""
+        populate = self._tab_populators.pop(index, None)
+        if populate:
+            populate()
     
     def populate_most_played_list(self):
         """Populate the most played albums list"""
-        self.most_played_list.clear()
+        titles = []
         for album in self.most_played_albums:
             album_title = f"{album['name']} - {album['artist']}"
             if album.get('year'):
                 album_title += f" ({album['year']})"
             album_title += f" • {album['playCount']} plays"
             
-            list_item = QListWidgetItem(album_title)
-            list_item.setData(Qt.ItemDataRole.UserRole, album)
-            self.most_played_list.addItem(list_item)
+            titles.append(album_title)
+        
+        self._sync_list_items(self.most_played_list, titles, self.most_played_albums)
     
     def populate_recently_played_list(self):
         """Populate the recently played albums list"""
-        self.recently_played_list.clear()
+        titles = []
         for album in self.recently_played_albums:
             album_title = f"{album['name']} - {album['artist']}"
             if album.get('year'):
@@ -1436,112 +1721,53 @@ class PyperMainWindow(QMainWindow):
             
             # Format last played date
             if album.get('lastPlayed'):
-                from datetime import datetime
                 try:
                     # Assuming ISO format timestamp
                     dt = datetime.fromisoformat(album['lastPlayed'].replace('Z', '+00:00'))
                     album_title += f" • Last played: {dt.strftime('%Y-%m-%d')}"
-                except:
+                except ValueError:
                     album_title += f" • {album['playCount']} plays"
             
-            list_item = QListWidgetItem(album_title)
-            list_item.setData(Qt.ItemDataRole.UserRole, album)
-            self.recently_played_list.addItem(list_item)
+            titles.append(album_title)
+        
+        self._sync_list_items(self.recently_played_list, titles, self.recently_played_albums)
     
     def most_played_double_clicked(self, item):
         """Handle double-click on most played album"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
-            queue_start_index = len(self.current_queue)
-            self.add_album_songs_to_queue(data)
-            if self.current_queue:
-                self.play_track(queue_start_index)
+            self._queue_songs_async(self._fetch_album_songs, data['id'], play=True)
     
     def recently_played_double_clicked(self, item):
         """Handle double-click on recently played album"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
-            queue_start_index = len(self.current_queue)
-            self.add_album_songs_to_queue(data)
-            if self.current_queue:
-                self.play_track(queue_start_index)
+            self._queue_songs_async(self._fetch_album_songs, data['id'], play=True)
     
     def show_most_played_context_menu(self, position):
         """Show context menu for most played albums"""
-        item = self.most_played_list.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_album_songs_to_queue(data))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.most_played_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Album" option
-        go_to_album_action = menu.addAction("Go to Album")
-        go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
-        
-        # Add "Go to Artist" option if artist info is available
-        if data and data.get('artist'):
-            go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.most_played_list.mapToGlobal(position))
+        self._show_ctx(self.most_played_list, position,
+                       self.add_album_item_to_queue,
+                       self.most_played_double_clicked, go_to=('album', 'artist'))
     
     def show_recently_played_context_menu(self, position):
         """Show context menu for recently played albums"""
-        item = self.recently_played_list.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_album_songs_to_queue(data))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.recently_played_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Album" option
-        go_to_album_action = menu.addAction("Go to Album")
-        go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
-        
-        # Add "Go to Artist" option if artist info is available
-        if data and data.get('artist'):
-            go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.recently_played_list.mapToGlobal(position))
-    
-
+        self._show_ctx(self.recently_played_list, position,
+                       self.add_album_item_to_queue,
+                       self.recently_played_double_clicked, go_to=('album', 'artist'))
     
     # Search result handlers
     def search_artist_double_clicked(self, item):
         """Handle double-click on search artist result"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
-            queue_start_index = len(self.current_queue)
-            self.add_artist_songs_to_queue(data)
-            if self.current_queue:
-                self.play_track(queue_start_index)
+            self._queue_artist_async(data['id'], play=True)
     
     def search_album_double_clicked(self, item):
         """Handle double-click on search album result"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
-            queue_start_index = len(self.current_queue)
-            self.add_album_songs_to_queue(data)
-            if self.current_queue:
-                self.play_track(queue_start_index)
+            self._queue_songs_async(self._fetch_album_songs, data['id'], play=True)
     
     def search_song_double_clicked(self, item):
         """Handle double-click on search song result"""
@@ -1554,87 +1780,18 @@ class PyperMainWindow(QMainWindow):
     # Context menus for search results
     def show_search_artists_context_menu(self, position):
         """Show context menu for search artists"""
-        item = self.search_artists_list.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_search_artist_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.search_artist_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Artist" option
-        go_to_artist_action = menu.addAction("Go to Artist")
-        go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.search_artists_list.mapToGlobal(position))
+        self._show_ctx(self.search_artists_list, position, self.add_search_artist_to_queue,
+                       self.search_artist_double_clicked, go_to=('artist',))
     
     def show_search_albums_context_menu(self, position):
         """Show context menu for search albums"""
-        item = self.search_albums_list.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_search_album_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.search_album_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Album" option
-        go_to_album_action = menu.addAction("Go to Album")
-        go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
-        
-        # Add "Go to Artist" option if artist info is available
-        if data and data.get('artist'):
-            go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.search_albums_list.mapToGlobal(position))
+        self._show_ctx(self.search_albums_list, position, self.add_search_album_to_queue,
+                       self.search_album_double_clicked, go_to=('album', 'artist'))
     
     def show_search_songs_context_menu(self, position):
         """Show context menu for search songs"""
-        item = self.search_songs_list.itemAt(position)
-        if not item:
-            return
-        
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_search_song_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.search_song_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Song" option (navigates to album and selects song)
-        go_to_song_action = menu.addAction("Go to Song")
-        go_to_song_action.triggered.connect(lambda: self.go_to_browse_item(data, 'song'))
-        
-        # Add "Go to Album" option if album info is available
-        if data and data.get('album'):
-            go_to_album_action = menu.addAction("Go to Album")
-            go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
-        
-        # Add "Go to Artist" option if artist info is available
-        if data and data.get('artist'):
-            go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.search_songs_list.mapToGlobal(position))
+        self._show_ctx(self.search_songs_list, position, self.add_search_song_to_queue,
+                       self.search_song_double_clicked, go_to=('song', 'album', 'artist'))
     
     def add_search_artist_to_queue(self, item):
         """Add search artist to queue"""
@@ -1654,125 +1811,101 @@ class PyperMainWindow(QMainWindow):
         if data and 'title' in data:
             self.add_songs_to_queue([data])
     
-    def add_artist_songs_to_queue(self, artist_data):
-        """Add all songs from an artist to queue"""
+    def _fetch_album_songs(self, album_id):
+        """Fetch the songs of one album, returning an empty list on failure"""
         try:
-            artist_albums = self.sonic_client.getArtist(artist_data['id'])
-            albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
-            songs_to_add = []
-            for album in albums:
-                album_songs = self.sonic_client.getAlbum(album['id'])
-                songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                songs_to_add.extend(songs)
-            
-            if songs_to_add:
-                self.add_songs_to_queue(songs_to_add)
+            album_songs = self.sonic_client.getAlbum(album_id)
+            return album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
         except Exception as e:
-            print(f"Error adding artist songs to queue: {e}")
+            logger.error(f"Error fetching album {album_id}: {e}")
+            return []
     
-    def add_album_songs_to_queue(self, album_data):
-        """Add all songs from an album to queue"""
-        try:
-            album_songs = self.sonic_client.getAlbum(album_data['id'])
-            songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-            if songs:
-                self.add_songs_to_queue(songs)
-        except Exception as e:
-            print(f"Error adding album songs to queue: {e}")
+    def _fetch_playlist_songs(self, playlist_id):
+        """Fetch the songs of a playlist"""
+        playlist_songs = self.sonic_client.getPlaylist(playlist_id)
+        return playlist_songs.get('subsonic-response', {}).get('playlist', {}).get('entry', [])
     
-    def items_double_clicked(self, item):
-        """Handle double-click on items in the second pane - add to queue and play"""
-        data = item.data(Qt.ItemDataRole.UserRole)
-        if not data:
+    def _queue_songs_async(self, fetch, *args, play=False):
+        """Fetch songs on a worker thread, then add them to the queue (and optionally play)"""
+        self._run_fetch(fetch, *args, on_result=partial(self._on_songs_fetched, play))
+    
+    def _on_songs_fetched(self, play, songs, kind):
+        """Add songs fetched in the background to the queue"""
+        if not songs:
             return
-            
-        songs_to_add = []
-        
-        if 'albumCount' in data:  # It's an artist, add all their songs
-            try:
-                artist_albums = self.sonic_client.getArtist(data['id'])
-                albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
-                for album in albums:
-                    album_songs = self.sonic_client.getAlbum(album['id'])
-                    songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                    songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching artist songs: {e}")
-                
-        elif 'artist' in data and 'name' in data and 'songCount' in data:  # It's an album
-            try:
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching album songs: {e}")
-                
-        elif 'public' in data:  # It's a playlist
-            try:
-                playlist_songs = self.sonic_client.getPlaylist(data['id'])
-                songs = playlist_songs.get('subsonic-response', {}).get('playlist', {}).get('entry', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching playlist songs: {e}")
         
-        if songs_to_add:
-            queue_start_index = len(self.current_queue)
-            self.add_songs_to_queue(songs_to_add)
+        queue_start_index = len(self.current_queue)
+        self.add_songs_to_queue(songs)
+        if play:
             # Start playing the first song we just added
             self.play_track(queue_start_index)
     
+    def _queue_artist_async(self, artist_id, play=False):
+        """Stream an artist's songs into the queue, starting playback with the first album"""
+        thread = ArtistSongsThread(self.sonic_client.getArtist, self._fetch_album_songs, artist_id, ALBUM_FETCH_WORKERS)
+        thread.album_songs.connect(partial(self._on_artist_album_songs, {'play': play}))
+        thread.error.connect(self._on_fetch_error)
+        self._start_fetch_thread(thread)
+    
+    def _on_artist_album_songs(self, state, songs):
+        """Append one album of a streamed artist to the queue"""
+        # Only the first album that arrives starts playback
+        play = state['play']
+        state['play'] = False
+        self._on_songs_fetched(play, songs, 'artist')
+    
+    def add_artist_songs_to_queue(self, artist_data):
+        """Add all songs from an artist to queue"""
+        self._queue_artist_async(artist_data['id'])
+    
+    def add_album_item_to_queue(self, item):
+        """Add the album stored on a list item to the queue"""
+        self.add_album_songs_to_queue(item.data(Qt.ItemDataRole.UserRole))
+    
+    def add_album_songs_to_queue(self, album_data):
+        """Add all songs from an album to queue"""
+        self._queue_songs_async(self._fetch_album_songs, album_data['id'])
+    
+    def items_double_clicked(self, item):
+        """Handle double-click on items in the second pane - add to queue and play"""
+        self._queue_item_songs(item, play=True)
+    
     def show_items_context_menu(self, position):
         """Show context menu for items in the second pane"""
-        item = self.items_list.itemAt(position)
-        if not item:
-            return
-            
-        menu = QMenu(self)
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_item_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.items_double_clicked(item))
-        
-        menu.exec(self.items_list.mapToGlobal(position))
+        self._show_ctx(self.items_list, position, self.add_item_to_queue, self.items_double_clicked)
     
     def add_item_to_queue(self, item):
         """Add an item (artist/album/playlist) to queue without playing"""
+        self._queue_item_songs(item)
+    
+    # Song sources by identifying key, checked in order (playlists also carry songCount)
+    _SONG_SOURCES = (
+        ('public', '_fetch_playlist_songs'),
+        ('songCount', '_fetch_album_songs'),
+    )
+    
+    def _collect_songs_for(self, data):
+        """Fetch the songs of an album or playlist, dispatching on its data keys"""
+        for key, fetch in self._SONG_SOURCES:
+            if key in data:
+                return getattr(self, fetch)(data['id'])
+        return []
+    
+    def _queue_item_songs(self, item, play=False):
+        """Queue the songs of a browse list item (artist/album/playlist/song)"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if not data:
             return
-            
-        songs_to_add = []
-        
-        if 'albumCount' in data:  # It's an artist
-            try:
-                artist_albums = self.sonic_client.getArtist(data['id'])
-                albums = artist_albums.get('subsonic-response', {}).get('artist', {}).get('album', [])
-                for album in albums:
-                    album_songs = self.sonic_client.getAlbum(album['id'])
-                    songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                    songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching artist songs: {e}")
-                
-        elif 'artist' in data and 'name' in data and 'songCount' in data:  # It's an album
-            try:
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching album songs: {e}")
-                
-        elif 'public' in data:  # It's a playlist
-            try:
-                playlist_songs = self.sonic_client.getPlaylist(data['id'])
-                songs = playlist_songs.get('subsonic-response', {}).get('playlist', {}).get('entry', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error fetching playlist songs: {e}")
         
-        if songs_to_add:
-            self.add_songs_to_queue(songs_to_add)
+        cached_songs = item.data(SONGS_ROLE)
+        if 'albumCount' in data:  # It's an artist, stream songs album by album
+            self._queue_artist_async(data['id'], play=play)
+        elif cached_songs is not None:  # Album songs already fetched for the songs list
+            self._on_songs_fetched(play, cached_songs, 'cached')
+        elif 'title' in data:  # It's a single song
+            self._on_songs_fetched(play, [data], 'song')
+        else:
+            self._queue_songs_async(self._collect_songs_for, data, play=play)
     
     def subitem_selected(self, item):
         """Handle selection in the third pane (albums from artists)"""
@@ -1784,64 +1917,43 @@ class PyperMainWindow(QMainWindow):
             
         # This should be an album, show its songs in pane 4
         if 'artist' in data and 'name' in data:
-            try:
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                for song in album_songs.get('subsonic-response', {}).get('album', {}).get('song', []):
-                    track_num = str(song.get('track', '0'))
-                    song_title = f"{track_num.zfill(2)}. {song['title']}"
-                    if 'duration' in song:
-                        duration = self.format_duration(song['duration'])
-                        song_title += f" ({duration})"
-                    list_item = QListWidgetItem(song_title)
-                    list_item.setData(Qt.ItemDataRole.UserRole, song)
-                    self.songs_list.addItem(list_item)
-                    
-                # Load album artwork
-                if 'coverArt' in data:
-                    self.load_artwork(data['coverArt'])
+            self._request_album_songs(data['id'], item)
                 
-                # Show album info in contextual panel
-                if self.contextual_panel:
-                    self.contextual_panel.show_album_info(data, self.sonic_client)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching album songs: {e}")
+            # Load album artwork
+            if 'coverArt' in data:
+                self.load_artwork(data['coverArt'])
+            
+            # Show album info in contextual panel
+            if self.contextual_panel:
+                self.contextual_panel.show_album_info(data, self.sonic_client)
     
     def song_double_clicked(self, item):
         """Handle double-click on songs in the fourth pane - add to queue and play"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data and 'title' in data:
-            queue_start_index = len(self.current_queue)
-            
             # Get all songs from the current album starting from the clicked song
-            songs_to_queue = self.get_album_songs_from_track(data)
-            
-            if songs_to_queue:
-                self.add_songs_to_queue(songs_to_queue)
-                self.play_track(queue_start_index)
-                # Update status to reflect auto-queueing behavior
-                album_name = data.get('album', 'Unknown Album')
-                track_count = len(songs_to_queue)
-                self.status_label.setText(f"Playing '{data['title']}' - Queued {track_count} tracks from '{album_name}'")
-            else:
-                # Fallback to just adding the single song if we can't get album songs
-                self.add_songs_to_queue([data])
-                self.play_track(queue_start_index)
+            self._run_fetch(self.get_album_songs_from_track, data,
+                            on_result=partial(self._on_track_album_songs, data))
+    
+    def _on_track_album_songs(self, data, songs_to_queue, kind):
+        """Queue and play the album songs fetched for a double-clicked track"""
+        queue_start_index = len(self.current_queue)
+        
+        if songs_to_queue:
+            self.add_songs_to_queue(songs_to_queue)
+            self.play_track(queue_start_index)
+            # Update status to reflect auto-queueing behavior
+            album_name = data.get('album', 'Unknown Album')
+            track_count = len(songs_to_queue)
+            self.status_label.setText(f"Playing '{data['title']}' - Queued {track_count} tracks from '{album_name}'")
+        else:
+            # Fallback to just adding the single song if we can't get album songs
+            self.add_songs_to_queue([data])
+            self.play_track(queue_start_index)
     
     def show_songs_context_menu(self, position):
         """Show context menu for songs in the fourth pane"""
-        item = self.songs_list.itemAt(position)
-        if not item:
-            return
-            
-        menu = QMenu(self)
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_song_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.song_double_clicked(item))
-        
-        menu.exec(self.songs_list.mapToGlobal(position))
+        self._show_ctx(self.songs_list, position, self.add_song_to_queue, self.song_double_clicked)
     
     def add_song_to_queue(self, item):
         """Add a single song to queue without playing"""
@@ -1864,8 +1976,8 @@ class PyperMainWindow(QMainWindow):
             if not all_songs:
                 return None
             
-            # Sort songs by track number to ensure correct order
-            all_songs.sort(key=lambda x: int(x.get('track', 0)))
+            # Sort songs by track number to ensure correct order (copy, the response may be cached)
+            all_songs = sorted(all_songs, key=lambda x: int(x.get('track', 0)))
             
             # Find the index of the clicked song
             clicked_song_id = clicked_song_data.get('id')
@@ -1885,68 +1997,15 @@ class PyperMainWindow(QMainWindow):
     
     def subitem_double_clicked(self, item):
         """Handle double-click on subitem - add to queue and play"""
-        data = item.data(Qt.ItemDataRole.UserRole)
-        
-        if not data:
-            return
-            
-        songs_to_add = []
-        
-        # If it's an album, add all songs to queue
-        if 'artist' in data and 'name' in data and 'song' not in data:
-            try:
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error adding album to queue: {e}")
-        # If it's a song, add just that song
-        elif 'title' in data:
-            songs_to_add.append(data)
-            
-        if songs_to_add:
-            queue_start_index = len(self.current_queue)
-            self.add_songs_to_queue(songs_to_add)
-            self.play_track(queue_start_index)
+        self._queue_item_songs(item, play=True)
     
     def show_subitems_context_menu(self, position):
         """Show context menu for subitems in the third pane"""
-        item = self.subitems_list.itemAt(position)
-        if not item:
-            return
-            
-        menu = QMenu(self)
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_subitem_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.subitem_double_clicked(item))
-        
-        menu.exec(self.subitems_list.mapToGlobal(position))
+        self._show_ctx(self.subitems_list, position, self.add_subitem_to_queue, self.subitem_double_clicked)
     
     def add_subitem_to_queue(self, item):
         """Add a subitem (album/song) to queue without playing"""
-        data = item.data(Qt.ItemDataRole.UserRole)
-        
-        if not data:
-            return
-            
-        songs_to_add = []
-        
-        # If it's an album, add all songs to queue
-        if 'artist' in data and 'name' in data and 'song' not in data:
-            try:
-                album_songs = self.sonic_client.getAlbum(data['id'])
-                songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-                songs_to_add.extend(songs)
-            except Exception as e:
-                print(f"Error adding album to queue: {e}")
-        # If it's a song, add just that song
-        elif 'title' in data:
-            songs_to_add.append(data)
-            
-        if songs_to_add:
-            self.add_songs_to_queue(songs_to_add)
+        self._queue_item_songs(item)
     
     def album_grid_selected(self, album_data):
         """Handle album selection in the grid"""
@@ -1956,59 +2015,32 @@ class PyperMainWindow(QMainWindow):
             return
             
         # Show album songs in pane 4
-        try:
-            album_songs = self.sonic_client.getAlbum(album_data['id'])
-            for song in album_songs.get('subsonic-response', {}).get('album', {}).get('song', []):
-                track_num = str(song.get('track', '0'))
-                song_title = f"{track_num.zfill(2)}. {song['title']}"
-                if 'duration' in song:
-                    duration = self.format_duration(song['duration'])
-                    song_title += f" ({duration})"
-                list_item = QListWidgetItem(song_title)
-                list_item.setData(Qt.ItemDataRole.UserRole, song)
-                self.songs_list.addItem(list_item)
-                
-            # Load album artwork
-            if 'coverArt' in album_data:
-                self.load_artwork(album_data['coverArt'])
-                
-        except Exception as e:
-            logger.error(f"Error fetching album songs from grid: {e}")
+        self._request_album_songs(album_data['id'])
+            
+        # Load album artwork
+        if 'coverArt' in album_data:
+            self.load_artwork(album_data['coverArt'])
     
     def album_grid_double_clicked(self, album_data):
         """Handle double-click on album in grid - add to queue and play"""
         if not album_data:
             return
             
-        try:
-            album_songs = self.sonic_client.getAlbum(album_data['id'])
-            songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-            if songs:
-                queue_start_index = len(self.current_queue)
-                self.add_songs_to_queue(songs)
-                self.play_track(queue_start_index)
-        except Exception as e:
-            logger.error(f"Error playing album from grid: {e}")
+        self._queue_songs_async(self._fetch_album_songs, album_data['id'], play=True)
     
     def add_album_to_queue_from_grid(self, album_data):
         """Add album to queue from grid context menu"""
         if not album_data:
             return
             
-        try:
-            album_songs = self.sonic_client.getAlbum(album_data['id'])
-            songs = album_songs.get('subsonic-response', {}).get('album', {}).get('song', [])
-            if songs:
-                self.add_songs_to_queue(songs)
-        except Exception as e:
-            logger.error(f"Error adding album to queue from grid: {e}")
+        self._queue_songs_async(self._fetch_album_songs, album_data['id'])
 
     def add_songs_to_queue(self, songs):
         """Add songs to the playback queue"""
-        for song in songs:
-            self.current_queue.append(song)
-            song_title = f"{song['title']} - {song.get('artist', 'Unknown Artist')}"
-            self.queue_list.addItem(song_title)
+        self.current_queue.extend(songs)
+        
+        # Insert all rows in one batch so the list only relayouts and repaints once
+        self._add_list_items(self.queue_list, [self.format_queue_title(song) for song in songs], songs)
         
         self.status_label.setText(f"Added {len(songs)} song(s) to queue")
         
@@ -2039,29 +2071,34 @@ class PyperMainWindow(QMainWindow):
         data = item.data(Qt.ItemDataRole.UserRole)
         menu = QMenu(self)
         
-        # Delete single item
-        delete_action = menu.addAction("Remove from Queue")
-        delete_action.triggered.connect(lambda: self.remove_queue_item(self.queue_list.row(item)))
+        # Delete the selection, or just the clicked item
+        selected_rows = [self.queue_list.row(selected) for selected in self.queue_list.selectedItems()]
+        if len(selected_rows) > 1 and item.isSelected():
+            delete_action = menu.addAction(f"Remove {len(selected_rows)} Songs from Queue")
+            delete_action.triggered.connect(partial(self.remove_queue_items, selected_rows))
+        else:
+            delete_action = menu.addAction("Remove from Queue")
+            delete_action.triggered.connect(partial(self.remove_queue_item, self.queue_list.row(item)))
         
         # Play this item
         play_action = menu.addAction("Play Now")
-        play_action.triggered.connect(lambda: self.play_track(self.queue_list.row(item)))
+        play_action.triggered.connect(partial(self.play_track, self.queue_list.row(item)))
         
         menu.addSeparator()
         
         # Add "Go to Song" option (navigates to album and selects song)
         go_to_song_action = menu.addAction("Go to Song")
-        go_to_song_action.triggered.connect(lambda: self.go_to_browse_item(data, 'song'))
+        go_to_song_action.triggered.connect(partial(self.go_to_browse_item, data, 'song'))
         
         # Add "Go to Album" option if album info is available
         if data and data.get('album'):
             go_to_album_action = menu.addAction("Go to Album")
-            go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
+            go_to_album_action.triggered.connect(partial(self.go_to_browse_item, data, 'album'))
         
         # Add "Go to Artist" option if artist info is available
         if data and data.get('artist'):
             go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
+            go_to_artist_action.triggered.connect(partial(self.go_to_browse_item, data, 'artist'))
         
         menu.exec(self.queue_list.mapToGlobal(position))
     
@@ -2082,6 +2119,30 @@ class PyperMainWindow(QMainWindow):
                 
             self.status_label.setText("Removed song from queue")
     
+    def remove_queue_items(self, indices):
+        """Remove several items from the queue in a single pass"""
+        removed = {index for index in indices if 0 <= index < len(self.current_queue)}
+        if not removed:
+            return
+        if len(removed) == 1:
+            self.remove_queue_item(removed.pop())
+            return
+        
+        # Shift the playing index down by the number of removed rows above it
+        if self.current_playing_index in removed:
+            self.current_playing_index = -1  # Currently playing song was removed
+        elif self.current_playing_index > 0:
+            self.current_playing_index -= sum(1 for index in removed if index < self.current_playing_index)
+        
+        self.current_queue[:] = [song for index, song in enumerate(self.current_queue) if index not in removed]
+        
+        # Rebuilding the list is one batch insert instead of a row shift per takeItem
+        self.queue_list.clear()
+        self._add_list_items(self.queue_list, [self.format_queue_title(song) for song in self.current_queue], self.current_queue)
+        
+        self.status_label.setText(f"Removed {len(removed)} songs from queue")
+        self.update_tray_status()
+    
     
     def show_now_playing(self):
         """Show the now playing information"""
@@ -2158,54 +2219,84 @@ class PyperMainWindow(QMainWindow):
         from PyQt6.QtWidgets import QApplication
         QApplication.instance().quit()
     
+    def _get_auth(self):
+        """Get the (salt, token) pair for stream URLs, regenerating it once expired"""
+        if self._auth_token is None or time.monotonic() >= self._auth_expiry:
+            self._auth_salt = self.sonic_client._generate_salt()
+            self._auth_token = self.sonic_client._make_token(self._auth_salt)
+            self._auth_expiry = time.monotonic() + AUTH_TOKEN_TTL
+        return self._auth_salt, self._auth_token
+    
+    def _stream_url(self, song):
+        """Build the authenticated stream URL for a song"""
+        next_id, next_url = self._next_stream
+        if next_id == song['id']:
+            return next_url
+        salt, token = self._get_auth()
+        return self._stream_url_template.format(id=song['id'], u=NAVIDROME_USER, t=token, s=salt)
+    
+    def _prefetch_next_track(self, index):
+        """Prepare the stream URL and warm the artwork cache for the track after index"""
+        if index + 1 >= len(self.current_queue):
+            self._next_stream = (None, None)
+            return
+        
+        next_song = self.current_queue[index + 1]
+        self._next_stream = (next_song['id'], self._stream_url(next_song))
+        if next_song.get('coverArt'):
+            self.prefetch_artwork(next_song['coverArt'])
+    
     def play_track(self, index):
         """Play a specific track from the queue"""
-        if 0 <= index < len(self.current_queue):
-            song = self.current_queue[index]
-            self.current_playing_index = index
+        if not 0 <= index < len(self.current_queue):
+            return
+        
+        song = self.current_queue[index]
+        self.current_playing_index = index
+        
+        # Stop radio metadata if playing radio
+        if self.is_playing_radio:
+            self.stop_radio_metadata()
+        
+        try:
+            # Get stream URL with token authentication
+            stream_url = self._stream_url(song)
             
-            # Stop radio metadata if playing radio
-            if self.is_playing_radio:
-                self.stop_radio_metadata()
+            # Update UI
+            self.now_playing_label.setText(f"♪ {song['title']} - {song.get('artist', 'Unknown Artist')}")
             
-            try:
-                # Get stream URL with token authentication
-                salt = self.sonic_client._generate_salt()
-                token = hashlib.md5((NAVIDROME_PASS + salt).encode()).hexdigest()
-                stream_url = f"{NAVIDROME_URL}/rest/stream?id={song['id']}&u={NAVIDROME_USER}&t={token}&s={salt}&v=1.16.1&c=Pyper"
-                
-                # Update UI
-                self.now_playing_label.setText(f"♪ {song['title']} - {song.get('artist', 'Unknown Artist')}")
-                
-                # Start playback
-                self.media_player.setSource(QUrl(stream_url))
-                self.media_player.play()
-                self.play_pause_button.setText("⏸")
-                
-                # Load artwork if available
-                if 'coverArt' in song:
-                    self.load_artwork(song['coverArt'])
-                    
-                # Update now playing dialog if it's open
-                if self.now_playing_dialog.isVisible():
-                    self.now_playing_dialog.update_track_info(song, self.current_artwork_pixmap)
-                    
-                # Update mini player
-                self.update_mini_player()
+            # Start playback
+            self.media_player.setSource(QUrl(stream_url))
+            self.media_player.play()
+            self.play_pause_button.setText("⏸")
+            
+            # Load artwork if available
+            if 'coverArt' in song:
+                self.load_artwork(song['coverArt'])
                 
-                # Update tray status
-                self.update_tray_status()
+            # Update now playing dialog if it's open
+            if self.now_playing_dialog.isVisible():
+                self.now_playing_dialog.update_track_info(song, self.current_artwork_pixmap)
                 
-                # Update desktop integration (MPRIS2)
-                if hasattr(self, 'desktop_integration'):
-                    self.desktop_integration.update_track_metadata(song, self.current_artwork_pixmap)
-                    
-                # Scrobble to Navidrome
-                self.scrobble_track(song['id'])
+            # Update mini player
+            self.update_mini_player()
+            
+            # Update tray status
+            self.update_tray_status()
+            
+            # Update desktop integration (MPRIS2)
+            if hasattr(self, 'desktop_integration'):
+                self.desktop_integration.update_track_metadata(song, self.current_artwork_pixmap)
                 
-            except Exception as e:
-                logger.error(f"Error playing track: {e}")
-                QMessageBox.warning(self, "Playback Error", f"Failed to play track: {str(e)}")
+            # Scrobble to Navidrome
+            self.scrobble_track(song['id'])
+            
+            # Get the next track ready so the transition doesn't stall
+            self._prefetch_next_track(index)
+            
+        except Exception as e:
+            logger.error(f"Error playing track: {e}")
+            QMessageBox.warning(self, "Playback Error", f"Failed to play track: {str(e)}")
     
     def play_pause(self):
         """Toggle play/pause"""
@@ -2243,32 +2334,39 @@ class PyperMainWindow(QMainWindow):
     
     def previous_track(self):
         """Play previous track"""
-        if self.current_playing_index > 0:
-            self.play_track(self.current_playing_index - 1)
+        self.play_track(self.current_playing_index - 1)  # play_track ignores out-of-range indices
     
     def next_track(self):
         """Play next track"""
-        if self.current_playing_index < len(self.current_queue) - 1:
-            self.play_track(self.current_playing_index + 1)
+        self.play_track(self.current_playing_index + 1)  # play_track ignores out-of-range indices
     
     def position_changed(self, position):
         """Handle playback position changes"""
         if self.media_player.duration() > 0:
+            # Only touch the progress bar when its integer value actually moves
             progress = int((position / self.media_player.duration()) * 100)
-            self.progress_bar.setValue(progress)
+            if progress != self._last_progress:
+                self._last_progress = progress
+                self.progress_bar.setValue(progress)
             
-            current_time = self.format_duration(position // 1000)
-            total_time = self.format_duration(self.media_player.duration() // 1000)
-            self.time_label.setText(f"{current_time} / {total_time}")
+            # The visible mm:ss only changes once per second
+            position_sec = position // 1000
+            if position_sec != self._last_pos_sec:
+                self._last_pos_sec = position_sec
+                self.time_label.setText(f"{self.format_duration(position_sec)} / {self._total_time_str}")
             
-            # Update mini player progress
-            self.mini_player.update_progress(position, self.media_player.duration())
+            # Update mini player progress (refreshed from update_mini_player when shown)
+            if self.mini_player.isVisible():
+                self.mini_player.update_progress(position, self.media_player.duration())
     
     def duration_changed(self, duration):
         """Handle duration changes"""
         if duration > 0:
-            total_time = self.format_duration(duration // 1000)
-            self.time_label.setText(f"00:00 / {total_time}")
+            # Total time is constant for the track, so format it once here
+            self._total_time_str = self.format_duration(duration // 1000)
+            self._last_pos_sec = -1
+            self._last_progress = -1
+            self.time_label.setText(f"00:00 / {self._total_time_str}")
     
     def media_status_changed(self, status):
         """Handle media status changes"""
@@ -2277,11 +2375,35 @@ class PyperMainWindow(QMainWindow):
             self.next_track()
     
     def load_artwork(self, cover_art_id):
-        """Load album artwork"""
-        if cover_art_id and self.sonic_client:
-            self.image_thread = ImageDownloadThread(self.sonic_client, cover_art_id)
-            self.image_thread.image_ready.connect(self.artwork_loaded)
-            self.image_thread.start()
+        """Load album artwork from the pixmap cache, fetching it in the background on a miss"""
+        if not cover_art_id or not self.sonic_client:
+            return
+        
+        self._artwork_request = cover_art_id
+        pixmap = find_cover_pixmap(cover_art_id, NOW_PLAYING_ARTWORK_SIZE)
+        if pixmap is not None:
+            self.artwork_loaded(pixmap)
+        else:
+            self._download_artwork(cover_art_id)
+    
+    def prefetch_artwork(self, cover_art_id):
+        """Download artwork into the caches without displaying it"""
+        if not self.sonic_client:
+            return
+        if find_cover_pixmap(cover_art_id, NOW_PLAYING_ARTWORK_SIZE) is None:
+            self._download_artwork(cover_art_id)
+    
+    def _download_artwork(self, cover_art_id):
+        """Fetch artwork on the shared thread pool (the client serves it from its disk cache when it can)"""
+        runnable = ImageDownloadRunnable(self.sonic_client, cover_art_id, NOW_PLAYING_ARTWORK_SIZE)
+        runnable.signals.image_ready.connect(self._on_artwork_downloaded)
+        QThreadPool.globalInstance().start(runnable, NOW_PLAYING_ARTWORK_PRIORITY)
+    
+    def _on_artwork_downloaded(self, cover_art_id, image):
+        """Cache downloaded artwork and show it if it is still the one requested"""
+        pixmap = cache_cover_pixmap(cover_art_id, NOW_PLAYING_ARTWORK_SIZE, image)
+        if cover_art_id == self._artwork_request:
+            self.artwork_loaded(pixmap)
     
     def artwork_loaded(self, pixmap):
         """Handle loaded artwork"""
@@ -2306,31 +2428,30 @@ class PyperMainWindow(QMainWindow):
             self.desktop_integration.update_track_metadata(current_song, pixmap)
     
     def scrobble_track(self, song_id):
-        """Scrobble track to Navidrome"""
+        """Scrobble track to Navidrome in the background"""
+        logger.info(f"Attempting to scrobble track with ID: {song_id}")
+        # Navidrome handles scrobbling automatically when we stream; nothing waits on the result
+        QThreadPool.globalInstance().start(partial(self._safe_scrobble, self.sonic_client, song_id))
+    
+    @staticmethod
+    def _safe_scrobble(sonic_client, song_id):
+        """Send a scrobble from a pool thread, logging instead of raising"""
         try:
-            logger.info(f"Attempting to scrobble track with ID: {song_id}")
-            # Navidrome handles scrobbling automatically when we stream
-            result = self.sonic_client.scrobble(song_id)
-            logger.info(f"Scrobble request sent successfully for track {song_id}")
+            result = sonic_client.scrobble(song_id)
+            logger.info(f"Scrobble request sent successfully for {song_id}")
             logger.debug(f"Scrobble response: {result}")
         except Exception as e:
-            logger.error(f"Scrobbling error for track {song_id}: {e}")
-            import traceback
-            logger.error(f"Scrobble traceback: {traceback.format_exc()}")
+            logger.error(f"Scrobbling error for {song_id}: {e}")
     
     def load_radio_stations(self):
         """Load radio stations from library data"""
         self.radio_stations = self.library_data.get('radio_stations', [])
-        self.populate_radio_list()
+        self._populate_tab(RADIO_TAB, self.populate_radio_list)
     
     def populate_radio_list(self):
         """Populate the radio stations list"""
-        self.radio_list.clear()
-        for station in self.radio_stations:
-            station_name = station.get('name', 'Unknown Station')
-            list_item = QListWidgetItem(station_name)
-            list_item.setData(Qt.ItemDataRole.UserRole, station)
-            self.radio_list.addItem(list_item)
+        titles = [station.get('name', 'Unknown Station') for station in self.radio_stations]
+        self._sync_list_items(self.radio_list, titles, self.radio_stations)
         
         if self.radio_stations:
             logger.info(f"Loaded {len(self.radio_stations)} radio stations")
@@ -2352,13 +2473,13 @@ class PyperMainWindow(QMainWindow):
         menu = QMenu(self)
         
         play_action = menu.addAction("Play Radio Station")
-        play_action.triggered.connect(lambda: self.radio_double_clicked(item))
+        play_action.triggered.connect(partial(self.radio_double_clicked, item))
         
         data = item.data(Qt.ItemDataRole.UserRole)
         if data and data.get('homepageUrl'):
             menu.addSeparator()
             homepage_action = menu.addAction("Open Homepage")
-            homepage_action.triggered.connect(lambda: self.open_radio_homepage(data))
+            homepage_action.triggered.connect(partial(self.open_radio_homepage, data))
         
         menu.exec(self.radio_list.mapToGlobal(position))
     
@@ -2477,6 +2598,7 @@ class PyperMainWindow(QMainWindow):
             self.icy_parser = ICYMetadataParser(stream_url)
             self.icy_parser.metadata_updated.connect(self.on_radio_metadata_updated)
             self.icy_parser.artwork_ready.connect(self.on_radio_artwork_ready)
+            self.icy_parser.artwork_url_found.connect(self.radio_artwork_loader.load)
             self.icy_parser.start()
             logger.info(f"Started ICY metadata parsing for {station_data.get('name')}")
         except Exception as e:
@@ -2509,16 +2631,17 @@ class PyperMainWindow(QMainWindow):
         
         logger.info(f"Radio track updated: {artist} - {title}")
     
-    def on_radio_artwork_ready(self, pixmap):
+    def on_radio_artwork_ready(self, image):
         """Handle radio artwork ready"""
-        logger.info(f"Received radio artwork: {pixmap.width()}x{pixmap.height()}")
+        logger.info(f"Received radio artwork: {image.width()}x{image.height()}")
         
         if not self.is_playing_radio:
             logger.info("Not playing radio - ignoring artwork")
             return
             
-        # Update artwork in player
+        # Update artwork in player; workers hand over a QImage, QPixmap is GUI-thread only
         logger.info("Updating artwork label...")
+        pixmap = QPixmap.fromImage(image)
         self.artwork_label.setPixmap(pixmap)
         self.artwork_label.setText("")
         self.current_artwork_pixmap = pixmap
@@ -2581,27 +2704,35 @@ class PyperMainWindow(QMainWindow):
         self.is_playing_radio = False
         self.current_radio_track = {}
     
-    @staticmethod
-    def format_duration(seconds):
-        """Format duration in seconds to MM:SS"""
-        minutes = seconds // 60
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+    # Memoised module-level formatter, kept as a method for existing callers
+    format_duration = staticmethod(format_duration)
+    
+    def format_album_song_title(self, song):
+        """Build the songs list row text for an album track"""
+        track = int(song.get('track') or 0)
+        if 'duration' in song:
+            return f"{track:02d}. {song['title']} ({self.format_duration(song['duration'])})"
+        return f"{track:02d}. {song['title']}"
+    
+    def format_queue_title(self, song):
+        """Build the queue row text for a song"""
+        return f"{song['title']} - {song.get('artist', 'Unknown Artist')}"
     
     def load_recently_added_albums(self):
-        """Load recently added albums from API"""
-        try:
-            recent_response = self.sonic_client.getAlbumList2_byNewest(50)
-            if recent_response:
-                albums = recent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
-                self.recently_added_albums = albums
-                self.populate_recently_added_list()
-        except Exception as e:
-            logger.error(f"Error loading recently added albums: {e}")
+        """Load recently added albums from API in the background"""
+        self._run_fetch('getAlbumList2_byNewest', 50, kind='recently added albums',
+                        on_result=self._on_recently_added_loaded)
+    
+    def _on_recently_added_loaded(self, recent_response, kind):
+        """Show recently added albums fetched in the background"""
+        if recent_response:
+            albums = recent_response.get('subsonic-response', {}).get('albumList2', {}).get('album', [])
+            self.recently_added_albums = albums
+            self._populate_tab(RECENTLY_ADDED_TAB, self.populate_recently_added_list)
     
     def populate_recently_added_list(self):
         """Populate the recently added albums list"""
-        self.recently_added_list.clear()
+        titles = []
         for album in self.recently_added_albums:
             album_title = f"{album['name']} - {album['artist']}"
             if album.get('year'):
@@ -2609,54 +2740,27 @@ class PyperMainWindow(QMainWindow):
             
             # Add created date if available
             if album.get('created'):
-                from datetime import datetime
                 try:
                     # Assuming ISO format timestamp  
                     dt = datetime.fromisoformat(album['created'].replace('Z', '+00:00'))
                     album_title += f" • Added: {dt.strftime('%Y-%m-%d')}"
-                except:
+                except ValueError:
                     pass  # Skip date formatting if it fails
             
-            list_item = QListWidgetItem(album_title)
-            list_item.setData(Qt.ItemDataRole.UserRole, album)
-            self.recently_added_list.addItem(list_item)
+            titles.append(album_title)
+        
+        self._sync_list_items(self.recently_added_list, titles, self.recently_added_albums)
     
     def recently_added_double_clicked(self, item):
         """Handle double-click on recently added album"""
         data = item.data(Qt.ItemDataRole.UserRole)
         if data:
-            queue_start_index = len(self.current_queue)
-            self.add_album_songs_to_queue(data)
-            if self.current_queue:
-                self.play_track(queue_start_index)
+            self._queue_songs_async(self._fetch_album_songs, data['id'], play=True)
     
     def show_recently_added_context_menu(self, position):
         """Show context menu for recently added albums"""
-        item = self.recently_added_list.itemAt(position)
-        if not item:
-            return
-            
-        data = item.data(Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
-        
-        add_to_queue_action = menu.addAction("Add to Queue")
-        add_to_queue_action.triggered.connect(lambda: self.add_recently_added_to_queue(item))
-        
-        play_now_action = menu.addAction("Play Now")
-        play_now_action.triggered.connect(lambda: self.recently_added_double_clicked(item))
-        
-        menu.addSeparator()
-        
-        # Add "Go to Album" option
-        go_to_album_action = menu.addAction("Go to Album")
-        go_to_album_action.triggered.connect(lambda: self.go_to_browse_item(data, 'album'))
-        
-        # Add "Go to Artist" option if artist info is available
-        if data and data.get('artist'):
-            go_to_artist_action = menu.addAction("Go to Artist")
-            go_to_artist_action.triggered.connect(lambda: self.go_to_browse_item(data, 'artist'))
-        
-        menu.exec(self.recently_added_list.mapToGlobal(position))
+        self._show_ctx(self.recently_added_list, position, self.add_recently_added_to_queue,
+                       self.recently_added_double_clicked, go_to=('album', 'artist'))
     
     def add_recently_added_to_queue(self, item):
         """Add recently added album to queue without playing"""
@@ -2689,12 +2793,16 @@ class PyperMainWindow(QMainWindow):
                 self.category_list.setCurrentRow(0)  # Artists is index 0
                 self.category_selected(self.category_list.item(0))
                 
-                # Find and select the artist in the items list
+                # Resolve the artist by id when possible, falling back to matching by name
+                artist = self._artist_by_id.get(item_data.get('artistId')) or self._artist_by_id.get(item_data.get('id'))
+                artist_id = artist['id'] if artist else None
                 artist_name = item_data.get('artist', item_data.get('name', ''))
+                
+                # Find and select the artist in the items list
                 for i in range(self.items_list.count()):
                     list_item = self.items_list.item(i)
                     list_data = list_item.data(Qt.ItemDataRole.UserRole)
-                    if list_data and list_data.get('name') == artist_name:
+                    if list_data and (list_data.get('id') == artist_id if artist_id else list_data.get('name') == artist_name):
                         self.items_list.setCurrentRow(i)
                         self.item_selected(list_item)
                         break
@@ -2720,16 +2828,10 @@ class PyperMainWindow(QMainWindow):
                             list_item = self.items_list.item(i)
                             list_data = list_item.data(Qt.ItemDataRole.UserRole)
                             if list_data and list_data.get('id') == album_id:
+                                # The song is selected once the album's songs have loaded
+                                self._pending_song_id = item_data.get('id')
                                 self.items_list.setCurrentRow(i)
                                 self.item_selected(list_item)
-                                
-                                # Now find and select the song in the songs list
-                                for j in range(self.songs_list.count()):
-                                    song_item = self.songs_list.item(j)
-                                    song_data = song_item.data(Qt.ItemDataRole.UserRole)
-                                    if song_data and song_data.get('id') == item_data.get('id'):
-                                        self.songs_list.setCurrentRow(j)
-                                        break
                                 break
             
             self.status_label.setText(f"Navigated to {item_type}: {item_data.get('name', item_data.get('title', 'Unknown'))}")
@@ -2937,10 +3039,14 @@ class TrayHoverWidget(QWidget):
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
+    QThreadPool.globalInstance().setMaxThreadCount(THREAD_POOL_SIZE)
     
     # Create and show the main window
     window = PyperMainWindow()
     
+    # Write a theme change still waiting on its save delay before exiting
+    app.aboutToQuit.connect(window.theme_manager.flush_theme_preference)
+    
     # Apply initial theme
     try:
         theme_id = CONFIG.get('ui', {}).get('theme', 'dark_teal')
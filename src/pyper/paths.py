@@ -0,0 +1,14 @@
+"""
+Paths Module for Pyper Music Player
+Locations of the project's config, theme and log directories, computed once at import
+"""
+
+import os
+
+# Repository root (src/pyper/paths.py -> project root)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config', 'config.json')
+THEMES_DIR = os.path.join(PROJECT_ROOT, 'themes')
+LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
+ASSETS_DIR = os.path.join(PROJECT_ROOT, 'assets')
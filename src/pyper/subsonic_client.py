@@ -3,14 +3,62 @@ Subsonic Client Module for Pyper Music Player
 Custom Subsonic API client that handles authentication correctly
 """
 
+import os
 import hashlib
-import random
-import string
+import logging
+import secrets
+import threading
+from concurrent.futures import Future
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .cache_utils import CACHE_DIR, DiskCache, TTLCache
+    from . import json_utils
+except ImportError:
+    from cache_utils import CACHE_DIR, DiskCache, TTLCache
+    import json_utils
+
+# Get logger
+logger = logging.getLogger('Pyper')
 
 # Constants (imported from main module)
 DEFAULT_SEARCH_LIMITS = {'artists': 20, 'albums': 20, 'songs': 50}
 
+# Endpoints with side effects; identical concurrent calls must not be coalesced
+NON_COALESCED_ENDPOINTS = {'scrobble'}
+
+# Lookups by id whose responses rarely change; lists ordered by plays or age, searches and
+# everything else always go to the server (cover art has its own on-disk cache)
+CACHED_ENDPOINTS = {'getAlbum', 'getArtist', 'getPlaylist'}
+
+# getAlbumList2 types that page through a fixed genre or decade rather than plays or age
+CACHED_ALBUM_LIST_TYPES = {'byGenre', 'byYear'}
+
+# In-memory response cache for the requests above, also cleared on library refresh
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_TTL = 600  # seconds
+
+# Persistent cover art cache; least recently used files are evicted once it outgrows the limit
+COVER_ART_DIR = os.path.join(CACHE_DIR, 'covers')
+COVER_ART_DIR_MAX_BYTES = 200 * 1024 * 1024
+COVER_ART_SWEEP_INTERVAL = 7 * 24 * 3600  # seconds
+COVER_ART_CACHE = DiskCache(COVER_ART_DIR, COVER_ART_DIR_MAX_BYTES, sweep_interval=COVER_ART_SWEEP_INTERVAL)
+
+# Keep-alive connection pool shared by all worker threads
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+REQUEST_TIMEOUT = 15
+
+# Retry transient server errors and rate limiting with exponential backoff
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+
+
+def is_failed_response(result):
+    """Whether a JSON response carries a Subsonic error (worth retrying, not caching)"""
+    return isinstance(result, dict) and result.get('subsonic-response', {}).get('status') == 'failed'
+
 
 class CustomSubsonicClient:
     """Custom Subsonic API client that handles authentication correctly"""
@@ -21,18 +69,86 @@ class CustomSubsonicClient:
         self.password = password
         self.app_name = "Pyper"
         self.api_version = "1.16.1"
+        
+        # Persistent session so requests reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                              max_retries=HTTP_RETRY)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # md5 state seeded with the password; tokens are finished from a copy of it
+        self._password_md5 = hashlib.md5(password.encode('utf-8'))
+        
+        # Recent responses, keyed by endpoint and params (auth params are added later and never part of the key)
+        self._response_cache = TTLCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+        
+        # Requests currently on the wire, keyed by endpoint and params
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Trim the persistent cover cache off the calling thread
+        threading.Thread(target=self.sweep_cover_art_cache, daemon=True).start()
     
     def _generate_salt(self):
         """Generate a random salt for authentication"""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=6))
+        return secrets.token_hex(3)  # 6 hex characters
+    
+    def _make_token(self, salt):
+        """Compute the md5(password + salt) authentication token"""
+        hasher = self._password_md5.copy()
+        hasher.update(salt.encode('ascii'))
+        return hasher.hexdigest()
+    
+    def clear_cache(self):
+        """Forget all cached responses, e.g. after a library refresh"""
+        self._response_cache.clear()
     
     def _make_request(self, endpoint, params=None):
-        """Make an authenticated request to the Subsonic API"""
+        """Make an authenticated request, served from the response cache or shared with an identical one in flight"""
         if params is None:
             params = {}
         
+        if endpoint in NON_COALESCED_ENDPOINTS:
+            return self._send_request(endpoint, params)
+        
+        key = (endpoint, tuple(sorted(params.items())))
+        cache = None
+        if endpoint in CACHED_ENDPOINTS or (endpoint == 'getAlbumList2'
+                                            and params.get('type') in CACHED_ALBUM_LIST_TYPES):
+            cache = self._response_cache
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        
+        # Another thread already issued this request; wait for its result
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = self._send_request(endpoint, params)
+            if cache is not None and result and not is_failed_response(result):
+                cache.set(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _send_request(self, endpoint, params):
+        """Send an authenticated request to the Subsonic API"""
         salt = self._generate_salt()
-        token = hashlib.md5((self.password + salt).encode()).hexdigest()
+        token = self._make_token(salt)
         
         base_params = {
             'u': self.username,
@@ -46,11 +162,11 @@ class CustomSubsonicClient:
         base_params.update(params)
         url = f"{self.server_url}/rest/{endpoint}"
         
-        response = requests.get(url, params=base_params)
+        response = self.session.get(url, params=base_params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         if response.headers.get('content-type', '').startswith('application/json'):
-            return response.json()
+            return json_utils.loads(response.content)
         else:
             return response.content
     
@@ -60,16 +176,16 @@ class CustomSubsonicClient:
             result = self._make_request('ping')
             return result.get('subsonic-response', {}).get('status') == 'ok'
         except Exception as e:
-            print(f"Ping error: {e}")
+            logger.error(f"Ping error: {e}")
             return False
     
     def getArtists(self):
         """Get all artists"""
         return self._make_request('getArtists')
     
-    def getAlbumList2(self):
+    def getAlbumList2(self, size=500, offset=0):
         """Get album list"""
-        return self._make_request('getAlbumList2', {'type': 'alphabeticalByName', 'size': 500})
+        return self._make_request('getAlbumList2', {'type': 'alphabeticalByName', 'size': size, 'offset': offset})
     
     def getPlaylists(self):
         """Get all playlists"""
@@ -87,12 +203,38 @@ class CustomSubsonicClient:
         """Get playlist details with songs"""
         return self._make_request('getPlaylist', {'id': playlist_id})
     
+    def cover_art_cache_key(self, cover_art_id, size=None):
+        """Key of a cover in the on-disk cover cache"""
+        return f"{cover_art_id}@{size or 'full'}"
+    
+    def cached_cover_art_path(self, cover_art_id, size=None):
+        """Path of a cover already in the on-disk cover cache, or None"""
+        return COVER_ART_CACHE.cached_path(self.cover_art_cache_key(cover_art_id, size))
+    
     def getCoverArt(self, cover_art_id, size=None):
-        """Get cover art"""
+        """Get cover art, served from the on-disk cover cache when present"""
+        cache_key = self.cover_art_cache_key(cover_art_id, size)
+        data = COVER_ART_CACHE.get(cache_key)
+        if data:
+            return data
+        
         params = {'id': cover_art_id}
         if size:
             params['size'] = size
-        return self._make_request('getCoverArt', params)
+        data = self._make_request('getCoverArt', params)
+        
+        # Errors come back as a JSON dict; only image bytes are worth keeping
+        if isinstance(data, bytes) and data:
+            COVER_ART_CACHE.set(cache_key, data)
+        return data
+    
+    def sweep_cover_art_cache(self):
+        """Evict least recently used cover art files, at most once per sweep interval"""
+        COVER_ART_CACHE.sweep()
+    
+    def clear_cover_art_cache(self):
+        """Remove all cover art files from the on-disk cover cache"""
+        COVER_ART_CACHE.clear()
     
     def scrobble(self, song_id, submission=True):
         """Scrobble a track"""
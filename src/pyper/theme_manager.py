@@ -6,24 +6,253 @@ Handles application themes and styling
 import os
 import json
 import logging
-from qt_material import apply_stylesheet
+from collections.abc import Mapping
+from functools import lru_cache
+from string import Template
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QPalette
+from qt_material import apply_stylesheet, get_theme, set_icons_theme
+
+try:
+    from . import json_utils
+    from .paths import CONFIG_PATH, THEMES_DIR
+except ImportError:
+    import json_utils
+    from paths import CONFIG_PATH, THEMES_DIR
 
 # Get logger
 logger = logging.getLogger('Pyper')
 
+# Delay before a theme change is written to config, so flicking through themes writes it once
+THEME_SAVE_DELAY_MS = 1000
+
+
+@lru_cache(maxsize=256)
+def contrasting_text_color(background_color):
+    """Get a contrasting text color (black or white) based on background color"""
+    # Remove # if present
+    bg_color = background_color.lstrip('#')
+    if len(bg_color) != 6:
+        return '#FFFFFF'  # Fallback to white for colors we can't parse
+    
+    # Convert to RGB in one parse
+    try:
+        value = int(bg_color, 16)
+    except ValueError:
+        return '#FFFFFF'
+    r = (value >> 16) & 0xFF
+    g = (value >> 8) & 0xFF
+    b = value & 0xFF
+    
+    # Relative luminance (0.299, 0.587, 0.114 weights) scaled to integers; 127500 is the 0.5 midpoint
+    # Return black text for light backgrounds, white text for dark backgrounds
+    return '#000000' if 299 * r + 587 * g + 114 * b > 127500 else '#FFFFFF'
+
+
+# Fallback colors for keys a custom theme doesn't define
+CUSTOM_THEME_DEFAULTS = {
+    'background': '#212121',
+    'text': '#FFFFFF',
+    'surface': '#424242',
+    'border': '#757575',
+    'hover': '#616161',
+    'primary': '#009688',
+    'pressed': '#757575',
+    'surface_light': '#616161',
+    'text_secondary': '#BDBDBD'
+}
+
+# Application stylesheet for custom themes; $names are theme color keys plus the derived $primary_text
+CUSTOM_THEME_CSS = Template("""
+    QMainWindow {
+        background-color: $background;
+        color: $text;
+    }
+    
+    QWidget {
+        background-color: $background;
+        color: $text;
+    }
+    
+    QPushButton {
+        background-color: $surface;
+        color: $text;
+        border: 1px solid $border;
+        border-radius: 4px;
+        padding: 5px 10px;
+        font-weight: bold;
+        min-width: 60px;
+        min-height: 30px;
+    }
+    
+    QPushButton:hover {
+        background-color: $hover;
+        border: 1px solid $primary;
+    }
+    
+    QPushButton:pressed {
+        background-color: $pressed;
+    }
+    
+    QListWidget {
+        background-color: $surface;
+        color: $text;
+        border: 1px solid $border;
+        selection-background-color: $primary;
+    }
+    
+    QListWidget::item {
+        padding: 5px;
+        border: none;
+    }
+    
+    QListWidget::item:selected {
+        background-color: $primary;
+        color: $primary_text;
+    }
+    
+    QListWidget::item:hover {
+        background-color: $hover;
+    }
+    
+    QTabWidget::pane {
+        border: 1px solid $border;
+        background-color: $surface;
+    }
+    
+    QTabBar::tab {
+        background-color: $surface_light;
+        color: $text_secondary;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: $primary;
+        color: $primary_text;
+    }
+    
+    QTabBar::tab:hover {
+        background-color: $hover;
+    }
+    
+    QLineEdit {
+        background-color: $surface;
+        color: $text;
+        border: 1px solid $border;
+        border-radius: 4px;
+        padding: 5px;
+    }
+    
+    QLineEdit:focus {
+        border: 2px solid $primary;
+    }
+    
+    QLabel {
+        color: $text;
+    }
+    
+    QProgressBar {
+        background-color: $surface;
+        border: 1px solid $border;
+        border-radius: 5px;
+        text-align: center;
+    }
+    
+    QProgressBar::chunk {
+        background-color: $primary;
+        border-radius: 4px;
+    }
+    
+    QScrollArea {
+        background-color: $surface;
+        border: 1px solid $border;
+    }
+    
+    QMenu {
+        background-color: $surface;
+        color: $text;
+        border: 1px solid $border;
+    }
+    
+    QMenu::item {
+        padding: 5px 20px;
+    }
+    
+    QMenu::item:selected {
+        background-color: $primary;
+        color: $primary_text;
+    }
+    
+    QMenuBar {
+        background-color: $surface;
+        color: $text;
+        border-bottom: 1px solid $border;
+    }
+    
+    QMenuBar::item {
+        padding: 5px 10px;
+    }
+    
+    QMenuBar::item:selected {
+        background-color: $primary;
+        color: $primary_text;
+    }
+    """)
+
+
+class ThemeCatalog(Mapping):
+    """Theme id -> theme data mapping that only parses a custom theme's JSON file when it is first accessed"""
+    
+    def __init__(self, builtin_themes, theme_files):
+        self._themes = dict(builtin_themes)
+        self._theme_files = dict(theme_files)  # Custom theme id -> JSON path, until loaded
+        # Custom themes override built-ins with the same id, keeping the built-in's position
+        self._order = list(self._themes) + [theme_id for theme_id in self._theme_files if theme_id not in self._themes]
+    
+    def __getitem__(self, theme_id):
+        if theme_id in self._theme_files:
+            self._themes[theme_id] = self._load_theme_file(theme_id, self._theme_files.pop(theme_id))
+        return self._themes[theme_id]
+    
+    def __iter__(self):
+        return iter(self._order)
+    
+    def __len__(self):
+        return len(self._order)
+    
+    def __contains__(self, theme_id):
+        return theme_id in self._themes or theme_id in self._theme_files
+    
+    def _load_theme_file(self, theme_id, path):
+        """Parse a custom theme definition"""
+        try:
+            with open(path, 'rb') as f:
+                return json_utils.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load theme {os.path.basename(path)}: {e}")
+            return {'name': theme_id}
+
 
 class ThemeManager:
     """Manages application themes and styling"""
     
     def __init__(self):
-        self.themes_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'themes')
+        self.themes_dir = THEMES_DIR
         self.current_theme = None
+        self._stylesheet_cache = {}  # theme_id -> rendered stylesheet (custom and qt-material)
+        self._palette_cache = {}  # qt-material theme_id -> palette qt-material set alongside its stylesheet
+        self._pending_theme = None  # Theme preference not yet written to config
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(THEME_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_theme_preference)
         self.available_themes = self.load_available_themes()
         
     def load_available_themes(self):
-        """Load all available theme definitions"""
-        themes = {}
-        
+        """Register all available themes; custom theme files are parsed on first use"""
         # Add qt-material themes
         qt_themes = {
             'dark_teal': {'name': 'Dark Teal (qt-material)', 'qt_theme': 'dark_teal.xml'},
@@ -33,21 +262,16 @@ class ThemeManager:
             'light_teal': {'name': 'Light Teal (qt-material)', 'qt_theme': 'light_teal.xml'},
             'light_blue': {'name': 'Light Blue (qt-material)', 'qt_theme': 'light_blue.xml'}
         }
-        themes.update(qt_themes)
         
-        # Load custom themes from JSON files
+        # Index custom theme files by id without reading them
+        theme_files = {}
         if os.path.exists(self.themes_dir):
-            for filename in os.listdir(self.themes_dir):
-                if filename.endswith('.json'):
-                    theme_id = filename[:-5]  # Remove .json extension
-                    try:
-                        with open(os.path.join(self.themes_dir, filename), 'r') as f:
-                            theme_data = json.load(f)
-                            themes[theme_id] = theme_data
-                    except Exception as e:
-                        logger.error(f"Failed to load theme {filename}: {e}")
+            with os.scandir(self.themes_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        theme_files[entry.name[:-5]] = entry.path  # Remove .json extension
         
-        return themes
+        return ThemeCatalog(qt_themes, theme_files)
     
     def get_theme_list(self):
         """Get list of theme names for menu"""
@@ -64,11 +288,11 @@ class ThemeManager:
         try:
             # Check if it's a qt-material theme
             if 'qt_theme' in theme_data:
-                apply_stylesheet(app, theme=theme_data['qt_theme'])
+                self.apply_qt_material_theme(app, theme_data, theme_id)
                 logger.info(f"Applied qt-material theme: {theme_data['name']}")
             else:
                 # Apply custom theme
-                self.apply_custom_theme(app, theme_data)
+                self.apply_custom_theme(app, theme_data, theme_id)
                 logger.info(f"Applied custom theme: {theme_data['name']}")
             
             self.current_theme = theme_id
@@ -78,169 +302,35 @@ class ThemeManager:
             logger.error(f"Failed to apply theme {theme_id}: {e}")
             return False
     
+    def apply_qt_material_theme(self, app, theme_data, theme_id):
+        """Apply a qt-material theme, reusing the stylesheet it generated the first time"""
+        stylesheet = self._stylesheet_cache.get(theme_id)
+        if stylesheet is not None:
+            # qt-material recolors its icons into one shared folder on every apply, so regenerate
+            # them for this theme and restore its palette before reusing the cached CSS
+            set_icons_theme(get_theme(theme_data['qt_theme']))
+            app.setPalette(self._palette_cache[theme_id])
+            app.setStyleSheet(stylesheet)
+            return
+        
+        # First use: let qt-material render its XML template, then keep the resulting CSS and palette
+        apply_stylesheet(app, theme=theme_data['qt_theme'])
+        self._stylesheet_cache[theme_id] = app.styleSheet()
+        self._palette_cache[theme_id] = QPalette(app.palette())
+    
     def get_contrasting_text_color(self, background_color):
         """Get a contrasting text color (black or white) based on background color"""
-        # Remove # if present
-        bg_color = background_color.lstrip('#')
-        
-        # Convert to RGB
-        try:
-            r = int(bg_color[0:2], 16)
-            g = int(bg_color[2:4], 16)
-            b = int(bg_color[4:6], 16)
-            
-            # Calculate luminance using the relative luminance formula
-            luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-            
-            # Return black text for light backgrounds, white text for dark backgrounds
-            return '#000000' if luminance > 0.5 else '#FFFFFF'
-        except:
-            # Fallback to white if color parsing fails
-            return '#FFFFFF'
+        return contrasting_text_color(background_color)
     
-    def apply_custom_theme(self, app, theme_data):
+    def apply_custom_theme(self, app, theme_data, theme_id=None):
         """Apply a custom theme with CSS styling"""
         colors = theme_data.get('colors', {})
         
-        # Create comprehensive stylesheet
-        stylesheet = f"""
-        QMainWindow {{
-            background-color: {colors.get('background', '#212121')};
-            color: {colors.get('text', '#FFFFFF')};
-        }}
-        
-        QWidget {{
-            background-color: {colors.get('background', '#212121')};
-            color: {colors.get('text', '#FFFFFF')};
-        }}
-        
-        QPushButton {{
-            background-color: {colors.get('surface', '#424242')};
-            color: {colors.get('text', '#FFFFFF')};
-            border: 1px solid {colors.get('border', '#757575')};
-            border-radius: 4px;
-            padding: 5px 10px;
-            font-weight: bold;
-            min-width: 60px;
-            min-height: 30px;
-        }}
-        
-        QPushButton:hover {{
-            background-color: {colors.get('hover', '#616161')};
-            border: 1px solid {colors.get('primary', '#009688')};
-        }}
-        
-        QPushButton:pressed {{
-            background-color: {colors.get('pressed', '#757575')};
-        }}
-        
-        QListWidget {{
-            background-color: {colors.get('surface', '#424242')};
-            color: {colors.get('text', '#FFFFFF')};
-            border: 1px solid {colors.get('border', '#757575')};
-            selection-background-color: {colors.get('primary', '#009688')};
-        }}
-        
-        QListWidget::item {{
-            padding: 5px;
-            border: none;
-        }}
-        
-        QListWidget::item:selected {{
-            background-color: {colors.get('primary', '#009688')};
-            color: {self.get_contrasting_text_color(colors.get('primary', '#009688'))};
-        }}
-        
-        QListWidget::item:hover {{
-            background-color: {colors.get('hover', '#616161')};
-        }}
-        
-        QTabWidget::pane {{
-            border: 1px solid {colors.get('border', '#757575')};
-            background-color: {colors.get('surface', '#424242')};
-        }}
-        
-        QTabBar::tab {{
-            background-color: {colors.get('surface_light', '#616161')};
-            color: {colors.get('text_secondary', '#BDBDBD')};
-            padding: 8px 16px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }}
-        
-        QTabBar::tab:selected {{
-            background-color: {colors.get('primary', '#009688')};
-            color: {self.get_contrasting_text_color(colors.get('primary', '#009688'))};
-        }}
-        
-        QTabBar::tab:hover {{
-            background-color: {colors.get('hover', '#616161')};
-        }}
-        
-        QLineEdit {{
-            background-color: {colors.get('surface', '#424242')};
-            color: {colors.get('text', '#FFFFFF')};
-            border: 1px solid {colors.get('border', '#757575')};
-            border-radius: 4px;
-            padding: 5px;
-        }}
-        
-        QLineEdit:focus {{
-            border: 2px solid {colors.get('primary', '#009688')};
-        }}
-        
-        QLabel {{
-            color: {colors.get('text', '#FFFFFF')};
-        }}
-        
-        QProgressBar {{
-            background-color: {colors.get('surface', '#424242')};
-            border: 1px solid {colors.get('border', '#757575')};
-            border-radius: 5px;
-            text-align: center;
-        }}
-        
-        QProgressBar::chunk {{
-            background-color: {colors.get('primary', '#009688')};
-            border-radius: 4px;
-        }}
-        
-        QScrollArea {{
-            background-color: {colors.get('surface', '#424242')};
-            border: 1px solid {colors.get('border', '#757575')};
-        }}
-        
-        QMenu {{
-            background-color: {colors.get('surface', '#424242')};
-            color: {colors.get('text', '#FFFFFF')};
-            border: 1px solid {colors.get('border', '#757575')};
-        }}
-        
-        QMenu::item {{
-            padding: 5px 20px;
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {colors.get('primary', '#009688')};
-            color: {self.get_contrasting_text_color(colors.get('primary', '#009688'))};
-        }}
-        
-        QMenuBar {{
-            background-color: {colors.get('surface', '#424242')};
-            color: {colors.get('text', '#FFFFFF')};
-            border-bottom: 1px solid {colors.get('border', '#757575')};
-        }}
-        
-        QMenuBar::item {{
-            padding: 5px 10px;
-        }}
-        
-        QMenuBar::item:selected {{
-            background-color: {colors.get('primary', '#009688')};
-            color: {self.get_contrasting_text_color(colors.get('primary', '#009688'))};
-        }}
-        """
+        stylesheet = self._stylesheet_cache.get(theme_id) if theme_id else None
+        if stylesheet is None:
+            stylesheet = self.build_custom_stylesheet(colors)
+            if theme_id:
+                self._stylesheet_cache[theme_id] = stylesheet
         
         # Add special styling for now playing label if the color is defined
         if 'now_playing' in colors:
@@ -251,6 +341,12 @@ class ThemeManager:
             
         app.setStyleSheet(stylesheet)
     
+    def build_custom_stylesheet(self, colors):
+        """Render the application stylesheet for a custom theme's colors"""
+        values = {**CUSTOM_THEME_DEFAULTS, **colors}
+        values['primary_text'] = self.get_contrasting_text_color(values['primary'])
+        return CUSTOM_THEME_CSS.safe_substitute(values)
+    
     def apply_element_specific_styling(self, main_window=None):
         """Apply theme-specific styling to individual elements"""
         if main_window and hasattr(main_window, 'now_playing_label'):
@@ -279,23 +375,35 @@ class ThemeManager:
                     """)
     
     def save_theme_preference(self, theme_id):
-        """Save theme preference to config"""
+        """Remember theme preference and write it to config shortly after the last change"""
+        self._pending_theme = theme_id
+        self._save_timer.start()
+    
+    def flush_theme_preference(self):
+        """Write a pending theme preference to config"""
+        self._save_timer.stop()
+        if self._pending_theme is None:
+            return
+        theme_id = self._pending_theme
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'config.json')
+            config_path = CONFIG_PATH
             
             # Read current config
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = json_utils.load(f)
             
             # Update theme
             if 'ui' not in config:
                 config['ui'] = {}
             config['ui']['theme'] = theme_id
             
-            # Write back to file
-            with open(config_path, 'w') as f:
+            # Write to a temp file and swap it in so a crash can't leave a truncated config
+            tmp_path = config_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(config, f, indent=4)
-                
+            os.replace(tmp_path, config_path)
+            
+            self._pending_theme = None
             logger.info(f"Saved theme preference: {theme_id}")
             
         except Exception as e:
@@ -4,10 +4,17 @@ Contains custom UI widgets and dialogs
 """
 
 import logging
+from functools import lru_cache
+from string import Template
 from PyQt6.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QTextEdit, QScrollArea, QGridLayout, QProgressBar)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThreadPool, QObject
+from PyQt6.QtGui import QPixmap, QPixmapCache, QFont
+
+try:
+    from .background_tasks import ImageDownloadRunnable, fit_image
+except ImportError:
+    from background_tasks import ImageDownloadRunnable, fit_image
 
 # Get logger
 logger = logging.getLogger('Pyper')
@@ -15,6 +22,81 @@ logger = logging.getLogger('Pyper')
 # Constants (these will be imported from main module)
 CONTEXTUAL_PANEL_HEIGHT = 180
 MAX_CONTEXTUAL_ALBUMS = 8
+ALBUM_TILE_WIDTH = 160  # Fixed so populating the panel doesn't re-measure every tile
+ALBUM_TILE_NAME_WIDTH = ALBUM_TILE_WIDTH - 2 * 10  # Tile width less its layout margins
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024  # Decoded cover thumbnails kept by QPixmapCache
+
+# Parsed once for the whole contextual panel instead of once per tile
+CONTEXTUAL_PANEL_QSS = """
+    ContextualInfoPanel {
+        background-color: #2b2b2b;
+        border-top: 1px solid #555;
+    }
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    QWidget#albumTile, QWidget#albumTile QLabel {
+        background-color: #333;
+        border-radius: 4px;
+        margin: 3px;
+    }
+    QWidget#albumTile QLabel#tileArtwork {
+        border: 1px solid #555;
+        background-color: #444;
+        font-size: 20px;
+    }
+    QWidget#albumTile QLabel#tileName {
+        color: white;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QWidget#categorySection, QWidget#categorySection QLabel {
+        background-color: #333;
+        border-radius: 5px;
+        margin-right: 10px;
+    }
+    QWidget#categorySection QLabel#categoryTitle {
+        font-size: 14px;
+        color: white;
+    }
+    QWidget#categorySection QLabel#categoryStats {
+        color: #ccc;
+        font-size: 12px;
+    }
+"""
+GRID_ARTWORK_SIZE = 150  # Album grid covers are requested from the server at their display size
+VISIBLE_ARTWORK_PRIORITY = 1  # QThreadPool priority for grid covers scrolled into view (others queue at 0)
+ARTWORK_SCROLL_SETTLE_MS = 100  # Wait for scrolling to pause before re-prioritizing grid covers
+
+TRACK_INFO_HTML = Template("""
+        <b>Title:</b> $title<br>
+        <b>Artist:</b> $artist<br>
+        <b>Album:</b> $album<br>
+        <b>Year:</b> $year<br>
+        <b>Genre:</b> $genre<br>
+        <b>Duration:</b> $duration
+        """)
+
+
+@lru_cache(maxsize=4096)
+def format_duration(seconds):
+    """Format duration in seconds to MM:SS"""
+    minutes = seconds // 60
+    seconds = seconds % 60
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def find_cover_pixmap(cover_art_id, size):
+    """Look up a cover already decoded at this size, or None"""
+    return QPixmapCache.find(f"{cover_art_id}@{size}")
+
+
+def cache_cover_pixmap(cover_art_id, size, image):
+    """Convert a downloaded cover to a pixmap and keep it in QPixmapCache"""
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(f"{cover_art_id}@{size}", pixmap)
+    return pixmap
 
 
 class NowPlayingDialog(QDialog):
@@ -50,28 +132,20 @@ class NowPlayingDialog(QDialog):
     def update_track_info(self, song, artwork_pixmap=None):
         """Update the dialog with current track information"""
         if artwork_pixmap:
-            self.artwork_label.setPixmap(artwork_pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self.artwork_label.setPixmap(fit_image(artwork_pixmap, 200))
             self.artwork_label.setText("")
         else:
             self.artwork_label.clear()
             self.artwork_label.setText("No Cover Art")
         
-        # Import format_duration from main window class when needed
-        try:
-            from .main import PyperMainWindow
-            duration_str = PyperMainWindow.format_duration(song.get('duration', 0))
-        except ImportError:
-            duration_str = str(song.get('duration', 0))
-        
-        info_html = f"""
-        <b>Title:</b> {song.get('title', 'Unknown')}<br>
-        <b>Artist:</b> {song.get('artist', 'Unknown')}<br>
-        <b>Album:</b> {song.get('album', 'Unknown')}<br>
-        <b>Year:</b> {song.get('year', 'Unknown')}<br>
-        <b>Genre:</b> {song.get('genre', 'Unknown')}<br>
-        <b>Duration:</b> {duration_str}
-        """
-        self.info_text.setHtml(info_html)
+        self.info_text.setHtml(TRACK_INFO_HTML.substitute(
+            title=song.get('title', 'Unknown'),
+            artist=song.get('artist', 'Unknown'),
+            album=song.get('album', 'Unknown'),
+            year=song.get('year', 'Unknown'),
+            genre=song.get('genre', 'Unknown'),
+            duration=format_duration(int(song.get('duration', 0)))
+        ))
 
 
 class MiniPlayerDialog(QDialog):
@@ -347,11 +421,10 @@ class MiniPlayerDialog(QDialog):
             
     def update_progress(self, position, duration):
         """Update progress bar"""
-        if duration > 0:
-            percentage = int((position / duration) * 100)
+        percentage = int((position / duration) * 100) if duration > 0 else 0
+        # Skip redundant updates; each setValue schedules a repaint
+        if percentage != self.progress_bar.value():
             self.progress_bar.setValue(percentage)
-        else:
-            self.progress_bar.setValue(0)
             
     def closeEvent(self, event):
         """Handle mini player close event"""
@@ -379,17 +452,111 @@ class MiniPlayerDialog(QDialog):
                 self.parent_window.show()
                 self.parent_window.raise_()
                 self.parent_window.activateWindow()
-            except:
+            except RuntimeError:
                 pass  # Ignore errors during close
         
         event.accept()
 
 
+class CoverArtLoader(QObject):
+    """Loads cover thumbnails for many labels on the shared thread pool, one download per cover and size"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = {}  # (cover_art_id, size) -> [(label, fail_text)] waiting on that download
+        self._generation = 0  # Bumped by cancel_all so results for discarded labels are ignored
+    
+    def request(self, label, sonic_client, cover_art_id, size, fail_text=None):
+        """Show a cover on a label, from QPixmapCache or once it has downloaded"""
+        key = (cover_art_id, size)
+        pixmap = find_cover_pixmap(cover_art_id, size)
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+            label.setText("")
+            return
+        if key in self._pending:
+            self._pending[key].append((label, fail_text))
+            return
+        self._pending[key] = [(label, fail_text)]
+        
+        generation = self._generation
+        runnable = ImageDownloadRunnable(sonic_client, cover_art_id, size)
+        runnable.signals.image_ready.connect(lambda _, image: self.on_image_ready(generation, key, image))
+        runnable.signals.finished.connect(lambda _: self.on_finished(generation, key))
+        QThreadPool.globalInstance().start(runnable)
+    
+    def cancel_all(self):
+        """Forget every waiting label; downloads already running finish into the cache only"""
+        self._pending.clear()
+        self._generation += 1
+    
+    def on_image_ready(self, generation, key, image):
+        """Cache a downloaded cover and show it on every label waiting for it"""
+        pixmap = cache_cover_pixmap(key[0], key[1], image)
+        if generation != self._generation:
+            return
+        for label, _ in self._pending.pop(key, []):
+            label.setPixmap(pixmap)
+            label.setText("")
+    
+    def on_finished(self, generation, key):
+        """Give up on labels whose cover could not be loaded"""
+        if generation != self._generation:
+            return
+        for label, fail_text in self._pending.pop(key, []):
+            if fail_text:
+                label.setText(fail_text)
+
+
+class AlbumTileWidget(QWidget):
+    """Compact album tile for the contextual panel, rebound to a new album instead of rebuilt"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName('albumTile')
+        # QWidget subclasses only paint their QWidget#albumTile stylesheet background with this set
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setFixedWidth(ALBUM_TILE_WIDTH)
+        self.setMinimumHeight(160)  # Match the increased contextual panel height
+        self._name_metrics = None  # Measured once the stylesheet font applies
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+        
+        # Album artwork
+        self.artwork_label = QLabel()
+        self.artwork_label.setObjectName('tileArtwork')
+        self.artwork_label.setFixedSize(100, 100)  # Much larger thumbnail
+        self.artwork_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.artwork_label)
+        
+        # Album name, elided to the tile width; the full name is in the tooltip
+        self.name_label = QLabel()
+        self.name_label.setObjectName('tileName')
+        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.name_label.setMaximumHeight(40)
+        layout.addWidget(self.name_label)
+    
+    def set_album(self, album_data):
+        """Show an album's name with the placeholder artwork"""
+        name = album_data.get('name', 'Unknown')
+        if self._name_metrics is None:
+            self.name_label.ensurePolished()
+            self._name_metrics = self.name_label.fontMetrics()
+        self.name_label.setText(self._name_metrics.elidedText(name, Qt.TextElideMode.ElideRight, ALBUM_TILE_NAME_WIDTH))
+        self.name_label.setToolTip(name)
+        self.artwork_label.clear()
+        self.artwork_label.setText("♪")
+
+
 class ContextualInfoPanel(QWidget):
     """Bottom panel showing contextual information about selected items"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.cover_loader = CoverArtLoader(self)
+        self._tile_pool = []  # AlbumTileWidgets kept across panel switches
         self.setup_ui()
         
     def setup_ui(self):
@@ -415,24 +582,19 @@ class ContextualInfoPanel(QWidget):
         self.scroll_area.setWidget(self.content_widget)
         layout.addWidget(self.scroll_area)
         
-        # Style the panel
-        self.setStyleSheet("""
-            ContextualInfoPanel {
-                background-color: #2b2b2b;
-                border-top: 1px solid #555;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
+        # Style the panel; tiles and sections are matched by object name so they need no sheet of their own
+        self.setStyleSheet(CONTEXTUAL_PANEL_QSS)
     
     def clear_content(self):
         """Clear all content from the panel"""
+        self.cover_loader.cancel_all()
         while self.content_layout.count():
             child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if isinstance(widget, AlbumTileWidget):
+                widget.hide()  # Pooled for the next panel
+            elif widget:
+                widget.deleteLater()
     
     def show_default_message(self):
         """Show default message when nothing is selected"""
@@ -476,9 +638,7 @@ class ContextualInfoPanel(QWidget):
         
         # Albums section
         if albums_data:
-            for album in albums_data[:MAX_CONTEXTUAL_ALBUMS]:  # Show max albums
-                album_widget = self.create_album_widget(album, sonic_client)
-                self.content_layout.addWidget(album_widget)
+            self.add_album_tiles(albums_data, sonic_client)
         
         self.content_layout.addStretch()
     
@@ -511,22 +671,8 @@ class ContextualInfoPanel(QWidget):
             artwork_label.setText("Loading...")
             artwork_label.setStyleSheet("border: none; background: transparent; color: #888; font-size: 12px;")
             
-            # Load artwork in thread
-            def load_artwork():
-                try:
-                    image_data = sonic_client.getCoverArt(album_data['coverArt'], size=150)
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data)
-                    
-                    # Scale maintaining aspect ratio, with padding for the container
-                    scaled_pixmap = pixmap.scaled(148, 148, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    artwork_label.setPixmap(scaled_pixmap)
-                    artwork_label.setText("")
-                except:
-                    artwork_label.setText("No Art")
-                    artwork_label.setStyleSheet("border: none; background: transparent; color: #888; font-size: 12px;")
-            
-            QTimer.singleShot(100, load_artwork)
+            # Sized with padding for the container
+            self.cover_loader.request(artwork_label, sonic_client, album_data['coverArt'], 148, fail_text="No Art")
         
         album_container_layout.addWidget(artwork_section)
         
@@ -587,55 +733,19 @@ class ContextualInfoPanel(QWidget):
         self.content_layout.addWidget(album_container)
         self.content_layout.addStretch()
     
-    def create_album_widget(self, album_data, sonic_client=None):
-        """Create a compact album widget for the contextual panel"""
-        widget = QWidget()
-        widget.setMinimumWidth(160)  # Wider to prevent text cutting
-        widget.setMinimumHeight(160)  # Match the increased contextual panel height
-        
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(8)
-        
-        # Album artwork
-        artwork_label = QLabel()
-        artwork_label.setFixedSize(100, 100)  # Much larger thumbnail
-        artwork_label.setStyleSheet("border: 1px solid #555; background-color: #444; border-radius: 4px;")
-        artwork_label.setText("♪")
-        artwork_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        artwork_label.setStyleSheet(artwork_label.styleSheet() + "; font-size: 20px;")
-
-        
-        # Load artwork if available
-        if album_data.get('coverArt') and sonic_client:
-            def load_artwork():
-                try:
-                    image_data = sonic_client.getCoverArt(album_data['coverArt'], size=100)
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data)
-                    
-                    # Scale maintaining aspect ratio, but leave some padding for border
-                    scaled_pixmap = pixmap.scaled(98, 98, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    artwork_label.setPixmap(scaled_pixmap)
-                    artwork_label.setText("")
-                except:
-                    pass
-            
-            QTimer.singleShot(100, load_artwork)
-        
-        layout.addWidget(artwork_label)
-        
-        # Album name - with proper wrapping and no truncation
-        name = album_data.get('name', 'Unknown')
-        name_label = QLabel(name)
-        name_label.setStyleSheet("color: white; font-size: 11px; font-weight: bold;")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setWordWrap(True)  # Enable word wrapping
-        name_label.setMaximumHeight(40)  # Allow for multiple lines
-        layout.addWidget(name_label)
-        
-        widget.setStyleSheet("background-color: #333; border-radius: 4px; margin: 3px;")
-        return widget
+    def add_album_tiles(self, albums_data, sonic_client=None):
+        """Show up to MAX_CONTEXTUAL_ALBUMS albums as tiles, reusing tiles from earlier panels"""
+        albums_data = albums_data[:MAX_CONTEXTUAL_ALBUMS]
+        while len(self._tile_pool) < len(albums_data):
+            self._tile_pool.append(AlbumTileWidget(self.content_widget))
+        
+        for tile, album_data in zip(self._tile_pool, albums_data):
+            tile.set_album(album_data)
+            # Load artwork if available, at the display size leaving some padding for border
+            if album_data.get('coverArt') and sonic_client:
+                self.cover_loader.request(tile.artwork_label, sonic_client, album_data['coverArt'], 98)
+            self.content_layout.addWidget(tile)
+            tile.show()
     
     def show_genre_info(self, genre_name, albums_data=None, sonic_client=None):
         """Show genre information with albums"""
@@ -643,29 +753,27 @@ class ContextualInfoPanel(QWidget):
         
         # Genre info section
         genre_section = QWidget()
+        genre_section.setObjectName('categorySection')
         genre_layout = QVBoxLayout(genre_section)
         genre_layout.setContentsMargins(5, 5, 5, 5)
         
         # Genre name
         genre_title = QLabel(f"<b>Genre: {genre_name}</b>")
-        genre_title.setStyleSheet("font-size: 14px; color: white;")
+        genre_title.setObjectName('categoryTitle')
         genre_layout.addWidget(genre_title)
         
         # Genre stats
         album_count = len(albums_data) if albums_data else 0
         stats = QLabel(f"{album_count} albums")
-        stats.setStyleSheet("color: #ccc; font-size: 12px;")
+        stats.setObjectName('categoryStats')
         genre_layout.addWidget(stats)
         
-        genre_section.setStyleSheet("background-color: #333; border-radius: 5px; margin-right: 10px;")
         genre_section.setFixedWidth(200)
         self.content_layout.addWidget(genre_section)
         
         # Albums section
         if albums_data:
-            for album in albums_data[:MAX_CONTEXTUAL_ALBUMS]:  # Show max albums
-                album_widget = self.create_album_widget(album, sonic_client)  # Pass sonic_client for artwork
-                self.content_layout.addWidget(album_widget)
+            self.add_album_tiles(albums_data, sonic_client)
         
         self.content_layout.addStretch()
     
@@ -675,29 +783,27 @@ class ContextualInfoPanel(QWidget):
         
         # Decade info section
         decade_section = QWidget()
+        decade_section.setObjectName('categorySection')
         decade_layout = QVBoxLayout(decade_section)
         decade_layout.setContentsMargins(5, 5, 5, 5)
         
         # Decade name
         decade_title = QLabel(f"<b>{decade_name}</b>")
-        decade_title.setStyleSheet("font-size: 14px; color: white;")
+        decade_title.setObjectName('categoryTitle')
         decade_layout.addWidget(decade_title)
         
         # Decade stats
         album_count = len(albums_data) if albums_data else 0
         stats = QLabel(f"{album_count} albums")
-        stats.setStyleSheet("color: #ccc; font-size: 12px;")
+        stats.setObjectName('categoryStats')
         decade_layout.addWidget(stats)
         
-        decade_section.setStyleSheet("background-color: #333; border-radius: 5px; margin-right: 10px;")
         decade_section.setFixedWidth(200)
         self.content_layout.addWidget(decade_section)
         
         # Albums section
         if albums_data:
-            for album in albums_data[:MAX_CONTEXTUAL_ALBUMS]:  # Show max albums
-                album_widget = self.create_album_widget(album, sonic_client)  # Pass sonic_client for artwork
-                self.content_layout.addWidget(album_widget)
+            self.add_album_tiles(albums_data, sonic_client)
         
         self.content_layout.addStretch()
 
@@ -713,7 +819,8 @@ class AlbumGridWidget(QWidget):
         self.selected_album = None
         self.sonic_client = None
         self.play_counts = {}
-        self.active_threads = []  # Track active download threads
+        self._artwork_labels = {}  # cover_art_id -> labels waiting on its in-flight download
+        self._artwork_runnables = {}  # cover_art_id -> download until it finishes, kept alive for re-queuing
         
         # Apply the same styling as QListWidget to match other panes
         # Colors will be set dynamically when theme is applied
@@ -726,12 +833,8 @@ class AlbumGridWidget(QWidget):
         self.cleanup_threads()
     
     def cleanup_threads(self):
-        """Stop and cleanup all active download threads"""
-        for thread in self.active_threads:
-            if thread.isRunning():
-                thread.terminate()
-                thread.wait(1000)  # Wait up to 1 second
-        self.active_threads.clear()
+        """Drop pending artwork so downloads still on the pool don't touch removed labels"""
+        self._artwork_labels.clear()
         
     def setup_ui(self):
         """Setup the grid layout"""
@@ -745,6 +848,13 @@ class AlbumGridWidget(QWidget):
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.scroll_area.setFrameStyle(0)  # Remove frame to match list widgets
+        
+        # Move covers scrolled into view ahead of the queue once scrolling settles
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(ARTWORK_SCROLL_SETTLE_MS)
+        self._scroll_timer.timeout.connect(self.prioritize_visible_artwork)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(lambda _: self._scroll_timer.start())
         # Styling will be set when theme colors are available
         
         # Create widget to hold the grid
@@ -762,6 +872,7 @@ class AlbumGridWidget(QWidget):
     def clear(self):
         """Clear all albums from the grid"""
         # Stop any active download threads first
+        self.cancel_queued_artwork()
         self.cleanup_threads()
         
         self.albums = []
@@ -773,6 +884,23 @@ class AlbumGridWidget(QWidget):
             if child.widget():
                 child.widget().deleteLater()
                 
+    def cancel_queued_artwork(self):
+        """Drop cover downloads that haven't started; running ones finish into the cache"""
+        pool = QThreadPool.globalInstance()
+        for cover_art_id, runnable in list(self._artwork_runnables.items()):
+            if pool.tryTake(runnable):
+                del self._artwork_runnables[cover_art_id]
+    
+    def prioritize_visible_artwork(self):
+        """Re-queue downloads for covers now on screen ahead of those scrolled out of view"""
+        pool = QThreadPool.globalInstance()
+        for cover_art_id, labels in self._artwork_labels.items():
+            runnable = self._artwork_runnables.get(cover_art_id)
+            if runnable is None or all(label.visibleRegion().isEmpty() for label in labels):
+                continue
+            if pool.tryTake(runnable):
+                pool.start(runnable, VISIBLE_ARTWORK_PRIORITY)
+    
     def set_sonic_client(self, sonic_client):
         """Set the sonic client for artwork loading"""
         self.sonic_client = sonic_client
@@ -884,7 +1012,7 @@ class AlbumGridWidget(QWidget):
         
         # Album artwork
         artwork_label = QLabel()
-        artwork_label.setFixedSize(150, 150)
+        artwork_label.setFixedSize(GRID_ARTWORK_SIZE, GRID_ARTWORK_SIZE)
         artwork_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         artwork_label.setStyleSheet("""
             QLabel {
@@ -948,47 +1076,40 @@ class AlbumGridWidget(QWidget):
         return widget
     
     def load_album_artwork(self, label, cover_art_id):
-        """Load album artwork asynchronously"""
+        """Load album artwork asynchronously on the shared thread pool"""
         if self.sonic_client:
-            try:
-                # Try relative import first
-                from .background_tasks import ImageDownloadThread
-                thread = ImageDownloadThread(self.sonic_client, cover_art_id)
-                thread.image_ready.connect(lambda pixmap: self.set_artwork(label, pixmap))
-                thread.finished.connect(lambda: self.thread_finished(thread))
-                self.active_threads.append(thread)
-                thread.start()
-            except ImportError:
-                try:
-                    # Fall back to absolute import
-                    from background_tasks import ImageDownloadThread
-                    thread = ImageDownloadThread(self.sonic_client, cover_art_id)
-                    thread.image_ready.connect(lambda pixmap: self.set_artwork(label, pixmap))
-                    thread.finished.connect(lambda: self.thread_finished(thread))
-                    self.active_threads.append(thread)
-                    thread.start()
-                except ImportError:
-                    # Fallback if background_tasks not available - load synchronously
-                    try:
-                        cover_art = self.sonic_client.getCoverArt(cover_art_id, size=150)
-                        if cover_art:
-                            pixmap = QPixmap()
-                            pixmap.loadFromData(cover_art)
-                            if not pixmap.isNull():
-                                scaled_pixmap = pixmap.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                                self.set_artwork(label, scaled_pixmap)
-                    except Exception as e:
-                        logger.error(f"Error loading album artwork: {e}")
+            pixmap = find_cover_pixmap(cover_art_id, GRID_ARTWORK_SIZE)
+            if pixmap is not None:
+                self.set_artwork(label, pixmap)
+                return
+            # Share a download already queued or running for the same cover
+            self._artwork_labels.setdefault(cover_art_id, []).append(label)
+            if cover_art_id in self._artwork_runnables:
+                return
+            runnable = ImageDownloadRunnable(self.sonic_client, cover_art_id, GRID_ARTWORK_SIZE)
+            runnable.setAutoDelete(False)  # Owned here so it can be taken back and re-queued at a higher priority
+            runnable.signals.image_ready.connect(self.on_artwork_ready)
+            runnable.signals.finished.connect(self.on_artwork_finished)
+            self._artwork_runnables[cover_art_id] = runnable
+            QThreadPool.globalInstance().start(runnable)
+    
+    def on_artwork_finished(self, cover_art_id):
+        """Forget labels still waiting on a download that produced no image"""
+        self._artwork_labels.pop(cover_art_id, None)
+        self._artwork_runnables.pop(cover_art_id, None)
     
-    def thread_finished(self, thread):
-        """Remove finished thread from active list"""
-        if thread in self.active_threads:
-            self.active_threads.remove(thread)
+    def on_artwork_ready(self, cover_art_id, image):
+        """Set downloaded artwork on every label waiting for it"""
+        pixmap = cache_cover_pixmap(cover_art_id, GRID_ARTWORK_SIZE, image)
+        labels = self._artwork_labels.pop(cover_art_id, None)
+        if labels:
+            for label in labels:
+                self.set_artwork(label, pixmap)
     
     def set_artwork(self, label, pixmap):
         """Set artwork on label"""
         if not pixmap.isNull():
-            label.setPixmap(pixmap.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            label.setPixmap(fit_image(pixmap, GRID_ARTWORK_SIZE))
             label.setText("")
     
     def eventFilter(self, obj, event):